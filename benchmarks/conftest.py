@@ -0,0 +1,139 @@
+"""Benchmarks for the quartodoc pipeline.
+
+These are not part of the regular test suite. Run them explicitly with pytest:
+
+    pytest benchmarks
+    pytest benchmarks --bench-sizes small,medium,large --bench-save baseline.json
+    pytest benchmarks --bench-compare baseline.json
+
+Each benchmark generates a synthetic package (see synthetic.py), and reports
+the time and peak memory of each pipeline stage (see measure.py).
+"""
+
+import json
+
+import pytest
+
+from pathlib import Path
+from tabulate import tabulate
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("quartodoc benchmarks")
+    group.addoption(
+        "--bench-sizes",
+        default="small,medium",
+        help="Comma separated synthetic package sizes to run (small, medium, large).",
+    )
+    group.addoption(
+        "--bench-rounds",
+        type=int,
+        default=3,
+        help="Number of times to run each benchmark. The fastest time is kept.",
+    )
+    group.addoption(
+        "--bench-save", default=None, help="Save results to this JSON file."
+    )
+    group.addoption(
+        "--bench-compare",
+        default=None,
+        help="Fail benchmarks that regress compared to results in this JSON file.",
+    )
+    group.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=1.5,
+        help="Allowed ratio of a result to its baseline, when comparing.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "synthetic_name(prefix): prefix of the synthetic_package name (e.g. threads).",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "bench_size" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--bench-sizes").split(",")
+        metafunc.parametrize("bench_size", [s.strip() for s in sizes])
+
+
+@pytest.fixture
+def synthetic_package(bench_size, request, tmp_path, monkeypatch):
+    """Write a synthetic package of the benchmark size, returning its name and spec.
+
+    Packages are named like synthetic_small. Use the synthetic_name marker to
+    change the prefix, so that benchmarks don't share a package name.
+    """
+
+    from synthetic import SIZES, write_package
+
+    if bench_size not in SIZES:
+        raise ValueError(f"Unknown benchmark size: {bench_size}")
+
+    marker = request.node.get_closest_marker("synthetic_name")
+    prefix = marker.args[0] if marker is not None else "synthetic"
+
+    spec = SIZES[bench_size]
+    name = f"{prefix}_{bench_size}"
+
+    write_package(tmp_path, name, spec)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    return name, spec
+
+
+_RESULTS = {}
+
+
+@pytest.fixture
+def bench_record(request):
+    """Record results for a benchmark, and check them against the baseline."""
+
+    config = request.config
+
+    def record(name: str, results: dict):
+        _RESULTS[name] = results
+
+        p_baseline = config.getoption("--bench-compare")
+        if p_baseline is None:
+            return
+
+        from measure import compare
+
+        baseline = json.loads(Path(p_baseline).read_text())
+        if name not in baseline:
+            return
+
+        msgs = compare(results, baseline[name], config.getoption("--bench-tolerance"))
+        if msgs:
+            pytest.fail(f"{name} regressed:\n" + "\n".join(msgs))
+
+    return record
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _RESULTS:
+        return
+
+    rows = [
+        (
+            name,
+            stage,
+            f"{m['seconds'] * 1e3:.1f}",
+            f"{m.get('peak_mb', 0):.1f}",
+            f"{m['speedup']:.2f}x" if "speedup" in m else "",
+        )
+        for name, stages in _RESULTS.items()
+        for stage, m in stages.items()
+    ]
+    headers = ["Benchmark", "Stage", "Time (ms)", "Peak (MB)", "Speedup"]
+    terminalreporter.write_sep("-", "quartodoc benchmarks")
+    terminalreporter.write_line(tabulate(rows, headers=headers))
+
+    p_save = config.getoption("--bench-save")
+    if p_save:
+        Path(p_save).write_text(json.dumps(_RESULTS, indent=2, sort_keys=True))
+        terminalreporter.write_line(f"\nSaved benchmark results to {p_save}")
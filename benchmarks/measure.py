@@ -0,0 +1,218 @@
+"""Time and measure the memory of each stage of the quartodoc pipeline."""
+
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from functools import partial
+
+from quartodoc import get_object, MdRenderer
+from quartodoc._griffe_compat import (
+    GriffeLoader,
+    ModulesCollection,
+    LinesCollection,
+    Parser,
+)
+from quartodoc import layout
+from quartodoc.builder import utils
+from quartodoc.builder.blueprint import BlueprintTransformer
+from quartodoc.builder.collect import collect
+from quartodoc.builder.loader import SharedLoader
+from quartodoc.layout import Layout
+from quartodoc.parsers import get_parser_defaults
+
+STAGES = ("load", "blueprint", "collect", "render")
+
+
+class _Stages:
+    """Record the wall time and peak traced memory of consecutive stages."""
+
+    def __init__(self, trace_memory: bool):
+        self.trace_memory = trace_memory
+        self.results = {}
+
+    def run(self, name, f, *args, **kwargs):
+        gc.collect()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        res = f(*args, **kwargs)
+        seconds = time.perf_counter() - start
+
+        entry = {"seconds": seconds}
+        if self.trace_memory:
+            entry["peak_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+
+        self.results[name] = entry
+        return res
+
+
+def _load(package: str, parser: str, shared: bool = False) -> GriffeLoader:
+    if shared:
+        loader = SharedLoader(parser=parser)
+    else:
+        loader = GriffeLoader(
+            docstring_parser=Parser(parser),
+            docstring_options=get_parser_defaults(parser),
+            modules_collection=ModulesCollection(),
+            lines_collection=LinesCollection(),
+        )
+
+    loader.load(package)
+    return loader
+
+
+def _render(renderer: MdRenderer, blueprint: Layout, pages) -> "list[str]":
+    out = [renderer.summarize(blueprint)]
+    out.extend(renderer.render(page) for page in pages)
+    return out
+
+
+def run_pipeline(
+    package: str,
+    layout: Layout,
+    parser: str = "numpy",
+    trace_memory: bool = False,
+    shared: bool = False,
+    stages: "tuple[str, ...]" = STAGES,
+) -> "dict[str, dict]":
+    """Run each stage of a build once, and return its measurements.
+
+    Set shared to load the package with a SharedLoader (and its memo tables),
+    rather than a plain griffe loader. Stages after the last one in stages
+    are not run.
+    """
+
+    todo = STAGES[: max(STAGES.index(stage) for stage in stages) + 1]
+
+    timer = _Stages(trace_memory)
+
+    if trace_memory:
+        tracemalloc.start()
+
+    try:
+        loader = timer.run("load", _load, package, parser, shared)
+
+        trans = BlueprintTransformer(
+            get_object=partial(get_object, loader=loader, parser=parser),
+            parser=parser,
+        )
+        if "blueprint" in todo:
+            bp = timer.run("blueprint", trans.visit, layout)
+
+        if "collect" in todo:
+            pages, _ = timer.run("collect", collect, bp, base_dir="reference")
+
+        if "render" in todo:
+            timer.run("render", _render, MdRenderer(), bp, pages)
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+
+    return {stage: timer.results[stage] for stage in stages}
+
+
+def measure(
+    package: str,
+    layout: Layout,
+    rounds: int = 3,
+    parser: str = "numpy",
+    shared: bool = False,
+    stages: "tuple[str, ...]" = STAGES,
+) -> "dict[str, dict]":
+    """Return the fastest time of each stage, and its peak memory.
+
+    Memory is measured in a separate run, since tracing allocations slows
+    everything down.
+    """
+
+    kwargs = {"shared": shared, "stages": stages}
+    runs = [run_pipeline(package, layout, parser, **kwargs) for _ in range(rounds)]
+    memory = run_pipeline(package, layout, parser, trace_memory=True, **kwargs)
+
+    return {
+        stage: {
+            "seconds": min(run[stage]["seconds"] for run in runs),
+            "peak_mb": memory[stage]["peak_mb"],
+        }
+        for stage in stages
+    }
+
+
+@contextmanager
+def validated_construction():
+    """Validate every layout element quartodoc creates, as if it came from config.
+
+    This turns off the fast construction path (layout._Base._construct), and
+    has transformers rebuild changed models with validation, giving a baseline
+    to compare optimized runs against.
+    """
+
+    def construct(cls, **values):
+        return cls(**values)
+
+    def rebuild_model(el, changed):
+        if not changed:
+            return el
+
+        return el.__class__(**{**dict(el), **changed})
+
+    orig_construct = layout._Base.__dict__["_construct"]
+    orig_rebuild_model = utils._rebuild_model
+
+    layout._Base._construct = classmethod(construct)
+    utils._rebuild_model = rebuild_model
+    try:
+        yield
+    finally:
+        layout._Base._construct = orig_construct
+        utils._rebuild_model = orig_rebuild_model
+
+
+def speedups(
+    results: "dict[str, dict]", baseline: "dict[str, dict]"
+) -> "dict[str, float]":
+    """Return how many times faster each stage of results is than the baseline."""
+
+    return {
+        stage: baseline[stage]["seconds"] / entry["seconds"]
+        for stage, entry in results.items()
+    }
+
+
+def compare(
+    results: "dict[str, dict]", baseline: "dict[str, dict]", tolerance: float = 1.5
+) -> "list[str]":
+    """Return a message for each measurement that regressed past the baseline.
+
+    Parameters
+    ----------
+    results:
+        Measurements from `measure`.
+    baseline:
+        Stored measurements, with the same structure as results.
+    tolerance:
+        Allowed ratio of a result to its baseline value. For speedups, where
+        higher is better, this is the allowed ratio of the baseline to a result.
+    """
+
+    msgs = []
+    for stage, entry in results.items():
+        for metric, value in entry.items():
+            old = baseline.get(stage, {}).get(metric)
+            if metric == "speedup":
+                if old and value < old / tolerance:
+                    msgs.append(
+                        f"{stage} {metric}: {value:.2f}x vs baseline {old:.2f}x"
+                    )
+            elif old and value > old * tolerance:
+                msgs.append(
+                    f"{stage} {metric}: {value:.3f} vs baseline {old:.3f} "
+                    f"({value / old:.2f}x)"
+                )
+
+    return msgs
@@ -0,0 +1,204 @@
+"""Generate synthetic packages for benchmarking quartodoc.
+
+Each generated package has a configurable number of modules, each with
+functions and classes that have long, documented parameter lists. Classes
+form inheritance chains that cross module boundaries, and the package's
+``__init__`` re-exports objects from every module, so that layouts exercise
+alias resolution.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from textwrap import indent
+
+from quartodoc import layout as lo
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """Size of a synthetic package.
+
+    Parameters
+    ----------
+    n_modules:
+        Number of submodules.
+    n_functions:
+        Number of functions in each module.
+    n_classes:
+        Number of classes in each module.
+    depth:
+        Number of classes in each inheritance chain. The base of each chain
+        lives in the previous module.
+    n_params:
+        Number of parameters on every function and method.
+    n_aliases:
+        Number of objects per module re-exported by the package ``__init__``.
+    """
+
+    n_modules: int = 5
+    n_functions: int = 10
+    n_classes: int = 5
+    depth: int = 3
+    n_params: int = 8
+    n_aliases: int = 2
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+SIZES = {
+    "small": SyntheticSpec(n_modules=3, n_functions=5, n_classes=2, depth=2),
+    "medium": SyntheticSpec(),
+    "large": SyntheticSpec(
+        n_modules=20, n_functions=20, n_classes=10, depth=5, n_params=15
+    ),
+}
+
+
+# source generation ----
+
+
+def _signature(n_params: int, self_arg: bool = False) -> str:
+    params = [
+        f"arg{ii}: str = 'x'" if ii % 2 else f"arg{ii}: int" for ii in range(n_params)
+    ]
+
+    # parameters after the first are keyword-only, so that required ones
+    # may follow ones with defaults
+    if len(params) > 1:
+        params.insert(1, "*")
+
+    if self_arg:
+        params.insert(0, "self")
+
+    return ", ".join(params)
+
+
+def _docstring(summary: str, n_params: int) -> str:
+    params = "\n".join(
+        f"arg{ii}:\n    Description of parameter {ii}, which is used for something."
+        for ii in range(n_params)
+    )
+
+    return f'''"""{summary}
+
+This is a longer description, with a reference to `arg0`, and some
+*emphasized* text.
+
+Parameters
+----------
+{params}
+
+Returns
+-------
+int
+    Some result.
+
+Examples
+--------
+>>> 1 + 1
+2
+"""'''
+
+
+def _function(name: str, n_params: int, method: bool = False) -> str:
+    doc = indent(_docstring(f"The {name} function.", n_params), "    ")
+    sig = _signature(n_params, self_arg=method)
+    return f"def {name}({sig}) -> int:\n{doc}\n    return 1\n"
+
+
+def _class(name: str, base: "str | None", n_params: int, level: int) -> str:
+    bases = f"({base})" if base else ""
+    doc = indent(f'"""The {name} class, level {level}."""', "    ")
+    method = indent(_function(f"method_{level}", n_params, method=True), "    ")
+    attr = f'    attr_{level}: int = {level}\n    """An attribute."""\n'
+
+    return f"class {name}{bases}:\n{doc}\n\n{attr}\n{method}"
+
+
+def module_source(spec: SyntheticSpec, mod_idx: int) -> str:
+    chunks = [f'"""Synthetic module {mod_idx}."""\n']
+
+    if mod_idx > 0:
+        prev = f"mod_{mod_idx - 1}"
+        names = ", ".join(
+            f"Class_{mod_idx - 1}_{jj}_{spec.depth - 1}" for jj in range(spec.n_classes)
+        )
+        if names:
+            chunks.append(f"from .{prev} import {names}\n")
+
+    for jj in range(spec.n_functions):
+        chunks.append(_function(f"func_{mod_idx}_{jj}", spec.n_params))
+
+    for jj in range(spec.n_classes):
+        # the base of each chain is the last class of a chain in the prior module
+        base = f"Class_{mod_idx - 1}_{jj}_{spec.depth - 1}" if mod_idx > 0 else None
+        for level in range(spec.depth):
+            name = f"Class_{mod_idx}_{jj}_{level}"
+            chunks.append(_class(name, base, spec.n_params, level))
+            base = name
+
+    return "\n\n".join(chunks)
+
+
+def alias_names(spec: SyntheticSpec, mod_idx: int) -> "list[str]":
+    funcs = [f"func_{mod_idx}_{jj}" for jj in range(spec.n_functions)]
+    classes = [f"Class_{mod_idx}_{jj}_{spec.depth - 1}" for jj in range(spec.n_classes)]
+    return (funcs + classes)[: spec.n_aliases]
+
+
+def init_source(spec: SyntheticSpec) -> str:
+    lines = ['"""A synthetic package."""\n']
+    for ii in range(spec.n_modules):
+        names = alias_names(spec, ii)
+        if names:
+            lines.append(f"from .mod_{ii} import {', '.join(names)}")
+
+    return "\n".join(lines) + "\n"
+
+
+def write_package(root: "str | Path", name: str, spec: SyntheticSpec) -> Path:
+    """Write a synthetic package to root, and return its directory."""
+
+    p_pkg = Path(root) / name
+    p_pkg.mkdir(parents=True, exist_ok=True)
+
+    (p_pkg / "__init__.py").write_text(init_source(spec))
+    for ii in range(spec.n_modules):
+        (p_pkg / f"mod_{ii}.py").write_text(module_source(spec, ii))
+
+    return p_pkg
+
+
+# layout ----
+
+
+def make_layout(name: str, spec: SyntheticSpec) -> lo.Layout:
+    """Return a layout documenting every object in a synthetic package."""
+
+    sections = []
+    for ii in range(spec.n_modules):
+        contents = [
+            lo.Auto(name=f"mod_{ii}.func_{ii}_{jj}") for jj in range(spec.n_functions)
+        ]
+        contents.extend(
+            lo.Auto(
+                name=f"mod_{ii}.Class_{ii}_{jj}_{level}",
+                include_inherited=True,
+            )
+            for jj in range(spec.n_classes)
+            for level in range(spec.depth)
+        )
+        sections.append(lo.Section(title=f"Module {ii}", contents=contents))
+
+    aliases = [
+        lo.Auto(name=alias)
+        for ii in range(spec.n_modules)
+        for alias in alias_names(spec, ii)
+    ]
+    if aliases:
+        sections.append(lo.Section(title="Top level", contents=aliases))
+
+    return lo.Layout(sections=sections, package=name)
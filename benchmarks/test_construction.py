@@ -0,0 +1,54 @@
+"""Benchmark blueprinting a layout that documents 5,000 objects.
+
+Blueprinting creates a Doc for every documented object, and transformers
+rebuild the layout around them. Rendering is not run, since it dominates the
+time of a full build at this size.
+
+Each stage is also run with every element validated (see
+measure.validated_construction), and the speedup over that baseline is
+reported alongside the results.
+"""
+
+from functools import partial
+
+from measure import measure, speedups, validated_construction
+from synthetic import SyntheticSpec, make_layout, write_package
+
+STAGES = ("load", "blueprint", "collect")
+
+# 20 modules, each with 250 documented functions
+SPEC = SyntheticSpec(
+    n_modules=20, n_functions=250, n_classes=0, depth=0, n_params=2, n_aliases=0
+)
+
+
+def test_construction(bench_record, request, tmp_path, monkeypatch):
+    name = "construction_5000"
+    write_package(tmp_path, name, SPEC)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    layout = make_layout(name, SPEC)
+    run = partial(
+        measure,
+        name,
+        layout,
+        rounds=request.config.getoption("--bench-rounds"),
+        shared=True,
+        stages=STAGES,
+    )
+
+    results = run()
+    with validated_construction():
+        baseline = run()
+
+    ratios = speedups(results, baseline)
+    for stage, ratio in ratios.items():
+        results[stage]["speedup"] = ratio
+
+    assert set(results) == set(STAGES)
+    bench_record("construction[5000]", results)
+    bench_record("construction[5000-validated]", baseline)
+
+    # elements are only created while blueprinting and collecting
+    assert ratios["blueprint"] > 1
+    assert ratios["collect"] > 1
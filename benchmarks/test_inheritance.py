@@ -0,0 +1,57 @@
+"""Benchmark documenting a deep class hierarchy, with inherited members.
+
+Each class in the hierarchy adds a method and an attribute, so a class at
+level k documents 2 * (k + 1) members, and a hierarchy of depth d documents
+d * (d + 1) in total. The time spent per documented member should stay roughly
+flat as the hierarchy gets deeper, rather than grow with its depth.
+"""
+
+import pytest
+
+from measure import measure
+from synthetic import SyntheticSpec, make_layout, write_package
+
+DEPTHS = (5, 10, 20)
+
+# allowed growth in the time per documented member, from the shallowest
+# to the deepest hierarchy
+MAX_GROWTH = 2.0
+
+
+def _spec(depth: int) -> SyntheticSpec:
+    return SyntheticSpec(
+        n_modules=1, n_functions=0, n_classes=1, depth=depth, n_params=4, n_aliases=0
+    )
+
+
+@pytest.fixture
+def hierarchy_packages(tmp_path, monkeypatch):
+    packages = {}
+    for depth in DEPTHS:
+        name = f"hierarchy_{depth}"
+        write_package(tmp_path, name, _spec(depth))
+        packages[depth] = name
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    return packages
+
+
+@pytest.mark.parametrize("shared", [False, True], ids=["griffe", "shared"])
+def test_inheritance(hierarchy_packages, bench_record, request, shared):
+    rounds = request.config.getoption("--bench-rounds")
+
+    per_member = {}
+    for depth, name in hierarchy_packages.items():
+        results = measure(
+            name, make_layout(name, _spec(depth)), rounds=rounds, shared=shared
+        )
+
+        loader = "shared" if shared else "griffe"
+        bench_record(f"inheritance[{loader}-depth{depth}]", results)
+
+        per_member[depth] = results["blueprint"]["seconds"] / (depth * (depth + 1))
+
+    if shared:
+        growth = per_member[DEPTHS[-1]] / per_member[DEPTHS[0]]
+        assert growth < MAX_GROWTH, per_member
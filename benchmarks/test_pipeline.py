@@ -0,0 +1,13 @@
+from measure import measure, STAGES
+from synthetic import make_layout
+
+
+def test_pipeline(synthetic_package, bench_record, request):
+    name, spec = synthetic_package
+
+    results = measure(
+        name, make_layout(name, spec), rounds=request.config.getoption("--bench-rounds")
+    )
+
+    assert set(results) == set(STAGES)
+    bench_record(f"pipeline[{name.split('_', 1)[1]}]", results)
@@ -0,0 +1,66 @@
+"""Benchmark blueprinting the top-level pages of a layout across threads.
+
+Threads share one loader, so the package is loaded once up front, and each
+round only measures blueprinting. Pages are fully blueprinted in each round,
+since every round uses a new transformer. Note that threads only speed up
+blueprinting on free-threaded builds of python, since most of the work holds
+the GIL.
+"""
+
+import gc
+import time
+
+import pytest
+
+from functools import partial
+
+from quartodoc import get_object
+from quartodoc.builder.blueprint import (
+    BlueprintTransformer,
+    blueprint_entries,
+    merge_layout,
+    split_layout,
+    unwrap_entry,
+)
+from quartodoc.builder.loader import SharedLoader
+from synthetic import make_layout
+
+THREADS = (1, 2, 4, 8)
+
+
+def _blueprint(loader, layout, n_threads: int):
+    trans = BlueprintTransformer(
+        get_object=partial(get_object, loader=loader), loader=loader
+    )
+
+    layouts = split_layout(layout)
+    pages = blueprint_entries(trans, layouts, n_threads)
+
+    return merge_layout(layout, {k: unwrap_entry(el) for k, el in pages.items()})
+
+
+@pytest.mark.synthetic_name("threads")
+def test_threads(synthetic_package, bench_record, request):
+    name, spec = synthetic_package
+    rounds = request.config.getoption("--bench-rounds")
+
+    layout = make_layout(name, spec)
+    loader = SharedLoader()
+    loader.load(name)
+
+    expected = repr(_blueprint(loader, layout, 1))
+
+    for n_threads in THREADS:
+        times = []
+        for _ in range(rounds):
+            gc.collect()
+            start = time.perf_counter()
+            res = _blueprint(loader, layout, n_threads)
+            times.append(time.perf_counter() - start)
+
+        assert repr(res) == expected
+
+        bench_record(
+            f"threads[{name.split('_', 1)[1]}-{n_threads}]",
+            {"blueprint": {"seconds": min(times)}},
+        )
@@ -96,12 +96,12 @@ class QuartoDocFileChangeHandler(PatternMatchingEventHandler):
 
     def callback_if_diff(self, event):
         """
-        Call the callback if the file has changed.
+        Call the callback with the changed path, if the file has changed.
         """
         new_file_info = self.get_file_info(event.src_path)
         if self.is_diff(self.old_file_info, new_file_info):
             self.print_event(event)
-            self.callback()
+            self.callback(event.src_path)
         self.old_file_info = new_file_info
 
     @classmethod
@@ -130,6 +130,30 @@ def _enable_logs():
     root.addHandler(handler)
 
 
+def _profiled(f, profile_path: "str | None"):
+    """Wrap a build function, so that it saves a timing profile each time it runs."""
+
+    if profile_path is None:
+        return f
+
+    # resolve now, since builds run from the config file's directory
+    profile_path = Path(profile_path).absolute()
+
+    def wrapper(*args, **kwargs):
+        from quartodoc.profiling import Profiler, enable_profiling
+
+        with enable_profiling(Profiler()) as profiler:
+            res = f(*args, **kwargs)
+
+        profiler.save(profile_path)
+        print(profiler.summary())
+        print(f"\nSaved profile to {profile_path}")
+
+        return res
+
+    return wrapper
+
+
 @contextlib.contextmanager
 def chdir(new_dir):
     prev = os.getcwd()
@@ -169,8 +193,20 @@ def cli():
     default=False,
     help="If set, the command will keep running and watch for changes in the package directory.",
 )
+@click.option(
+    "--jobs",
+    type=int,
+    default=None,
+    help="Number of processes used to render doc pages. Overrides the `jobs` option in the configuration file.",
+)
+@click.option(
+    "--profile",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Save a timing profile of the build to this file (in Chrome trace format), and print the slowest objects.",
+)
 @click.option("--verbose", is_flag=True, default=False, help="Enable verbose logging.")
-def build(config, filter, dry_run, watch, verbose):
+def build(config, filter, dry_run, watch, jobs, profile, verbose):
     """
     Generate API docs based on the given configuration file  (`./_quarto.yml` by default).
     """
@@ -188,7 +224,19 @@ def build(config, filter, dry_run, watch, verbose):
         sys.path.append(str(Path(config).parent.absolute()))
 
     builder = Builder.from_quarto_config(config)
-    doc_build = partial(builder.build, filter=filter)
+    if jobs is not None:
+        builder.jobs = jobs
+
+    doc_build = _profiled(partial(builder.build, filter=filter), profile)
+
+    @partial(_profiled, profile_path=profile)
+    def doc_rebuild(changed_path: str):
+        # config changes can affect any page, but source changes only
+        # affect the pages that depend on the changed file.
+        if Path(changed_path).absolute() == cfg_path:
+            builder.build(filter=filter)
+        else:
+            builder.build_incremental([changed_path], filter=filter)
 
     if dry_run:
         pass
@@ -203,7 +251,7 @@ def build(config, filter, dry_run, watch, verbose):
                 print(f"Watching {pkg_path} for changes...")
                 observer = Observer()
                 observer._event_queue.maxsize = 1  # the default is 0 which is infinite, and there isn't a way to set this in the constructor
-                event_handler = QuartoDocFileChangeHandler(callback=doc_build)
+                event_handler = QuartoDocFileChangeHandler(callback=doc_rebuild)
                 observer.schedule(event_handler, pkg_path, recursive=True)
                 observer.schedule(event_handler, cfg_path, recursive=True)
                 observer.start()
@@ -219,6 +267,50 @@ def build(config, filter, dry_run, watch, verbose):
                 doc_build()
 
 
+@click.command(name="serve-build")
+@click.argument("config", default="_quarto.yml")
+@click.option(
+    "--socket",
+    "socket_path",
+    default=".quartodoc.sock",
+    help="Path of the unix socket to listen on, relative to the config file's directory.",
+)
+@click.option(
+    "--port",
+    type=int,
+    default=None,
+    help="Listen on this port on localhost, instead of a unix socket.",
+)
+@click.option("--verbose", is_flag=True, default=False, help="Enable verbose logging.")
+def serve_build(config, socket_path, port, verbose):
+    """
+    Run a daemon that builds docs, or renders single objects, on request.
+
+    The daemon keeps the builder and loaded package in memory, so requests only
+    redo work affected by edits to source files. See quartodoc.daemon for the
+    request format.
+    """
+
+    from .daemon import BuildDaemon
+
+    cfg_path = Path(config).absolute()
+    if not cfg_path.exists():
+        raise FileNotFoundError(
+            f"Configuration file {cfg_path} not found.  Please create one."
+        )
+    if verbose:
+        _enable_logs()
+
+    sys.path.append(os.getcwd())
+    sys.path.append(str(cfg_path.parent))
+    with chdir(cfg_path.parent):
+        daemon = BuildDaemon(cfg_path)
+
+        where = f"port {port}" if port is not None else Path(socket_path).absolute()
+        print(f"Listening for build requests on {where}...")
+        daemon.serve(socket_path, port)
+
+
 @click.command(
     short_help="Generate inventory files that the Quarto "
     "`interlink` extension can use to auto-link to other docs."
@@ -275,8 +367,42 @@ def interlinks(config, dry_run, fast):
             convert_inventory(inv, p_dst.with_suffix(".json"))
 
 
+@click.command()
+@click.argument("config", default="_quarto.yml")
+@click.option(
+    "--out",
+    type=click.Path(dir_okay=False),
+    default="api-snapshot.json",
+    help="Path of the snapshot file. The default is `./api-snapshot.json`.",
+)
+@click.option("--verbose", is_flag=True, default=False, help="Enable verbose logging.")
+def snapshot(config, out, verbose):
+    """
+    Analyze the documented package, and save it to a snapshot file.
+
+    Builds can use the snapshot instead of analyzing source files, by setting
+    `source: api-snapshot.json` in the quartodoc config.
+    """
+
+    if verbose:
+        _enable_logs()
+
+    out = Path(out).absolute()
+
+    builder = Builder.from_quarto_config(config)
+    builder.source = None
+
+    sys.path.append(os.getcwd())
+    with chdir(Path(config).parent):
+        builder.write_snapshot(out)
+
+    print(f"Saved snapshot to {out}")
+
+
 cli.add_command(build)
 cli.add_command(interlinks)
+cli.add_command(serve_build)
+cli.add_command(snapshot)
 
 
 if __name__ == "__main__":
@@ -9,7 +9,9 @@ try:
     from . import expressions
 
     from griffe import Parser, parse, parse_numpy
-    from griffe import AliasResolutionError
+    from griffe import AliasResolutionError, CyclicAliasError, LoadingError
+    from griffe import Package
+    from griffe import JSONEncoder, json_decoder
 except ImportError:
     from griffe.loader import GriffeLoader
     from griffe.collections import ModulesCollection, LinesCollection
@@ -19,4 +21,6 @@ except ImportError:
     import griffe.expressions as expressions
 
     from griffe.docstrings.parsers import Parser, parse
-    from griffe.exceptions import AliasResolutionError
+    from griffe.exceptions import AliasResolutionError, CyclicAliasError, LoadingError
+    from griffe.finder import Package
+    from griffe.encoders import JSONEncoder, json_decoder
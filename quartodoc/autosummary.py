@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import inspect
+import json
 import logging
 import warnings
 import yaml
@@ -9,21 +10,27 @@ from ._griffe_compat import GriffeLoader, ModulesCollection, LinesCollection
 from ._griffe_compat import dataclasses as dc
 from ._griffe_compat import Parser, parse
 
+from dataclasses import dataclass, field
 from fnmatch import fnmatchcase
 from plum import dispatch  # noqa
 from pathlib import Path
 from types import ModuleType
 
-from .inventory import create_inventory, convert_inventory
+from .inventory import create_inventory, _to_clean_dict
 from . import layout
 from .parsers import get_parser_defaults
 from .renderers import Renderer
 from .validation import fmt_all
 from ._pydantic_compat import ValidationError
 from .pandoc.blocks import Blocks, Meta
+from .profiling import ctx_profiler, enable_profiling, profile_span, Profiler
 
 
-from typing import Any
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .builder.loader import SharedLoader
+    from .builder.manifest import Manifest
 
 
 _log = logging.getLogger(__name__)
@@ -32,9 +39,23 @@ _log = logging.getLogger(__name__)
 # Docstring loading / parsing =================================================
 
 
+def _default_loader(parser: str = "numpy", dynamic: bool = False) -> GriffeLoader:
+    from .builder.pool import loader_pool
+
+    loader = loader_pool.get(parser, dynamic=dynamic)
+    if loader is not None:
+        return loader
+
+    return GriffeLoader(
+        docstring_parser=Parser(parser),
+        docstring_options=get_parser_defaults(parser),
+        modules_collection=ModulesCollection(),
+        lines_collection=LinesCollection(),
+    )
+
+
 def parse_function(module: str, func_name: str):
-    griffe = GriffeLoader()
-    mod = griffe.load(module)
+    mod = get_object(module, loader=_default_loader("numpy"))
 
     f_data = mod.functions[func_name]
 
@@ -60,10 +81,7 @@ def get_function(module: str, func_name: str, parser: str = "numpy") -> dc.Objec
     <Function('get_function', ...
 
     """
-    griffe = GriffeLoader(
-        docstring_parser=Parser(parser), docstring_options=get_parser_defaults(parser)
-    )
-    mod = griffe.load(module)
+    mod = get_object(module, loader=_default_loader(parser))
 
     f_data = mod.functions[func_name]
 
@@ -94,6 +112,9 @@ def get_object(
     dynamic: bool
         Whether to dynamically import object. Useful if docstring is not hard-coded,
         but was set on object by running python code.
+    loader:
+        A griffe loader to fetch the object with. By default, a loader shared by
+        all calls using the same parser is used (see quartodoc.builder.pool).
 
     See Also
     --------
@@ -119,12 +140,7 @@ def get_object(
         path = f"{path}:{object_name}"
 
     if loader is None:
-        loader = GriffeLoader(
-            docstring_parser=Parser(parser),
-            docstring_options=get_parser_defaults(parser),
-            modules_collection=ModulesCollection(),
-            lines_collection=LinesCollection(),
-        )
+        loader = _default_loader(parser, dynamic=bool(dynamic))
 
     try:
         module, object_path = path.split(":", 1)
@@ -135,7 +151,8 @@ def get_object(
     # note that it is critical for performance that we only do this when necessary.
     root_mod = module.split(".", 1)[0]
     if root_mod not in loader.modules_collection:
-        loader.load(module)
+        with profile_span("griffe load", module=module):
+            loader.load(module)
 
     # griffe uses only periods for the path
     griffe_path = f"{module}.{object_path}" if object_path else module
@@ -151,6 +168,11 @@ def get_object(
     f_parent = loader.modules_collection[griffe_path.rsplit(".", 1)[0]]
     f_data = loader.modules_collection[griffe_path]
 
+    # lazy loaders only parse submodules when they're looked up, so make sure
+    # a fetched module lists its submodules as members.
+    if isinstance(f_data, dc.Module) and getattr(loader, "lazy", False):
+        loader.load_submodules(f_data)
+
     # ensure that function methods fetched off of an Alias of a class, have that
     # class Alias as their parent, not the Class itself.
     if isinstance(f_parent, dc.Alias) and isinstance(
@@ -162,27 +184,33 @@ def get_object(
     # in this case, we need to import the target's module in order to resolve
     # the alias
     if isinstance(f_data, dc.Alias) and load_aliases:
-        target_mod = f_data.target_path.split(".")[0]
-        if target_mod != module:
-            loader.load(target_mod)
+        _load_alias_target(loader, f_data.target_path)
 
     return f_data
 
 
-def _resolve_target(obj: dc.Alias):
-    target = obj.target
-
-    count = 0
-    while isinstance(target, dc.Alias):
-        count += 1
-        if count > 100:
-            raise ValueError(
-                "Attempted to resolve target, but may be infinitely recursing?"
-            )
+def _load_alias_target(loader: GriffeLoader, target_path: str) -> bool:
+    """Load the package an alias target lives in, returning whether it's loaded."""
+
+    from .builder.loader import SharedLoader
+
+    if isinstance(loader, SharedLoader):
+        # shared loaders only attempt each package once, and may be configured
+        # to skip some external packages, or only load the module needed.
+        return loader.load_external(target_path)
+
+    target_mod = target_path.split(".")[0]
+    if target_mod not in loader.modules_collection:
+        with profile_span("griffe load", module=target_mod):
+            loader.load(target_mod)
+
+    return True
+
 
-        target = target.target
+def _resolve_target(obj: dc.Alias):
+    from .builder.aliases import final_target
 
-    return target
+    return final_target(obj)
 
 
 def replace_docstring(obj: dc.Object | dc.Alias, f=None):
@@ -197,19 +225,38 @@ def replace_docstring(obj: dc.Object | dc.Alias, f=None):
         specified, then attempt to import obj and use its docstring.
 
     """
+
+    from .builder.dynamic import MISSING
+
+    _replace_docstring(obj, MISSING if f is None else f.__doc__)
+
+
+def _replace_docstring(obj: dc.Object | dc.Alias, doc):
     import importlib
 
+    from .builder.dynamic import MISSING, dynamic_docs
+
     if isinstance(obj, dc.Alias):
         obj = _resolve_target(obj)
 
+    # objects from a shared loader look up docstrings collected a module at a time
+    docs = dynamic_docs(obj)
+
     # for classes, we dynamically load the docstrings for all their methods.
     # since griffe reads class docstrings from the .__init__ method, this should
     # also have the effect of updating the class docstring.
-    if isinstance(obj, dc.Class):
+    if isinstance(obj, dc.Class) and (docs is None or docs.mark_members(obj)):
         for child_obj in obj.members.values():
-            replace_docstring(child_obj)
+            _replace_docstring(child_obj, MISSING)
+
+    if doc is MISSING and docs is not None:
+        doc = docs.get_doc(obj)
+
+        # the attribute might be only a type annotation, so has no value
+        if doc is MISSING:
+            return
 
-    if f is None:
+    elif doc is MISSING:
         mod = importlib.import_module(obj.module.canonical_path)
 
         if isinstance(obj.parent, dc.Class):
@@ -224,15 +271,21 @@ def replace_docstring(obj: dc.Object | dc.Alias, f=None):
         else:
             f = getattr(mod, obj.name)
 
+        doc = f.__doc__
+
+    _set_docstring(obj, doc)
+
+
+def _set_docstring(obj: dc.Object, doc: "str | None"):
     # if no docstring on the dynamically loaded function, then stop
     # since there's nothing to update.
     # TODO: A static docstring could have been detected erroneously
-    if f.__doc__ is None:
+    if doc is None:
         return
 
     old = obj.docstring
     new = dc.Docstring(
-        value=f.__doc__,
+        value=doc,
         lineno=getattr(old, "lineno", None),
         endlineno=getattr(old, "endlineno", None),
         parent=getattr(old, "parent", None),
@@ -240,6 +293,10 @@ def replace_docstring(obj: dc.Object | dc.Alias, f=None):
         parser_options=getattr(old, "parser_options", None),
     )
 
+    # keep the existing docstring when nothing changed, so it isn't parsed again
+    if old is not None and old.value == new.value:
+        return
+
     obj.docstring = new
 
 
@@ -259,8 +316,22 @@ def dynamic_alias(
         using the __module__ attribute of the imported object.
 
     """
-    import importlib
 
+    # shared loaders memoize results, since each member of a dynamically
+    # loaded class looks up the class again as its parent.
+    docs = getattr(getattr(loader, "modules_collection", None), "dynamic_docs", None)
+    if docs is None:
+        return _dynamic_alias(path, target, loader)
+
+    res = docs.get_alias(path, target)
+    if res is None:
+        res = _dynamic_alias(path, target, loader)
+        docs.set_alias(path, target, res)
+
+    return res
+
+
+def _dynamic_alias(path: str, target: "str | None", loader) -> dc.Object | dc.Alias:
     # TODO: raise an informative error if no period
     try:
         mod_name, object_path = path.split(":", 1)
@@ -268,72 +339,22 @@ def dynamic_alias(
         mod_name, object_path = path, None
 
     # get underlying object dynamically ----
+    # shared loaders may do this in a worker process, which sends back only
+    # the canonical path and docstring.
 
-    mod = importlib.import_module(mod_name)
-
-    # Case 1: path is just to a module
-    if object_path is None:
-        attr = mod
-        canonical_path = mod.__name__
-
-    # Case 2: path is to a member of a module
-    else:
-        splits = object_path.split(".")
-
-        canonical_path = None
-        crnt_part = mod
-        for ii, attr_name in enumerate(splits):
-            # update canonical_path ----
-            # this is our belief about where the final object lives (ie. its submodule)
-            try:
-                _qualname = ".".join(splits[ii:])
-                new_canonical_path = _canonical_path(crnt_part, _qualname)
-            except AttributeError:
-                new_canonical_path = None
-
-            if new_canonical_path is not None:
-                # Note that previously we kept the first valid canonical path,
-                # but now keep the last.
-                canonical_path = new_canonical_path
-
-            # fetch attribute ----
-            try:
-                crnt_part = getattr(crnt_part, attr_name)
-            except AttributeError:
-                # Fetching the attribute can fail if it is purely a type hint,
-                # and has no value. This can be an issue if you have added a
-                # docstring below the annotation
-                if canonical_path:
-                    # See if we can return the static object for a value-less attr
-                    try:
-                        obj = get_object(canonical_path, loader=loader)
-                        if _is_valueless(obj):
-                            return obj
-                    except Exception as e:
-                        # TODO: should we fail silently, so the error below triggers?
-                        raise e
-
-                raise AttributeError(
-                    f"No attribute named `{attr_name}` in the path `{path}`."
-                )
-
-        # final canonical_path update ----
-        # TODO: this is largely identical to canonical_path update above
-        try:
-            _qualname = ""
-            new_canonical_path = _canonical_path(crnt_part, _qualname)
-        except AttributeError:
-            new_canonical_path = None
-
-        if new_canonical_path is not None:
-            # Note that previously we kept the first valid canonical path,
-            # but now keep the last.
-            canonical_path = new_canonical_path
+    docs = getattr(loader.modules_collection, "dynamic_docs", None)
+    lookup = _dynamic_lookup if docs is None else docs.lookup
 
-        if canonical_path is None:
-            raise ValueError(f"Cannot find canonical path for `{path}`")
+    try:
+        canonical_path, doc = lookup(path)
+    except _MissingAttributeError as e:
+        # See if we can return the static object for a value-less attr
+        if e.canonical_path:
+            obj = get_object(e.canonical_path, loader=loader)
+            if _is_valueless(obj):
+                return obj
 
-        attr = crnt_part
+        raise AttributeError(str(e)) from None
 
     # start loading object with griffe ----
 
@@ -343,25 +364,105 @@ def dynamic_alias(
         obj = get_object(canonical_path, loader=loader)
 
     # use dynamically imported object's docstring
-    replace_docstring(obj, attr)
+    _replace_docstring(obj, doc)
 
     if obj.canonical_path == path.replace(":", "."):
         return obj
     else:
         # TODO: this logic should live in a MemberPath dataclass or something
         if object_path:
+            attr_name = object_path.rsplit(".", 1)[-1]
             if "." in object_path:
                 prev_member = object_path.rsplit(".", 1)[0]
                 parent_path = f"{mod_name}:{prev_member}"
             else:
                 parent_path = mod_name
         else:
+            attr_name = mod_name.rsplit(".", 1)[-1]
             parent_path = mod_name.rsplit(".", 1)[0]
 
         parent = get_object(parent_path, loader=loader, dynamic=True)
         return dc.Alias(attr_name, obj, parent=parent)
 
 
+class _MissingAttributeError(AttributeError):
+    """Raised when an attribute in a dynamic path has no value.
+
+    This can happen if it is purely a type hint, in which case the static
+    object at canonical_path may be used instead.
+    """
+
+    def __init__(self, msg: str, canonical_path: "str | None" = None):
+        super().__init__(msg)
+        self.canonical_path = canonical_path
+
+
+def _dynamic_lookup(path: str) -> "tuple[str, str | None]":
+    """Import the object at path, returning its canonical path and docstring."""
+
+    import importlib
+
+    try:
+        mod_name, object_path = path.split(":", 1)
+    except ValueError:
+        mod_name, object_path = path, None
+
+    mod = importlib.import_module(mod_name)
+
+    # Case 1: path is just to a module
+    if object_path is None:
+        return mod.__name__, mod.__doc__
+
+    # Case 2: path is to a member of a module
+    splits = object_path.split(".")
+
+    canonical_path = None
+    crnt_part = mod
+    for ii, attr_name in enumerate(splits):
+        # update canonical_path ----
+        # this is our belief about where the final object lives (ie. its submodule)
+        try:
+            _qualname = ".".join(splits[ii:])
+            new_canonical_path = _canonical_path(crnt_part, _qualname)
+        except AttributeError:
+            new_canonical_path = None
+
+        if new_canonical_path is not None:
+            # Note that previously we kept the first valid canonical path,
+            # but now keep the last.
+            canonical_path = new_canonical_path
+
+        # fetch attribute ----
+        try:
+            crnt_part = getattr(crnt_part, attr_name)
+        except AttributeError:
+            # Fetching the attribute can fail if it is purely a type hint,
+            # and has no value. This can be an issue if you have added a
+            # docstring below the annotation
+            raise _MissingAttributeError(
+                f"No attribute named `{attr_name}` in the path `{path}`.",
+                canonical_path,
+            ) from None
+
+    # final canonical_path update ----
+    # TODO: this is largely identical to canonical_path update above
+    try:
+        _qualname = ""
+        new_canonical_path = _canonical_path(crnt_part, _qualname)
+    except AttributeError:
+        new_canonical_path = None
+
+    if new_canonical_path is not None:
+        # Note that previously we kept the first valid canonical path,
+        # but now keep the last.
+        canonical_path = new_canonical_path
+
+    if canonical_path is None:
+        raise ValueError(f"Cannot find canonical path for `{path}`")
+
+    return canonical_path, crnt_part.__doc__
+
+
 def _canonical_path(crnt_part: object, qualname: str):
     suffix = (":" + qualname) if qualname else ""
     if not isinstance(crnt_part, ModuleType):
@@ -430,9 +531,57 @@ def _insert_contents(
     return False
 
 
+# Parallel rendering ==========================================================
+
+# renderer, pages, and profiler start time for the current worker process.
+# These are set once when a worker starts, so each task only needs to send the
+# index of a page.
+_RENDER_STATE: "tuple[Renderer, list[layout.Page], float | None] | None" = None
+
+
+def _render_mp_context():
+    import multiprocessing
+    import sys
+
+    # forking lets workers inherit the blueprinted pages without pickling them,
+    # but is unsafe on macOS, where spawn is the default.
+    if "fork" in multiprocessing.get_all_start_methods() and sys.platform != "darwin":
+        return multiprocessing.get_context("fork")
+
+    return multiprocessing.get_context()
+
+
+def _init_render_worker(renderer: Renderer, pages: "list[layout.Page]", t0=None):
+    global _RENDER_STATE
+
+    _RENDER_STATE = (renderer, pages, t0)
+
+
+def _render_page_at(ii: int) -> "tuple[str, list[dict]]":
+    renderer, pages, t0 = _RENDER_STATE
+
+    if t0 is None:
+        return renderer.render(pages[ii]), []
+
+    with enable_profiling(Profiler(t0)) as profiler:
+        rendered = renderer.render(pages[ii])
+
+    return rendered, profiler.events
+
+
 # pkgdown =====================================================================
 
 
+@dataclass
+class _BuildEntry:
+    """Results of building a single top-level page of a layout."""
+
+    page: layout.Page
+    pages: "list[layout.Page]"
+    items: "list[layout.Item]"
+    files: "set[str]" = field(default_factory=set)
+
+
 # TODO: styles -- pkgdown, single-page, many-pages
 class Builder:
     """Base class for building API docs.
@@ -485,6 +634,52 @@ class Builder:
         completely overrides the `title` configuration. Set to an empty dict
         to generate an empty frontmatter block. Default is None, which falls
         back to using the `title` parameter.
+    cache_dir:
+        A directory for caching blueprinted docs between builds (e.g.
+        ".quartodoc_cache"). Objects whose source files are unchanged are not
+        re-analyzed, and unchanged docstrings are not re-parsed. The directory
+        also holds the manifest of files written by each build, which filtered
+        builds use to fill in pages they skip. By default, no cache is used.
+    jobs:
+        Number of processes used to render doc pages. Defaults to 1, which
+        renders all pages in the current process.
+    stream:
+        Whether to blueprint, render, and write each top-level page before
+        moving on to the next one. This keeps memory use low for large APIs,
+        since only a small record of each written page is kept. Pages are
+        rendered in the current process, regardless of jobs.
+    lazy_load:
+        Whether to only analyze the modules of a package that documented objects
+        need (e.g. the modules they are defined in, or imported from). By
+        default, every module of a package is analyzed when it is first used.
+    external_include:
+        Names of the only external packages that may be analyzed, in order to
+        document objects imported from them (e.g. ["numpy"]). By default, any
+        installed package may be analyzed.
+    external_exclude:
+        Names of external packages that are never analyzed. Members imported
+        from them are skipped.
+    external_submodules:
+        Whether to only analyze the module of an external package that an
+        imported object is defined in, rather than the whole package.
+    source:
+        Path to an API snapshot file (e.g. "api-snapshot.json"), created by
+        `quartodoc snapshot`. Packages saved in it are used as is, instead of
+        analyzing their source files.
+    import_workers:
+        Number of worker processes used to import packages for dynamic lookups.
+        Each top-level package is imported by one worker, which is restarted
+        when its source files change. By default, packages are imported into
+        the current process.
+    parse_workers:
+        Number of worker processes used to parse the docstrings of documented
+        objects, before blueprinting them. By default, docstrings are parsed in
+        the current process, as each object is blueprinted.
+    blueprint_threads:
+        Number of threads used to blueprint the top-level pages of the layout.
+        Threads share the loader, and take turns fetching objects from it. This
+        is ignored by streaming and filtered builds. Defaults to 1, which
+        blueprints pages one at a time.
 
     """
 
@@ -495,6 +690,8 @@ class Builder:
     # misc config
     out_inventory: str = "objects.json"
     out_index: str = "index.qmd"
+    out_manifest: "str | None" = None
+    out_snapshot: str = "api-snapshot.json"
     out_page_suffix = ".qmd"
 
     # quarto yaml config -----
@@ -536,6 +733,17 @@ class Builder:
         parser="numpy",
         render_interlinks: bool = False,
         index_topmatter: "dict[str, Any] | None" = None,
+        cache_dir: "str | None" = None,
+        jobs: int = 1,
+        stream: bool = False,
+        lazy_load: bool = False,
+        external_include: "list[str] | None" = None,
+        external_exclude: "list[str] | None" = None,
+        external_submodules: bool = False,
+        source: "str | None" = None,
+        import_workers: int = 0,
+        parse_workers: int = 0,
+        blueprint_threads: int = 1,
         _fast_inventory=False,
     ):
         self.layout = self.load_layout(
@@ -570,9 +778,29 @@ class Builder:
         self.rewrite_all_pages = rewrite_all_pages
         self.source_dir = str(Path(source_dir).absolute()) if source_dir else None
         self.dynamic = dynamic
+        self.cache_dir = cache_dir
+        self.jobs = jobs
+        self.stream = stream
+        self.lazy_load = lazy_load
+        self.external_include = external_include
+        self.external_exclude = external_exclude
+        self.external_submodules = external_submodules
+        self.source = source
+        self.import_workers = import_workers
+        self.parse_workers = parse_workers
+        self.blueprint_threads = blueprint_threads
 
         self._fast_inventory = _fast_inventory
 
+        self._manifest: "Manifest | None" = None
+        self._loader: "SharedLoader | None" = None
+
+        # whether modules were reloaded since the snapshot was last saved
+        self._snapshot_stale = False
+
+        # results of the last build for each top-level page, used for rebuilds
+        self._entries: "dict[tuple[int, int | None], _BuildEntry] | None" = None
+
     def load_layout(self, sections: dict, package: str, options=None):
         # TODO: currently returning the list of sections, to make work with
         # previous code. We should make Layout a first-class citizen of the
@@ -596,50 +824,336 @@ class Builder:
             Path is the file's base name in the API dir (e.g. MdRenderer.render)
         """
 
-        from quartodoc import blueprint, collect
-
         if self.source_dir:
             import sys
 
             sys.path.append(self.source_dir)
 
-        # shaping and collection ----
+        self._manifest = self._load_manifest()
+        self._refresh_loader()
+        n_modules = self.loader.n_modules
+
+        # import workers start on documented packages in parallel, while
+        # the build process analyzes them.
+        workers = self.loader.dynamic_docs.workers
+        if workers is not None:
+            workers.warm(self._layout_packages())
+
+        if self.parse_workers:
+            self._prefetch_docstrings()
+
+        cache = self._load_cache()
+        trans = self._create_transformer(cache)
+
+        if filter != "*" and self._entry_layouts():
+            blueprint = self._build_filtered(trans, filter)
+        elif self.stream and self._entry_layouts():
+            blueprint = self._stream_entries(trans, filter)
+        else:
+            blueprint = self._build_entries(trans, filter)
+
+        if cache is not None:
+            cache.save()
+
+        aliases = self.loader.aliases
+        _log.info(f"Analyzed {self.loader.n_modules - n_modules} modules.")
+        _log.info(
+            f"Blueprinted {trans.docs.misses} objects"
+            f" ({trans.docs.hits} reused from earlier in the build)."
+        )
+        _log.info(
+            f"Resolved aliases: {aliases.hits} from the alias table,"
+            f" {aliases.misses} by walking alias chains."
+        )
+        dynamic_docs = self.loader.dynamic_docs
+        if dynamic_docs.n_modules:
+            _log.info(
+                f"Collected dynamic docstrings from {dynamic_docs.n_modules} modules"
+                f" ({dynamic_docs.hits} memoized lookups)."
+            )
+        if self.loader.n_modules > n_modules or self._snapshot_stale:
+            self._save_snapshot()
+
+        self._write_remaining(blueprint)
+        self._save_manifest(full=filter == "*")
+
+        if self.cache_dir is not None:
+            self.loader.parsed_docs.save(self.cache_dir)
+
+    def build_incremental(self, changed: "list[str]", filter: str = "*"):
+        """Rebuild only the doc pages that depend on changed source files.
+
+        This uses the source files recorded for each top-level page during the
+        last call to build. Affected pages are re-blueprinted and re-rendered,
+        while the index, inventory, and sidebar are regenerated from the
+        combination of new and previously built pages. If no previous build is
+        available, this runs a full build.
+
+        Parameters
+        ----------
+        changed:
+            Paths to source files that have changed.
+        filter:
+            A simple pattern for which doc pages to write. See build.
+        """
+
+        if self._entries is None:
+            return self.build(filter)
+
+        changed_files = {str(Path(fname).resolve()) for fname in changed}
+        keys = [k for k, entry in self._entries.items() if entry.files & changed_files]
+
+        if not keys:
+            _log.info("No doc pages depend on the changed files.")
+            return
+
+        _log.info(f"Rebuilding {len(keys)} top-level pages.")
+        self._manifest = self._load_manifest()
+
+        # only changed modules get re-parsed by the shared loader
+        self._refresh_loader(changed)
+        n_modules = self.loader.n_modules
+
+        trans = self._create_transformer()
+        if self.stream:
+            blueprint = self._stream_entries(trans, filter, keys)
+        else:
+            blueprint = self._build_entries(trans, filter, keys)
+
+        if self.loader.n_modules > n_modules or self._snapshot_stale:
+            self._save_snapshot()
+
+        self._write_remaining(blueprint)
+        self._save_manifest(full=False)
+
+    def _build_entries(self, trans, filter: str, keys=None) -> layout.Layout:
+        """Blueprint all entries, then collect, and write their pages.
+
+        If keys is specified, only pages for those entries are written.
+        """
 
         _log.info("Generating blueprint.")
-        blueprint = blueprint(self.layout, dynamic=self.dynamic, parser=self.parser)
+        with profile_span("blueprint"):
+            blueprint = self._blueprint_entries(trans, keys)
 
         _log.info("Collecting pages and inventory items.")
-        pages, self.items = collect(blueprint, base_dir=self.dir)
+        with profile_span("collect"):
+            pages, self.items = self._collect_entries(blueprint)
+
+        if keys is not None:
+            pages = [page for k in keys for page in self._entries[k].pages]
+
+        _log.info("Writing docs pages")
+        with profile_span("write_doc_pages"):
+            self.write_doc_pages(pages, filter)
+
+        return blueprint
+
+    def _build_filtered(self, trans, filter: str) -> layout.Layout:
+        """Build only the entries that may create pages matching filter.
+
+        Other entries are taken from records saved by previous builds, so the
+        index, inventory, and sidebar stay complete. Entries without a valid
+        record (e.g. because their source files changed) are built as well.
+        """
+
+        from quartodoc.builder.blueprint import entry_may_match
+
+        layouts = self._entry_layouts()
+
+        self._entries = {}
+        keys = []
+        for key, el in layouts.items():
+            if entry_may_match(el, filter):
+                keys.append(key)
+                continue
+
+            record = self._load_entry(key, el)
+            if record is None:
+                keys.append(key)
+            else:
+                self._entries[key] = record
+
+        _log.info(
+            f"Building {len(keys)} of {len(layouts)} top-level pages for filter: {filter}"
+        )
+        return self._stream_entries(trans, filter, keys)
+
+    def _stream_entries(self, trans, filter: str, keys=None) -> layout.Layout:
+        """Blueprint, collect, and write the pages of each entry, one at a time.
+
+        Once an entry's pages are written, only a lightweight record of it is
+        kept: its index summary, inventory records, and source files. The
+        transformer's memo of blueprinted docs is cleared as well, so peak
+        memory does not grow with the number of entries.
+        """
+
+        from quartodoc import collect
+        from quartodoc.builder.blueprint import unwrap_entry, merge_layout
+        from quartodoc.builder.cache import doc_dependencies
+        from quartodoc.inventory import _create_inventory_item
+        from quartodoc.renderers.base import RenderedPage
+
+        layouts = self._entry_layouts()
+
+        if keys is None:
+            self._entries = {}
+            keys = list(layouts)
+
+        if self.jobs > 1:
+            _log.info("Rendering pages serially, since streaming builds ignore jobs.")
+
+        _log.info(f"Streaming {len(keys)} top-level pages.")
+        for key in keys:
+            with profile_span("blueprint"):
+                entry = unwrap_entry(trans.visit(layouts[key]))
+
+            with profile_span("collect"):
+                pages, items = collect(entry, base_dir=self.dir)
+
+            with profile_span("write_doc_pages"):
+                self.write_doc_pages(pages, filter)
+
+            summary = self._summarize_entry(entry)
+            self._entries[key] = _BuildEntry(
+                page=RenderedPage(getattr(entry, "path", None), summary),
+                pages=[],
+                items=[_create_inventory_item(item) for item in items],
+                files=doc_dependencies(entry),
+            )
+            self._save_entry(key, layouts[key], self._entries[key], summary)
 
-        # writing pages ----
+            # docs are only reused within an entry, since the memo holds onto them
+            trans.docs.clear()
+
+        # keep entries in layout order, since some may come from saved records
+        self._entries = {k: self._entries[k] for k in layouts if k in self._entries}
+        self.items = [item for entry in self._entries.values() for item in entry.items]
+
+        return merge_layout(
+            self.layout, {k: entry.page for k, entry in self._entries.items()}
+        )
+
+    def _summarize_entry(self, entry):
+        """Return the index summary of a top-level entry."""
+
+        return self.renderer.summarize(entry)
+
+    # entry records ----
+
+    def _entry_spec(self, el: layout.Layout) -> str:
+        """Return a hash of everything that configures building an entry."""
+
+        from hashlib import sha256
+        from quartodoc.builder.blueprint import _to_simple_dict
+        from quartodoc.builder.cache import _package_versions
+
+        renderer = self.renderer
+        renderer_options = {k: v for k, v in vars(renderer).items() if not callable(v)}
+        spec = {
+            "layout": _to_simple_dict(el),
+            "renderer": [type(renderer).__module__, type(renderer).__qualname__],
+            "renderer_options": renderer_options,
+            "parser": self.parser,
+            "dynamic": self.dynamic,
+            "dir": self.dir,
+            "versions": _package_versions(),
+        }
+
+        raw = json.dumps(spec, sort_keys=True, default=str)
+        return sha256(raw.encode()).hexdigest()
+
+    @staticmethod
+    def _entry_key(key: "tuple[int, int | None]") -> str:
+        return "/".join(map(str, key))
+
+    def _save_entry(self, key, el: layout.Layout, entry: _BuildEntry, summary):
+        """Save a record of a built entry in the manifest, for later filtered builds."""
+
+        from quartodoc.inventory import _create_inventory_item
+        from quartodoc.renderers.md_renderer import SummaryRow
+
+        manifest = self.manifest
+        if manifest.path is None:
+            # records are only used by later builds, via the saved manifest
+            return
+
+        if isinstance(summary, SummaryRow):
+            summary = {"link": summary.link, "description": summary.description}
+        elif summary is not None and not isinstance(summary, str):
+            _log.info(f"Not saving record for entry {key}, with summary: {summary}")
+            return
+
+        files = {}
+        for fname in entry.files:
+            source_key = manifest.source_key(fname)
+            files[source_key] = manifest.source_hash(source_key)
+
+        record = {
+            "spec": self._entry_spec(el),
+            "path": getattr(entry.page, "path", None),
+            "summary": summary,
+            "items": [_create_inventory_item(x).json_dict() for x in entry.items],
+            "files": dict(sorted(files.items())),
+        }
+
+        manifest.set_entry(self._entry_key(key), record)
+
+    def _load_entry(self, key, el: layout.Layout) -> "_BuildEntry | None":
+        """Return a built entry from its saved record, if the record is still valid."""
+
+        import sphobjinv as soi
+        from quartodoc.renderers.base import RenderedPage
+        from quartodoc.renderers.md_renderer import SummaryRow
+
+        record = self.manifest.get_entry(self._entry_key(key))
+        if record is None or record["spec"] != self._entry_spec(el):
+            return None
+
+        for fname, old_hash in record["files"].items():
+            if old_hash is None or self.manifest.source_hash(fname) != old_hash:
+                return None
+
+        summary = record["summary"]
+        if isinstance(summary, dict):
+            summary = SummaryRow(**summary)
+
+        return _BuildEntry(
+            page=RenderedPage(record["path"], summary),
+            pages=[],
+            items=[soi.DataObjStr(**item) for item in record["items"]],
+            files={self.manifest.source_file(key) for key in record["files"]},
+        )
+
+    def _write_remaining(self, blueprint: layout.Layout):
+        # index ----
 
         _log.info("Writing index")
-        self.write_index(blueprint)
+        with profile_span("write_index"):
+            self.write_index(blueprint)
 
-        _log.info("Writing docs pages")
-        self.write_doc_pages(pages, filter)
         self.renderer._pages_written(self)
 
         # inventory ----
 
         _log.info("Creating inventory file")
-        inv = self.create_inventory(self.items)
-        if self._fast_inventory:
-            # dump the inventory file directly as text
-            # TODO: copied from __main__.py, should add to inventory.py
-            import sphobjinv as soi
-
-            df = inv.data_file()
-            soi.writebytes(Path(self.out_inventory).with_suffix(".txt"), df)
+        with profile_span("inventory"):
+            inv = self.create_inventory(self.items)
+            if self._fast_inventory:
+                # dump the inventory file directly as text
+                self.manifest.write(
+                    Path(self.out_inventory).with_suffix(".txt"), inv.data_file()
+                )
 
-        else:
-            convert_inventory(inv, self.out_inventory)
+            else:
+                self.manifest.write(self.out_inventory, json.dumps(_to_clean_dict(inv)))
 
         # sidebar ----
 
         if self.sidebar:
             _log.info(f"Writing sidebar yaml to {self.sidebar['file']}")
-            self.write_sidebar(blueprint)
+            with profile_span("sidebar"):
+                self.write_sidebar(blueprint)
 
         # css ----
 
@@ -647,6 +1161,219 @@ class Builder:
             _log.info(f"Writing css styles to {self.css}")
             self.write_css()
 
+    # blueprinting entries ----
+
+    @property
+    def loader(self) -> "SharedLoader":
+        """The griffe loader used by every build, so packages are only parsed once."""
+
+        from quartodoc.builder.loader import SharedLoader
+
+        if self._loader is None:
+            self._loader = SharedLoader(
+                parser=self.parser,
+                lazy=self.lazy_load,
+                external_include=self.external_include,
+                external_exclude=self.external_exclude,
+                external_submodules=self.external_submodules,
+            )
+            if self.import_workers:
+                from quartodoc.builder.workers import ImportWorkers
+
+                workers = ImportWorkers(self.import_workers)
+                self._loader.dynamic_docs.workers = workers
+
+            self._load_snapshot(self._loader)
+
+            if self.cache_dir is not None:
+                self._loader.parsed_docs.load(self.cache_dir)
+
+        return self._loader
+
+    def _prefetch_docstrings(self):
+        from quartodoc.builder.prefetch import layout_paths, prefetch_docstrings
+
+        paths = layout_paths(self.layout, dynamic=self.dynamic)
+        with profile_span("prefetch docstrings"):
+            n_parsed = prefetch_docstrings(self.loader, paths, self.parse_workers)
+
+        _log.info(f"Prefetched {n_parsed} docstrings.")
+
+    def _layout_packages(self) -> "list[str]":
+        packages = [self.package] if self.package else []
+        for section in self.layout.sections:
+            if isinstance(section.package, str) and section.package not in packages:
+                packages.append(section.package)
+
+        return packages
+
+    def write_snapshot(self, path: "str | Path"):
+        """Analyze the objects in the layout, and save their packages to a snapshot.
+
+        Builds can use the snapshot instead of analyzing source files, by
+        setting the source option to its path.
+        """
+
+        _log.info("Analyzing documented objects.")
+        with profile_span("blueprint"):
+            self._create_transformer().visit(self.layout)
+
+        self.loader.save_snapshot(path)
+
+    def _load_snapshot(self, loader: "SharedLoader"):
+        if self.source is not None:
+            loader.load_snapshot(self.source, validate=False)
+            return
+
+        if self.cache_dir is None:
+            return
+
+        # reuse packages analyzed by a previous build, if their files are unchanged
+        p_snapshot = Path(self.cache_dir) / self.out_snapshot
+        if p_snapshot.exists():
+            try:
+                loader.load_snapshot(p_snapshot)
+            except Exception as e:
+                _log.warning(f"Ignoring unreadable snapshot {p_snapshot}: {e}")
+
+    def _save_snapshot(self):
+        if self.source is None and self.cache_dir is not None:
+            self.loader.save_snapshot(Path(self.cache_dir) / self.out_snapshot)
+            self._snapshot_stale = False
+
+    def _refresh_loader(self, changed: "list[str] | None" = None):
+        if self._loader is None:
+            return
+
+        reloaded = self._loader.refresh(changed)
+        if reloaded:
+            _log.info(f"Reloaded changed modules: {reloaded}")
+            self._snapshot_stale = True
+
+    def _create_transformer(self, cache=None):
+        from quartodoc.builder.blueprint import BlueprintTransformer
+
+        trans = BlueprintTransformer(
+            parser=self.parser,
+            cache=cache,
+            loader=self.loader,
+        )
+
+        if self.dynamic is not None:
+            trans.dynamic = self.dynamic
+
+        return trans
+
+    def _blueprint_entries(self, trans, keys=None) -> layout.Layout:
+        """Blueprint each top-level page of the layout, and track its dependencies.
+
+        If keys is specified, only those entries are blueprinted, and the rest
+        are taken from the previous build.
+        """
+
+        from quartodoc import collect
+        from quartodoc.builder.blueprint import (
+            blueprint_entries,
+            unwrap_entry,
+            merge_layout,
+        )
+        from quartodoc.builder.cache import doc_dependencies
+
+        layouts = self._entry_layouts()
+
+        # layouts without sections are generated during blueprinting, so can't
+        # be split into entries.
+        if not layouts:
+            self._entries = None
+            return trans.visit(self.layout)
+
+        if keys is None:
+            self._entries = {}
+            keys = list(layouts)
+
+        blueprints = blueprint_entries(
+            trans, {key: layouts[key] for key in keys}, self.blueprint_threads
+        )
+
+        for key in keys:
+            page = unwrap_entry(blueprints[key])
+            pages, items = collect(page, base_dir=self.dir)
+            self._entries[key] = _BuildEntry(
+                page=page, pages=pages, items=items, files=doc_dependencies(page)
+            )
+            self._save_entry(
+                key, layouts[key], self._entries[key], self._summarize_entry(page)
+            )
+
+        return merge_layout(
+            self.layout, {k: entry.page for k, entry in self._entries.items()}
+        )
+
+    def _entry_layouts(self):
+        from quartodoc.builder.blueprint import split_layout
+
+        return split_layout(self.layout)
+
+    def _collect_entries(self, blueprint: layout.Layout):
+        from quartodoc import collect
+
+        if self._entries is None:
+            return collect(blueprint, base_dir=self.dir)
+
+        pages, items = [], []
+        for entry in self._entries.values():
+            pages.extend(entry.pages)
+            items.extend(entry.items)
+
+        return pages, items
+
+    # manifest ----
+
+    @property
+    def manifest(self) -> "Manifest":
+        """Content hashes of the files written by this builder."""
+
+        if self._manifest is None:
+            self._manifest = self._load_manifest()
+
+        return self._manifest
+
+    def _load_manifest(self) -> "Manifest":
+        from quartodoc.builder.manifest import Manifest
+
+        # the manifest is only saved when set explicitly, or when caching
+        if self.out_manifest is not None:
+            path = self.out_manifest
+        elif self.cache_dir is not None:
+            path = Path(self.cache_dir) / "manifest.json"
+        else:
+            path = None
+
+        return Manifest(path)
+
+    def _save_manifest(self, full: bool):
+        manifest = self.manifest
+        _log.info(f"Wrote {len(manifest.changed)} changed files")
+
+        # stale files are only known from a previous build's manifest, and
+        # partial builds don't produce every file
+        if full and manifest.loaded:
+            for fname in manifest.stale():
+                _log.warning(
+                    f"File from a previous build is no longer generated: {fname}"
+                )
+
+        manifest.save(prune=full)
+
+    def _load_cache(self):
+        from quartodoc.builder.cache import BlueprintCache
+
+        if self.cache_dir is None:
+            return None
+
+        _log.info(f"Loading blueprint cache from {self.cache_dir}")
+        return BlueprintCache(self.cache_dir, parser=self.parser)
+
     def write_index(self, blueprint: layout.Layout):
         """Write API index page."""
 
@@ -668,42 +1395,70 @@ class Builder:
         final = str(Blocks([*meta, content]))
 
         p_index = Path(self.dir) / self.out_index
-        p_index.parent.mkdir(exist_ok=True, parents=True)
-        p_index.write_text(final)
+        self.manifest.write(p_index, final)
 
         return str(p_index)
 
     def write_doc_pages(self, pages, filter: str):
         """Write individual function documentation pages."""
 
-        for page in pages:
-            _log.info(f"Rendering {page.path}")
-            rendered = self.renderer.render(page)
+        if filter != "*":
+            # filter before rendering, so skipped pages cost nothing
+            n_pages = len(pages)
+            pages = [page for page in pages if fnmatchcase(page.path, filter)]
+            _log.info(f"Filter matched {len(pages)} of {n_pages} pages")
+
+        for page, rendered in zip(pages, self.render_pages(pages)):
             html_path = Path(self.dir) / (page.path + self.out_page_suffix)
-            html_path.parent.mkdir(exist_ok=True, parents=True)
 
             # Only write out page if it has changed, or we've set the
             # rewrite_all_pages option. This ensures that quarto won't have
             # to re-render every page of the API all the time.
-            if filter != "*":
-                is_match = fnmatchcase(page.path, filter)
-
-                if is_match:
-                    _log.info("Matched filter")
-                else:
-                    _log.info("Skipping write (no filter match)")
-                    continue
-
-            if (
-                self.rewrite_all_pages
-                or (not html_path.exists())
-                or (html_path.read_text() != rendered)
-            ):
+            if self.manifest.write(html_path, rendered, force=self.rewrite_all_pages):
                 _log.info(f"Writing: {page.path}")
-                html_path.write_text(rendered)
             else:
                 _log.info("Skipping write (content unchanged)")
 
+    def render_pages(self, pages: "list[layout.Page]"):
+        """Yield the rendered content of each page, in order.
+
+        When the jobs option is greater than 1, pages are rendered across a
+        pool of worker processes. Note that any state a renderer sets on itself
+        while rendering is not sent back from the workers.
+        """
+
+        if self.jobs <= 1 or len(pages) < 2:
+            for page in pages:
+                _log.info(f"Rendering {page.path}")
+                yield self.renderer.render(page)
+
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        n_workers = min(self.jobs, len(pages))
+        chunksize = max(1, len(pages) // (n_workers * 4))
+
+        # workers record timings with their own profiler, which we merge back in
+        profiler = ctx_profiler.get()
+        t0 = profiler.t0 if profiler is not None else None
+
+        _log.info(f"Rendering {len(pages)} pages using {n_workers} processes")
+        with ProcessPoolExecutor(
+            n_workers,
+            mp_context=_render_mp_context(),
+            initializer=_init_render_worker,
+            initargs=(self.renderer, pages, t0),
+        ) as pool:
+            # map yields results in the order of pages, so writing stays
+            # deterministic regardless of which worker finishes first.
+            results = pool.map(_render_page_at, range(len(pages)), chunksize=chunksize)
+            for rendered, events in results:
+                if profiler is not None:
+                    profiler.extend(events)
+
+                yield rendered
+
     # inventory ----
 
     def create_inventory(self, items):
@@ -773,7 +1528,7 @@ class Builder:
         """Write a yaml config file for API sidebar."""
 
         d_sidebar = self._generate_sidebar(blueprint)
-        yaml.dump(d_sidebar, open(self.sidebar["file"], "w"))
+        self.manifest.write(self.sidebar["file"], yaml.dump(d_sidebar))
 
     def write_css(self):
         """Write default css styles to a file."""
@@ -789,7 +1544,7 @@ class Builder:
             "*/\n\n\n"
         )
         with open(files("quartodoc.static") / "styles.css") as f:
-            Path(self.css).write_text(note + f.read())
+            self.manifest.write(self.css, note + f.read())
 
     def _page_to_links(self, el: layout.Page) -> list[str]:
         # if el.flatten:
@@ -854,6 +1609,10 @@ class BuilderSinglePage(Builder):
     def write_index(self, *args, **kwargs):
         pass
 
+    def _summarize_entry(self, entry):
+        # the index is not written, and its single page can't be summarized
+        return None
+
 
 # Builders ====================================================================
 
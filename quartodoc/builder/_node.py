@@ -1,17 +1,23 @@
-# Note: this class is in its own file to ensure compatibility with python 3.9.
-# If it were in another file, then we would have to change all our types to
-# use Union and Optional, or pyndantic would error.
-
 from __future__ import annotations
 
-from quartodoc._pydantic_compat import BaseModel
 from typing import Any, Optional
 
 
-class Node(BaseModel):
-    level: int = -1
-    value: Any = None
-    parent: Optional[Node] = None
+class Node:
+    """An element being visited by a transformer, along with its parent node.
+
+    Nodes are created for every element a transformer enters, so this is a
+    plain class with slots, rather than a pydantic model.
+    """
+
+    __slots__ = ("level", "value", "parent")
 
+    def __init__(
+        self, level: int = -1, value: Any = None, parent: Optional[Node] = None
+    ):
+        self.level = level
+        self.value = value
+        self.parent = parent
 
-Node.update_forward_refs()
+    def __repr__(self):
+        return f"Node(level={self.level}, value={self.value!r})"
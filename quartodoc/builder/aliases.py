@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from .._griffe_compat import dataclasses as dc
+
+MAX_HOPS = 100
+
+
+class AliasTable:
+    """Memoized alias resolution, shared by everything using the same loader.
+
+    Re-exported objects tend to be resolved many times in a build (e.g. for each
+    member list, summary row, and signature that mentions them). This table
+    records the final target of each alias, and whether it points outside a
+    package, so each chain is only walked once. Aliases are identified by their
+    path and target path, since aliases created on the fly (e.g. for methods
+    fetched through an alias to a class) may share a path with a loaded alias.
+
+    The table is cleared by its loader whenever modules are loaded, reloaded,
+    or dropped, since these can change what an alias points to. Failed
+    resolutions are not recorded.
+
+    Attributes
+    ----------
+    hits:
+        Number of resolutions answered from the table.
+    misses:
+        Number of resolutions that walked an alias chain.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+        self._targets: "dict[tuple[str, str], dc.Object]" = {}
+        self._external: "dict[tuple[str, str, str], bool]" = {}
+
+    def clear(self):
+        self._targets.clear()
+        self._external.clear()
+
+    def final_target(self, alias: dc.Alias) -> dc.Object:
+        """Return the object at the end of an alias chain."""
+
+        key = (alias.path, alias.target_path)
+        if key in self._targets:
+            self.hits += 1
+            return self._targets[key]
+
+        self.misses += 1
+
+        target = alias.target
+        for _ in range(MAX_HOPS):
+            if not isinstance(target, dc.Alias):
+                break
+
+            target = target.target
+        else:
+            raise ValueError(
+                "Attempted to resolve target, but may be infinitely recursing?"
+            )
+
+        self._targets[key] = target
+        return target
+
+    def is_external(self, alias: dc.Alias, package_name: str) -> bool:
+        """Return whether an alias chain leaves a package.
+
+        Note that an alias whose target is not loaded is assumed to point
+        outside the package.
+        """
+
+        key = (alias.path, alias.target_path, package_name)
+        if key in self._external:
+            self.hits += 1
+            return self._external[key]
+
+        self.misses += 1
+
+        res = self._external[key] = _walk_external(alias, package_name)
+        return res
+
+
+def _walk_external(obj: dc.Alias, package_name: str) -> bool:
+    crnt_target = obj
+
+    while crnt_target.is_alias:
+        if not crnt_target.target_path.startswith(package_name):
+            return True
+
+        try:
+            new_target = crnt_target.modules_collection[crnt_target.target_path]
+
+            if new_target is crnt_target:
+                raise Exception(f"Cyclic Alias: {new_target}")
+
+            crnt_target = new_target
+
+        except KeyError:
+            # assumes everything from module was loaded, so target must
+            # be outside module
+            return True
+
+    return False
+
+
+def alias_table(obj: dc.Object | dc.Alias) -> "AliasTable | None":
+    """Return the alias table for the loader an object came from, if it has one."""
+
+    try:
+        collection = obj.modules_collection
+    except ValueError:
+        # objects that are not attached to a package
+        return None
+
+    return getattr(collection, "aliases", None)
+
+
+def final_target(alias: dc.Alias) -> dc.Object:
+    """Return the object at the end of an alias chain, using an alias table if possible."""
+
+    table = alias_table(alias)
+    if table is None:
+        return alias.final_target
+
+    return table.final_target(alias)
+
+
+def is_external_alias(obj: dc.Alias | dc.Object, package_name: str) -> bool:
+    """Return whether an object is an alias, that points outside a package."""
+
+    if not isinstance(obj, dc.Alias):
+        return False
+
+    table = alias_table(obj)
+    if table is None:
+        return _walk_external(obj, package_name)
+
+    return table.is_external(obj, package_name)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import copy
 import logging
 import json
+import re
+import threading
 import yaml
 
 from .._griffe_compat import dataclasses as dc
@@ -13,6 +16,7 @@ from .._griffe_compat import (
 )
 
 from .._griffe_compat import AliasResolutionError
+from fnmatch import fnmatchcase
 from functools import partial
 from textwrap import indent
 
@@ -31,17 +35,23 @@ from quartodoc.layout import (
     Section,
 )
 from quartodoc.parsers import get_parser_defaults
+from quartodoc.profiling import profile_span
 from quartodoc import get_object as _get_object
 
+from .aliases import final_target, is_external_alias
+from .doc_memo import DocMemo
+from .inherited import all_members
+from .parse_cache import parsed_sections
 from .utils import PydanticTransformer, ctx_node, WorkaroundKeyError
 
 from typing import overload, TYPE_CHECKING
 
-
 _log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
     from quartodoc._pydantic_compat import BaseModel
+    from .cache import BlueprintCache
+    from .loader import SharedLoader
 
 
 def _auto_package(mod: dc.Module) -> list[Section]:
@@ -74,8 +84,8 @@ def _auto_package(mod: dc.Module) -> list[Section]:
         contents.append(Auto(name=name))
 
     # try to fetch a description of the module ----
-    if mod.docstring and mod.docstring.parsed:
-        mod_summary = mod.docstring.parsed[0]
+    if mod.docstring and parsed_sections(mod.docstring):
+        mod_summary = parsed_sections(mod.docstring)[0]
         if isinstance(mod_summary, ds.DocstringSectionText):
             desc = mod_summary.value
         else:
@@ -87,31 +97,7 @@ def _auto_package(mod: dc.Module) -> list[Section]:
 
 
 def _is_external_alias(obj: dc.Alias | dc.Object, mod: dc.Module):
-    package_name = mod.path.split(".")[0]
-
-    if not isinstance(obj, dc.Alias):
-        return False
-
-    crnt_target = obj
-
-    while crnt_target.is_alias:
-        if not crnt_target.target_path.startswith(package_name):
-            return True
-
-        try:
-            new_target = crnt_target.modules_collection[crnt_target.target_path]
-
-            if new_target is crnt_target:
-                raise Exception(f"Cyclic Alias: {new_target}")
-
-            crnt_target = new_target
-
-        except KeyError:
-            # assumes everything from module was loaded, so target must
-            # be outside module
-            return True
-
-    return False
+    return is_external_alias(obj, mod.path.split(".")[0])
 
 
 def _to_simple_dict(el: "BaseModel"):
@@ -125,10 +111,24 @@ def _non_default_entries(el: Auto):
     return {k: getattr(el, k) for k in el._fields_specified}
 
 
-def _resolve_alias(obj: dc.Alias | dc.Object, get_object):
+def _resolve_alias(
+    obj: dc.Alias | dc.Object, get_object, loader: "SharedLoader | None" = None
+):
+    """Resolve an alias, loading external modules when needed.
+
+    If a loader is passed, it is used to load the package of each alias target,
+    and None is returned if it can't be loaded (e.g. it is excluded).
+    """
+
     if not isinstance(obj, dc.Alias):
         return obj
 
+    # most aliases resolve without loading anything, and are memoized
+    try:
+        return final_target(obj)
+    except AliasResolutionError:
+        pass
+
     # attempt to resolve alias, loading external modules when needed ----
     max_tries = 100
 
@@ -140,28 +140,62 @@ def _resolve_alias(obj: dc.Alias | dc.Object, get_object):
         try:
             new_obj = new_obj.target
         except AliasResolutionError as e:
+            if loader is not None and not loader.load_external(e.alias.target_path):
+                return None
+
             new_obj = get_object(e.alias.target_path)
 
     return new_obj
 
 
 class BlueprintTransformer(PydanticTransformer):
-    def __init__(self, get_object=None, parser="numpy"):
+    def __init__(
+        self,
+        get_object=None,
+        parser="numpy",
+        cache=None,
+        loader: "SharedLoader | None" = None,
+    ):
         if get_object is None:
-            loader = GriffeLoader(
-                docstring_parser=Parser(parser),
-                docstring_options=get_parser_defaults(parser),
-                modules_collection=ModulesCollection(),
-                lines_collection=LinesCollection(),
-            )
-            self.get_object = partial(_get_object, loader=loader)
+            if loader is None:
+                _loader = GriffeLoader(
+                    docstring_parser=Parser(parser),
+                    docstring_options=get_parser_defaults(parser),
+                    modules_collection=ModulesCollection(),
+                    lines_collection=LinesCollection(),
+                )
+            else:
+                _loader = loader
+            self.get_object = partial(_get_object, loader=_loader)
         else:
             self.get_object = get_object
 
+        # optional SharedLoader, for loading the targets of external aliases
+        self.loader = loader
+
         self.crnt_package = None
         self.options = None
         self.dynamic = False
 
+        # optional BlueprintCache, for reusing Docs from previous builds
+        self.cache = cache
+
+        # Docs blueprinted by this transformer, for reusing them within a build
+        self.docs = DocMemo()
+
+        # held while fetching objects, and using the caches above, so that
+        # forked transformers can blueprint in other threads (see fork)
+        self._lock = getattr(loader, "lock", None) or threading.RLock()
+
+    def fork(self) -> "BlueprintTransformer":
+        """Return a transformer that can blueprint elements in another thread.
+
+        The new transformer shares this one's loader, caches, and options, but
+        separately tracks the package and options of the elements it visits.
+        """
+
+        return copy.copy(self)
+
     @staticmethod
     def _append_member_path(path: str, new: str):
         if ":" in path:
@@ -171,7 +205,8 @@ class BlueprintTransformer(PydanticTransformer):
 
     def get_object_fixed(self, path, **kwargs):
         try:
-            return self.get_object(path, **kwargs)
+            with self._lock:
+                return self.get_object(path, **kwargs)
         except KeyError as e:
             key_name = e.args[0]
             raise WorkaroundKeyError(
@@ -186,31 +221,27 @@ class BlueprintTransformer(PydanticTransformer):
 
         return new
 
-    @dispatch
-    def visit(self, el):
-        # TODO: use a context handler
-        self._log("VISITING", el)
-
-        # set package ----
+    def push_state(self, el):
+        # set package and options ----
+        # TODO: check for Section instead?
         package = getattr(el, "package", MISSING())
-        old = self.crnt_package
+        options = getattr(el, "options", None)
+
+        if isinstance(package, MISSING) and options is None:
+            return None
+
+        old = (self.crnt_package, self.options)
 
         if not isinstance(package, MISSING):
             self.crnt_package = package
 
-        # set options ----
-        # TODO: check for Section instead?
-        options = getattr(el, "options", None)
-        old_options = self.options
-
         if options is not None:
             self.options = options
 
-        try:
-            return super().visit(el)
-        finally:
-            self.crnt_package = old
-            self.options = old_options
+        return old
+
+    def pop_state(self, state):
+        self.crnt_package, self.options = state
 
     @dispatch
     def enter(self, el: Layout):
@@ -259,7 +290,9 @@ class BlueprintTransformer(PydanticTransformer):
         # otherwise, replace all contents with pages.
         new = el.copy()
         contents = [
-            Page(contents=[el], path=el.name) if not isinstance(el, Page) else el
+            Page._construct(contents=[el], path=el.name)
+            if not isinstance(el, Page)
+            else el
             for el in new.contents
         ]
 
@@ -272,29 +305,40 @@ class BlueprintTransformer(PydanticTransformer):
         self._log("Entering", el)
 
         # settings based on parent context options (package, options) ----
-        # TODO: make this less brittle
-        pkg = self.crnt_package
-        if pkg is None:
-            path = el.name
-        elif ":" in pkg or ":" in el.name:
-            path = f"{pkg}.{el.name}"
-        else:
-            path = f"{pkg}:{el.name}"
+        path = _object_path(self.crnt_package, el.name)
 
+        with profile_span(path, cat="blueprint"):
+            return self._enter_auto(el, path)
+
+    def _enter_auto(self, el: Auto, path: str):
         # auto default overrides
         if self.options is not None:
             # TODO: is this round-tripping guaranteed by pydantic?
             _option_dict = _non_default_entries(self.options)
             _el_dict = _non_default_entries(el)
-            el = el.__class__(**{**_option_dict, **_el_dict})
+            el = el.__class__._construct(**{**_option_dict, **_el_dict})
 
         # fetching object ----
         _log.info(f"Getting object for {path}")
 
         dynamic = el.dynamic if el.dynamic is not None else self.dynamic
 
-        obj = self.get_object_fixed(path, dynamic=dynamic)
-        raw_members = self._fetch_members(el, obj)
+        memo_key = self.docs.key(path, el, dynamic)
+        with self._lock:
+            doc = self.docs.get(memo_key)
+            if doc is not None:
+                return doc
+
+            if self.cache is not None:
+                cache_key = self.cache.key(path, el, dynamic)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    _log.info(f"Using cached blueprint for {path}")
+                    self.docs.set(memo_key, cached)
+                    return cached
+
+            obj = self.get_object_fixed(path, dynamic=dynamic)
+            raw_members = self._fetch_members(el, obj)
 
         # Three cases for structuring child methods ----
 
@@ -317,12 +361,18 @@ class BlueprintTransformer(PydanticTransformer):
             # create Doc element for member ----
             # TODO: when a member is a Class, it is currently created using
             # defaults, and there is no way to override those.
-            doc = self.visit(Auto(name=relative_path, **member_options))
+            if el.children == ChoicesChildren.linked:
+                # links only need the member's object, so it isn't blueprinted
+                doc = None
+                member_obj = self._get_member_object(relative_path, member_options)
+            else:
+                doc = self.visit(Auto._construct(name=relative_path, **member_options))
+                member_obj = doc.obj
 
             # do no document submodules
             if (
-                # _is_external_alias(doc.obj, obj.package)
-                doc.obj.kind.value
+                # _is_external_alias(member_obj, obj.package)
+                member_obj.kind.value
                 == "module"
             ):
                 continue
@@ -332,7 +382,7 @@ class BlueprintTransformer(PydanticTransformer):
 
             # Case 1: make each member entry its own page
             if el.children == ChoicesChildren.separate:
-                res = MemberPage(path=doc.obj.path, contents=[doc])
+                res = MemberPage._construct(path=doc.obj.path, contents=[doc])
             # Case2: use just the Doc element, so it gets embedded directly
             # into the class being documented
             elif el.children in {ChoicesChildren.embedded, ChoicesChildren.flat}:
@@ -341,16 +391,15 @@ class BlueprintTransformer(PydanticTransformer):
             # if the page for the member is not created somewhere else, then it
             # won't exist in the documentation (but its summary will still be in
             # the table).
-            # TODO: we shouldn't even bother blueprinting these members.
             elif el.children == ChoicesChildren.linked:
-                res = Link(name=doc.obj.path, obj=doc.obj)
+                res = Link._construct(name=member_obj.path, obj=member_obj)
             else:
                 raise ValueError(f"Unsupported value of children: {el.children}")
 
             children.append(res)
 
         is_flat = el.children == ChoicesChildren.flat
-        return Doc.from_griffe(
+        doc = Doc.from_griffe(
             el.name,
             obj,
             children,
@@ -358,13 +407,33 @@ class BlueprintTransformer(PydanticTransformer):
             signature_name=el.signature_name,
         )
 
+        with self._lock:
+            if self.cache is not None:
+                self.cache.set(cache_key, doc)
+
+            self.docs.set(memo_key, doc)
+
+        return doc
+
+    def _get_member_object(self, name: str, member_options: dict):
+        """Fetch the object that blueprinting a member's Auto would document."""
+
+        # member options always include the package and dynamic options, so
+        # these take precedence over any options set on the parent section
+        package = member_options["package"]
+        dynamic = member_options["dynamic"]
+        if dynamic is None:
+            dynamic = self.dynamic
+
+        return self.get_object_fixed(_object_path(package, name), dynamic=dynamic)
+
     def _fetch_members(self, el: Auto, obj: dc.Object | dc.Alias):
         # Note that this could be a static method, if we passed in the griffe loader
 
         if el.members is not None:
             return el.members
 
-        options = obj.all_members if el.include_inherited else obj.members
+        options = all_members(obj) if el.include_inherited else obj.members
 
         # use the __all__ attribute of modules to filter members
         # otherwise, all members are included in the initial options
@@ -386,8 +455,17 @@ class BlueprintTransformer(PydanticTransformer):
 
         # resolve any remaining aliases ----
         # the reamining filters require attributes on the target object.
-        for obj in options.values():
-            _resolve_alias(obj, self.get_object)
+        unresolved = [
+            k
+            for k, v in options.items()
+            if _resolve_alias(v, self.get_object, self.loader) is None
+        ]
+        if unresolved:
+            _log.warning(
+                f"Skipping members of {obj.path} that point to packages which could"
+                f" not be loaded: {unresolved}"
+            )
+            options = {k: v for k, v in options.items() if k not in unresolved}
 
         if not el.include_empty:
             options = {k: v for k, v in options.items() if v.docstring is not None}
@@ -415,6 +493,18 @@ class BlueprintTransformer(PydanticTransformer):
             raise ValueError(f"Unsupported value of member_order: {el.member_order}")
 
 
+def _object_path(package: "str | None", name: str) -> str:
+    """Return the path get_object uses to fetch an Auto's object."""
+
+    # TODO: make this less brittle
+    if package is None:
+        return name
+    elif ":" in package or ":" in name:
+        return f"{package}.{name}"
+
+    return f"{package}:{name}"
+
+
 class _PagePackageStripper(PydanticTransformer):
     def __init__(self, package: str):
         self.package = package
@@ -437,7 +527,11 @@ def blueprint(el: Auto, package: str) -> Doc:
 
 
 def blueprint(
-    el: _Base, package: str = None, dynamic: None | bool = None, parser="numpy"
+    el: _Base,
+    package: str = None,
+    dynamic: None | bool = None,
+    parser="numpy",
+    cache: "BlueprintCache | None" = None,
 ) -> _Base:
     """Convert a configuration element to something that is ready to render.
 
@@ -449,6 +543,11 @@ def blueprint(
         A base package name. If specified, this is prepended to the names of any objects.
     dynamic:
         Whether to dynamically load objects. Defaults to using static analysis.
+    parser:
+        Docstring parser to use.
+    cache:
+        A BlueprintCache, used to reuse Docs whose source files have not changed
+        since a previous build.
 
     Examples
     --------
@@ -463,7 +562,14 @@ def blueprint(
 
     """
 
-    trans = BlueprintTransformer(parser=parser)
+    from .pool import loader_pool
+
+    # dynamic lookups replace docstrings on loaded objects, so use a loader
+    # that isn't shared with static lookups. Since this may blueprint many
+    # objects, check once for edited modules up front.
+    dynamic_loader = bool(dynamic) or _uses_dynamic(el)
+    loader = loader_pool.get(parser, dynamic=dynamic_loader, refresh=True)
+    trans = BlueprintTransformer(parser=parser, cache=cache, loader=loader)
 
     if package is not None:
         trans.crnt_package = package
@@ -474,6 +580,146 @@ def blueprint(
     return trans.visit(el)
 
 
+def _uses_dynamic(el) -> bool:
+    from quartodoc._pydantic_compat import BaseModel
+
+    if isinstance(el, BaseModel):
+        return any(
+            (field == "dynamic" and bool(value)) or _uses_dynamic(value)
+            for field, value in el
+        )
+    elif isinstance(el, dict):
+        return bool(el.get("dynamic")) or any(map(_uses_dynamic, el.values()))
+    elif isinstance(el, (list, tuple)):
+        return any(map(_uses_dynamic, el))
+
+    return False
+
+
+def split_layout(el: Layout) -> "dict[tuple[int, int | None], Layout]":
+    """Split a layout into smaller layouts, one for each top-level page.
+
+    Every top-level page of a layout can be blueprinted independently. This
+    returns a dictionary mapping (section index, content index) to a layout
+    with only that page's content. Pages listed directly in the sections of
+    a layout have a content index of None.
+
+    Note that a layout with no sections cannot be split, since its contents
+    are generated during blueprinting. In this case an empty dictionary is
+    returned.
+    """
+
+    entries = {}
+    for ii, section in enumerate(el.sections):
+        if isinstance(section, Page):
+            entries[(ii, None)] = el.copy(update={"sections": [section]})
+        else:
+            for jj, content in enumerate(section.contents):
+                sub_section = section.copy(update={"contents": [content]})
+                entries[(ii, jj)] = el.copy(update={"sections": [sub_section]})
+
+    return entries
+
+
+def blueprint_entries(
+    trans: BlueprintTransformer,
+    layouts: "dict[tuple[int, int | None], Layout]",
+    n_threads: int = 1,
+) -> "dict[tuple[int, int | None], Layout]":
+    """Blueprint layouts created by split_layout, optionally across threads.
+
+    Each layout is blueprinted by its own fork of trans (see
+    BlueprintTransformer.fork). Results are returned in the same order as
+    layouts, and are identical to blueprinting them one at a time.
+
+    Parameters
+    ----------
+    trans:
+        The transformer to blueprint with.
+    layouts:
+        Layouts to blueprint, e.g. from split_layout.
+    n_threads:
+        Maximum number of threads to use. Defaults to 1, which blueprints
+        layouts in the current thread.
+    """
+
+    if n_threads <= 1 or len(layouts) < 2:
+        return {key: trans.visit(el) for key, el in layouts.items()}
+
+    import contextvars
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # threads start with an empty context, so run each task in a copy of this
+    # one (e.g. to keep recording profiling spans)
+    with ThreadPoolExecutor(min(n_threads, len(layouts))) as pool:
+        futures = {
+            key: pool.submit(contextvars.copy_context().run, trans.fork().visit, el)
+            for key, el in layouts.items()
+        }
+
+        return {key: future.result() for key, future in futures.items()}
+
+
+def unwrap_entry(el: Layout) -> Page:
+    """Return the page from a blueprinted layout created by split_layout."""
+
+    section = el.sections[0]
+    if isinstance(section, Page):
+        return section
+
+    return section.contents[0]
+
+
+def merge_layout(el: Layout, pages: "dict[tuple[int, int | None], Page]") -> Layout:
+    """Combine pages blueprinted from split_layout back into a full layout."""
+
+    sections = []
+    for ii, section in enumerate(el.sections):
+        if isinstance(section, Page):
+            sections.append(pages[(ii, None)])
+        else:
+            contents = [pages[(ii, jj)] for jj in range(len(section.contents))]
+            sections.append(section.copy(update={"contents": contents}))
+
+    return el.copy(update={"sections": sections})
+
+
+def entry_may_match(el: Layout, filter: str) -> bool:
+    """Return whether blueprinting an entry from split_layout may create a page
+    whose path matches filter.
+
+    This is conservative, and only needs the layout configuration. Pages for
+    members (e.g. when children is "separate") have paths starting with the path
+    of their parent object, so an entry may match if the filter's literal prefix
+    is compatible with the path of any object it documents.
+    """
+
+    prefix = re.split(r"[*?\[]", filter, maxsplit=1)[0]
+
+    def visit(node, package) -> bool:
+        node_package = getattr(node, "package", MISSING())
+        if not isinstance(node_package, MISSING):
+            package = node_package
+
+        if isinstance(node, Page) and fnmatchcase(node.path, filter):
+            return True
+
+        if isinstance(node, Auto):
+            if fnmatchcase(node.name, filter):
+                return True
+
+            member_prefix = _object_path(package, node.name).replace(":", ".") + "."
+            return member_prefix.startswith(prefix) or prefix.startswith(member_prefix)
+
+        children = [*getattr(node, "sections", []), *getattr(node, "contents", [])]
+        return any(
+            visit(child, package) for child in children if not isinstance(child, str)
+        )
+
+    return visit(el, None)
+
+
 def strip_package_name(el: _Base, package: str):
     """Removes leading package name from layout Pages."""
 
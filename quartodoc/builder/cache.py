@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import pickle
+import sys
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+from .._griffe_compat import dataclasses as dc
+from .._griffe_compat import AliasResolutionError
+from quartodoc import layout
+from quartodoc.parsers import get_parser_defaults
+
+from .aliases import final_target
+from .blueprint import _to_simple_dict
+from .utils import extract_type
+
+_log = logging.getLogger(__name__)
+
+
+CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def _package_versions() -> dict:
+    from importlib_metadata import version, PackageNotFoundError
+
+    versions = {"cache": CACHE_VERSION, "python": list(sys.version_info[:2])}
+    for name in ["quartodoc", "griffe", "pydantic"]:
+        try:
+            versions[name] = version(name)
+        except PackageNotFoundError:
+            versions[name] = None
+
+    return versions
+
+
+def _object_files(obj: dc.Object | dc.Alias) -> "list[str]":
+    """Return the source files that went into documenting a griffe object."""
+
+    candidates = []
+
+    if isinstance(obj, dc.Alias):
+        # the module where the alias is defined, and the module of its target
+        if obj.parent is not None:
+            candidates.append(obj.parent.filepath)
+        try:
+            obj = final_target(obj)
+        except (AliasResolutionError, ValueError):
+            return _flatten_paths(candidates)
+
+    candidates.append(obj.filepath)
+
+    # members inherited by a class can change whenever a parent class changes
+    if isinstance(obj, dc.Class):
+        try:
+            candidates.extend(base.filepath for base in obj.mro())
+        except Exception:
+            pass
+
+    return _flatten_paths(candidates)
+
+
+def _flatten_paths(paths) -> "list[str]":
+    out = []
+    for p in paths:
+        # namespace packages have a list of paths
+        if isinstance(p, list):
+            out.extend(str(Path(x).resolve()) for x in p)
+        elif p is not None:
+            out.append(str(Path(p).resolve()))
+
+    return out
+
+
+def doc_dependencies(el: layout._Base) -> "set[str]":
+    """Return the paths of all source files that contribute to a layout element."""
+
+    objs = [doc.obj for doc in extract_type(layout.Doc, el)]
+    objs.extend(link.obj for link in extract_type(layout.Link, el))
+
+    files = set()
+    for obj in objs:
+        files.update(_object_files(obj))
+
+    return files
+
+
+@dataclass
+class _CacheEntry:
+    doc: layout.Doc
+    files: "dict[str, str]" = field(default_factory=dict)
+
+
+class BlueprintCache:
+    """A persistent, on-disk cache of blueprinted Doc elements.
+
+    Entries are keyed by the path of the documented object, its fully merged
+    Auto options, and the docstring parser. Each entry records the hash of every
+    source file that contributed to it, and is only reused while those files
+    are unchanged.
+
+    Parameters
+    ----------
+    cache_dir:
+        Directory where the cache is stored.
+    parser:
+        Docstring parser used to create the cached elements.
+
+    Attributes
+    ----------
+    hits:
+        Number of elements fetched from the cache.
+    misses:
+        Number of elements that needed to be blueprinted.
+    """
+
+    file_name = "blueprint.pickle"
+
+    def __init__(self, cache_dir: "str | Path" = ".quartodoc_cache", parser="numpy"):
+        self.cache_dir = Path(cache_dir)
+        self.parser = parser
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "dict[str, _CacheEntry]" = {}
+        self._used: "dict[str, _CacheEntry]" = {}
+        self._file_hashes: "dict[str, str | None]" = {}
+
+        self._load()
+
+    @property
+    def path(self) -> Path:
+        return self.cache_dir / self.file_name
+
+    # keys and file hashes ----
+
+    def key(self, path: str, el: layout.Auto, dynamic) -> str:
+        """Return the cache key for blueprinting an Auto element."""
+
+        spec = {
+            "path": path,
+            "options": _to_simple_dict(el),
+            "dynamic": dynamic,
+            "parser": self.parser,
+            "parser_options": get_parser_defaults(self.parser),
+        }
+
+        raw = json.dumps(spec, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def file_hash(self, fname: str) -> "str | None":
+        """Return the hash of a file's contents (or None if it does not exist)."""
+
+        if fname not in self._file_hashes:
+            try:
+                content = Path(fname).read_bytes()
+            except OSError:
+                self._file_hashes[fname] = None
+            else:
+                self._file_hashes[fname] = hashlib.sha256(content).hexdigest()
+
+        return self._file_hashes[fname]
+
+    # fetching and setting ----
+
+    def get(self, key: str) -> "layout.Doc | None":
+        """Return a cached element, if its source files have not changed."""
+
+        entry = self._used.get(key) or self._entries.get(key)
+
+        if entry is None or not self._is_fresh(entry):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._used[key] = entry
+        return entry.doc
+
+    def set(self, key: str, doc: layout.Doc):
+        """Add a blueprinted element to the cache."""
+
+        files = {fname: self.file_hash(fname) for fname in doc_dependencies(doc)}
+        self._used[key] = _CacheEntry(doc, files)
+
+    def _is_fresh(self, entry: _CacheEntry) -> bool:
+        return all(
+            old is not None and self.file_hash(fname) == old
+            for fname, old in entry.files.items()
+        )
+
+    # persisting ----
+
+    def _load(self):
+        if not self.path.exists():
+            return
+
+        try:
+            with self.path.open("rb") as f:
+                versions, entries = pickle.load(f)
+        except Exception as e:
+            _log.warning(f"Ignoring unreadable blueprint cache {self.path}: {e}")
+            return
+
+        if versions != _package_versions():
+            _log.info("Ignoring blueprint cache created by different package versions.")
+            return
+
+        self._entries = entries
+
+    def save(self):
+        """Write all entries used in the current build to disk.
+
+        Entries that were not used are dropped, so stale objects do not
+        accumulate in the cache.
+        """
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        with self.path.open("wb") as f:
+            pickle.dump(
+                (_package_versions(), self._used), f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+        _log.info(
+            f"Saved blueprint cache to {self.path} ({self.hits} hits, {self.misses} misses)"
+        )
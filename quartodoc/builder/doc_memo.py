@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from quartodoc._pydantic_compat import BaseModel
+from quartodoc import layout
+
+
+class DocMemo:
+    """Docs blueprinted by a transformer, keyed by object path and Auto options.
+
+    The same object is sometimes blueprinted several times in one build (e.g.
+    when a layout documents it in more than one section, or documents a class
+    twice with options that don't change its members). This records each Doc a
+    transformer creates, so repeated Autos reuse it. Since a Doc's name, anchor,
+    and members all come from its Auto's options, entries are keyed by the
+    fully merged options, rather than just the object's path.
+
+    Entries are keyed by the path an object is documented under, so inherited
+    members (or objects reached through different aliases) are blueprinted
+    once per path, since each needs its own anchor and object.
+
+    Entries are kept until clear is called, so a memo should only be used while
+    the objects it documents are unchanged (e.g. for a single build).
+
+    Attributes
+    ----------
+    hits:
+        Number of Docs reused from the memo.
+    misses:
+        Number of Docs that were blueprinted.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+        self._docs: "dict[tuple, layout.Doc]" = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    @staticmethod
+    def key(path: str, el: layout.Auto, dynamic) -> tuple:
+        """Return the key for blueprinting an Auto, with all options merged in."""
+
+        return (path, _freeze(dynamic), _freeze(el))
+
+    def get(self, key: tuple) -> "layout.Doc | None":
+        doc = self._docs.get(key)
+        if doc is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return doc
+
+    def set(self, key: tuple, doc: layout.Doc):
+        self._docs[key] = doc
+
+    def clear(self):
+        """Remove all entries, keeping the hit and miss counts."""
+
+        self._docs.clear()
+
+
+def _freeze(x):
+    """Return a hashable version of an option value."""
+
+    if isinstance(x, BaseModel):
+        return (type(x).__name__, tuple((k, _freeze(v)) for k, v in x))
+    elif isinstance(x, (list, tuple)):
+        return tuple(_freeze(v) for v in x)
+
+    return x
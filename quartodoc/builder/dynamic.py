@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import importlib
+import logging
+import weakref
+
+from .._griffe_compat import dataclasses as dc
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .workers import ImportWorkers
+
+
+_log = logging.getLogger(__name__)
+
+
+MISSING = object()
+"""Marks objects that could not be found by a dynamic import."""
+
+
+class DynamicDocs:
+    """Memoized dynamic imports, for loading docstrings from python objects.
+
+    Rather than importing and looking up each documented object separately,
+    the first lookup in a module collects the docstrings of all its members
+    (and their class members) in one pass. The results of dynamic_alias are
+    memoized as well, so fetching a parent object for each member is cheap.
+
+    Entries for a module are dropped by its loader when the module is reloaded,
+    so modules that have not changed are reused across builds. Note that
+    python modules are imported once, and not re-imported when they change,
+    unless imports are done by workers.
+
+    Attributes
+    ----------
+    workers:
+        If set, worker processes used to import modules (see ImportWorkers).
+        Otherwise, modules are imported into the current process. Workers are
+        restarted when a module they imported is reloaded.
+    n_modules:
+        Number of modules whose docstrings were collected.
+    hits:
+        Number of dynamic lookups answered from memoized results.
+    """
+
+    def __init__(self, workers: "ImportWorkers | None" = None):
+        self.workers = workers
+        self.n_modules = 0
+        self.hits = 0
+
+        # module path -> {object path -> __doc__}
+        self._docs: "dict[str, dict[str, str | None]]" = {}
+
+        # (path, target) -> result of dynamic_alias
+        self._aliases: "dict[tuple[str, str | None], dc.Object | dc.Alias]" = {}
+
+        # classes whose members already had their docstrings replaced
+        self._classes: "weakref.WeakSet[dc.Class]" = weakref.WeakSet()
+
+    def __reduce__(self):
+        # pickled objects (e.g. in the blueprint cache) carry their modules
+        # collection along, but memoized imports are only valid in this process.
+        return (DynamicDocs, (self.workers,))
+
+    def invalidate(self, module_path: str):
+        """Drop entries for a module (and its submodules)."""
+
+        prefix = module_path + "."
+        self._docs = {
+            k: v
+            for k, v in self._docs.items()
+            if k != module_path and not k.startswith(prefix)
+        }
+
+        # aliases may point anywhere, so they are always dropped
+        self._aliases.clear()
+
+        if self.workers is not None:
+            self.workers.restart(module_path)
+
+    # docstrings ----
+
+    def get_doc(self, obj: dc.Object):
+        """Return the __doc__ of the python object for obj, or MISSING."""
+
+        module = obj.module
+        docs = self._docs.get(module.path)
+        if docs is None:
+            docs = self._docs[module.path] = self._collect(module)
+
+        return docs.get(obj.path, MISSING)
+
+    def mark_members(self, obj: dc.Class) -> bool:
+        """Record that a class's members are being replaced, returning whether it's new."""
+
+        if obj in self._classes:
+            return False
+
+        self._classes.add(obj)
+        return True
+
+    def _collect(self, module: dc.Module) -> "dict[str, str | None]":
+        _log.info(f"Collecting dynamic docstrings for {module.path}")
+
+        self.n_modules += 1
+
+        qualnames = list(_member_qualnames(module))
+        if self.workers is not None:
+            res = self.workers.collect_docs(module.canonical_path, qualnames)
+        else:
+            res = collect_docs(module.canonical_path, qualnames)
+
+        return {f"{module.path}.{name}": doc for name, doc in res.items()}
+
+    def lookup(self, path: str) -> "tuple[str, str | None]":
+        """Return the canonical path and __doc__ of an object, importing it."""
+
+        if self.workers is not None:
+            return self.workers.lookup(path)
+
+        from ..autosummary import _dynamic_lookup
+
+        return _dynamic_lookup(path)
+
+    # aliases ----
+
+    def get_alias(self, path: str, target: "str | None"):
+        res = self._aliases.get((path, target))
+        if res is not None:
+            self.hits += 1
+
+        return res
+
+    def set_alias(self, path: str, target: "str | None", obj: dc.Object | dc.Alias):
+        self._aliases[(path, target)] = obj
+
+
+def _member_qualnames(obj: dc.Object, prefix: str = ""):
+    for name, member in obj.members.items():
+        if member.is_alias or member.is_module:
+            continue
+
+        yield prefix + name
+
+        if member.is_class:
+            yield from _member_qualnames(member, f"{prefix}{name}.")
+
+
+def collect_docs(module_name: str, qualnames: "list[str]") -> "dict[str, str | None]":
+    """Import a module, and return the __doc__ of objects in it.
+
+    Parameters
+    ----------
+    module_name:
+        Name of the module to import.
+    qualnames:
+        Paths to objects within the module, e.g. "SomeClass.some_method".
+        Objects that do not exist (e.g. attributes that are only type
+        annotations) are left out of the result.
+    """
+
+    py_mod = importlib.import_module(module_name)
+
+    res = {}
+    for qualname in qualnames:
+        py_obj = py_mod
+        for name in qualname.split("."):
+            py_obj = getattr(py_obj, name, MISSING)
+            if py_obj is MISSING:
+                break
+        else:
+            res[qualname] = py_obj.__doc__
+
+    return res
+
+
+def dynamic_docs(obj: dc.Object) -> "DynamicDocs | None":
+    """Return the dynamic docs memo for the loader an object came from, if any."""
+
+    try:
+        collection = obj.modules_collection
+    except ValueError:
+        return None
+
+    return getattr(collection, "dynamic_docs", None)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import logging
+
+from .._griffe_compat import dataclasses as dc
+
+_log = logging.getLogger(__name__)
+
+
+class InheritedMembers:
+    """Inherited members of classes, shared by everything using the same loader.
+
+    Griffe computes the inherited members of a class each time they are used,
+    walking its whole MRO (which is itself recomputed from every base). Since
+    looking up a method through a class (e.g. ``SomeClass.some_method``) lists
+    all its members, documenting deep class hierarchies with inherited members
+    repeats this work for every member of every class. This table records the
+    members each class resolves to (its own, and the ones it inherits), and
+    builds the table of a class with a single base from its base's table.
+
+    The table is cleared by its loader whenever modules are loaded, reloaded,
+    or dropped, since these can change a class's bases or members.
+
+    Attributes
+    ----------
+    hits:
+        Number of classes whose members came from the table.
+    misses:
+        Number of classes whose members were computed.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+        # class path -> (class, {name: member defined on the class or a base})
+        self._resolved: "dict[str, tuple[dc.Class, dict]]" = {}
+
+        # class path -> (class, {name: alias to an inherited member})
+        self._inherited: "dict[str, tuple[dc.Class, dict[str, dc.Alias]]]" = {}
+
+    def __reduce__(self):
+        # pickled objects (e.g. in the blueprint cache) carry their modules
+        # collection along, but not its memo tables.
+        return (InheritedMembers, ())
+
+    def clear(self):
+        self._resolved.clear()
+        self._inherited.clear()
+
+    def inherited_members(self, cls: dc.Class) -> "dict[str, dc.Alias]":
+        """Return the members a class inherits, like griffe's Class.inherited_members."""
+
+        entry = self._inherited.get(cls.path)
+        if entry is not None and entry[0] is cls:
+            self.hits += 1
+            return entry[1]
+
+        try:
+            resolved = self._resolve(cls, ())
+        except ValueError as e:
+            # e.g. an inheritance cycle
+            _log.debug(e)
+            return {}
+
+        self.misses += 1
+
+        res = {
+            name: dc.Alias(name, member, parent=cls, inherited=True)
+            for name, member in resolved.items()
+            if name not in cls.members
+        }
+
+        self._inherited[cls.path] = (cls, res)
+        return res
+
+    def all_members(self, obj: dc.Class | dc.Alias) -> dict:
+        """Return the declared and inherited members of a class, or an alias to one."""
+
+        if isinstance(obj, dc.Alias):
+            from .aliases import final_target
+
+            target = final_target(obj)
+            if not isinstance(target, dc.Class):
+                return obj.all_members
+
+            # members of an alias are aliases themselves, so their paths
+            # go through it
+            inherited = {
+                name: dc.Alias(name, member, parent=obj, inherited=True)
+                for name, member in self.inherited_members(target).items()
+            }
+            return {**inherited, **obj.members}
+
+        return {**self.inherited_members(obj), **obj.members}
+
+    def member(self, cls: dc.Class, name: str) -> "dc.Object | dc.Alias":
+        """Return a declared or inherited member of a class, raising a KeyError if missing."""
+
+        if name in cls.members:
+            return cls.members[name]
+
+        return self.inherited_members(cls)[name]
+
+    def _resolve(self, cls: dc.Class, seen: "tuple[str, ...]") -> dict:
+        entry = self._resolved.get(cls.path)
+        if entry is not None and entry[0] is cls:
+            return entry[1]
+
+        if cls.path in seen:
+            cycle = " -> ".join([*seen, cls.path])
+            raise ValueError(
+                f"Cannot resolve members, inheritance cycle detected: {cycle}"
+            )
+
+        bases = [base for base in cls.resolved_bases if base.is_class]
+
+        if len(bases) == 1:
+            # with a single base, the MRO is the base followed by its MRO, so
+            # its resolved members can be extended.
+            res = {**self._resolve(bases[0], (*seen, cls.path)), **cls.members}
+        else:
+            # griffe's MRO is needed to order multiple bases
+            res = {}
+            for base in reversed(cls.mro()):
+                res.update(base.members)
+            res.update(cls.members)
+
+        self._resolved[cls.path] = (cls, res)
+        return res
+
+
+def inherited_table(obj: dc.Object | dc.Alias) -> "InheritedMembers | None":
+    """Return the inherited members table for the loader an object came from, if it has one."""
+
+    try:
+        collection = obj.modules_collection
+    except ValueError:
+        # objects that are not attached to a package
+        return None
+
+    return getattr(collection, "inherited", None)
+
+
+def all_members(obj: dc.Object | dc.Alias) -> dict:
+    """Return the declared and inherited members of an object, using a table if possible."""
+
+    if not obj.is_class:
+        return obj.members
+
+    table = inherited_table(obj)
+    if table is None:
+        return obj.all_members
+
+    return table.all_members(obj)
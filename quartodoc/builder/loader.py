@@ -0,0 +1,940 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from dataclasses import dataclass, fields
+from functools import wraps
+from pathlib import Path
+from typing import Sequence
+
+from .._griffe_compat import dataclasses as dc
+from .._griffe_compat import expressions as exprs
+from .._griffe_compat import (
+    GriffeLoader,
+    JSONEncoder,
+    ModulesCollection,
+    LinesCollection,
+    LoadingError,
+    Package,
+    Parser,
+    json_decoder,
+)
+from quartodoc.parsers import get_parser_defaults
+from quartodoc.profiling import profile_span
+
+from .aliases import AliasTable
+from .dynamic import DynamicDocs
+from .inherited import InheritedMembers
+from .parse_cache import ParseCache
+
+
+_log = logging.getLogger(__name__)
+
+
+SNAPSHOT_VERSION = 1
+
+
+def _locked(f):
+    """Hold a loader's lock while calling one of its methods."""
+
+    @wraps(f)
+    def wrapper(self, *args, **kwargs):
+        with self.lock:
+            return f(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _file_hash(fname: "str | Path") -> "str | None":
+    try:
+        return hashlib.sha256(Path(fname).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _mtime(fname: "str | Path") -> "float | None":
+    try:
+        return os.stat(fname).st_mtime
+    except OSError:
+        return None
+
+
+def _module_files(p_dir: "str | Path") -> "set[str]":
+    """Return the names of files and folders in a directory that may be modules."""
+
+    try:
+        entries = os.listdir(p_dir)
+    except OSError:
+        return set()
+
+    return {name for name in entries if Path(name).suffix in {".py", ".pyi", ""}}
+
+
+def _snapshot_versions() -> dict:
+    from importlib_metadata import version
+
+    return {"snapshot": SNAPSHOT_VERSION, "griffe": version("griffe")}
+
+
+def _snapshot_valid(files: "dict[str, _FileState]", dirs: "dict[str, _DirState]"):
+    for fname, state in files.items():
+        mtime = _mtime(fname)
+        if mtime != state.mtime:
+            if _file_hash(fname) != state.hash:
+                return False
+
+            state.mtime = mtime
+
+    for p_dir, state in dirs.items():
+        if _module_files(p_dir) != state.files:
+            return False
+
+        state.mtime = _mtime(p_dir)
+
+    return True
+
+
+def _attach_expr_parent(expr, parent: "dc.Object | exprs.ExprName"):
+    """Set the scope names in an expression are resolved in."""
+
+    if isinstance(expr, list):
+        for child in expr:
+            _attach_expr_parent(child, parent)
+    elif isinstance(expr, exprs.ExprName):
+        expr.parent = parent
+    elif isinstance(expr, exprs.ExprAttribute):
+        # in a.b.c, the name b is resolved on a, and c on b
+        _attach_expr_parent(expr.values[0], parent)
+        for prev, value in zip(expr.values, expr.values[1:]):
+            if isinstance(value, exprs.ExprName):
+                value.parent = prev
+    elif isinstance(expr, exprs.Expr):
+        for field in fields(expr):
+            _attach_expr_parent(getattr(expr, field.name), parent)
+
+
+def _attach_parents(obj: dc.Object):
+    # griffe's json decoder does not fully attach expressions to the scope they
+    # were defined in, which is needed to resolve the names in them.
+    scope = obj.parent
+    if isinstance(obj, dc.Class):
+        _attach_expr_parent(obj.bases, scope)
+        _attach_expr_parent([dec.value for dec in obj.decorators], scope)
+    elif isinstance(obj, dc.Function):
+        _attach_expr_parent([dec.value for dec in obj.decorators], scope)
+        for param in obj.parameters:
+            _attach_expr_parent([param.annotation, param.default], scope)
+        _attach_expr_parent(obj.returns, scope)
+    elif isinstance(obj, dc.Attribute):
+        _attach_expr_parent([obj.annotation, obj.value], scope)
+
+
+def _iter_modules(mod: dc.Module):
+    yield mod
+    for member in mod.members.values():
+        if not member.is_alias and member.is_module:
+            yield from _iter_modules(member)
+
+
+def _iter_objects(obj: dc.Object):
+    yield obj
+    for member in obj.members.values():
+        if not member.is_alias:
+            yield from _iter_objects(member)
+
+
+def _key_parts(key: "str | Sequence[str]") -> "list[str]":
+    return key.split(".") if isinstance(key, str) else list(key)
+
+
+class _SharedModulesCollection(ModulesCollection):
+    """A modules collection with memo tables, that may load missing submodules.
+
+    In lazy mode, submodules are loaded the first time they are looked up.
+    """
+
+    def __init__(self, loader: SharedLoader):
+        super().__init__()
+        self._loader = loader
+        self.aliases = AliasTable()
+        self.inherited = InheritedMembers()
+        self.dynamic_docs = DynamicDocs()
+        self.parsed_docs = ParseCache()
+
+    def __getitem__(self, key):
+        try:
+            return self._get_path(key)
+        except KeyError:
+            if not self._loader.load_path(key):
+                raise
+
+        return self._get_path(key)
+
+    def _get_path(self, key):
+        # griffe lists every member of a class (including inherited ones) to
+        # look up one of them, so look up members of classes in the table.
+        parts = _key_parts(key)
+        obj = self.members[parts[0]]
+        for ii, name in enumerate(parts[1:], 1):
+            if isinstance(obj, dc.Alias):
+                return obj[parts[ii:]]
+            elif isinstance(obj, dc.Class):
+                obj = self.inherited.member(obj, name)
+            else:
+                obj = obj.members[name]
+
+        return obj
+
+    def clear_memos(self):
+        """Clear memo tables that depend on how objects are linked together."""
+
+        self.aliases.clear()
+        self.inherited.clear()
+
+    def get_member(self, key):
+        try:
+            return super().get_member(key)
+        except KeyError:
+            if not self._loader.load_path(key):
+                raise
+
+        return super().get_member(key)
+
+
+@dataclass
+class _FileState:
+    module: str
+    mtime: "float | None"
+    hash: "str | None"
+
+
+@dataclass
+class _DirState:
+    root: str
+    mtime: "float | None"
+    files: "set[str]"
+
+
+class SharedLoader(GriffeLoader):
+    """A griffe loader that is reused across builds.
+
+    Rather than re-parsing whole packages for every build, call refresh to
+    reload only the modules whose source files changed since they were loaded.
+    Files are first checked by modification time, then by content hash, so
+    touching a file without changing it does not reload anything.
+
+    Parameters
+    ----------
+    parser:
+        Docstring parser to use.
+    lazy:
+        Whether to load only the submodules of a package that are looked up.
+        Loading a package then parses just its top-level module, and submodules
+        are parsed the first time they are needed (e.g. to fetch an object, or
+        resolve an alias pointing into them).
+    external_include:
+        Names of the only external packages that may be loaded to resolve aliases
+        (e.g. for objects a package imports from numpy). By default, any package
+        may be loaded.
+    external_exclude:
+        Names of external packages that are never loaded to resolve aliases.
+    external_submodules:
+        Whether to load only the module of an external package that an alias
+        points to, rather than the whole package.
+
+    Attributes
+    ----------
+    n_loads:
+        Number of packages loaded.
+    n_modules:
+        Number of modules parsed, including reloads.
+    n_reloads:
+        Number of modules reloaded by refresh, because their source changed.
+    lock:
+        A reentrant lock, held while modules are loaded, reloaded, or dropped.
+        Threads that use loaded objects while others may load modules (e.g. when
+        blueprinting in parallel) should hold it too.
+    """
+
+    def __init__(
+        self,
+        parser: str = "numpy",
+        lazy: bool = False,
+        external_include: "list[str] | None" = None,
+        external_exclude: "list[str] | None" = None,
+        external_submodules: bool = False,
+    ):
+        self.lock = threading.RLock()
+
+        self.lazy = lazy
+        self.external_include = external_include
+        self.external_exclude = external_exclude or []
+        self.external_submodules = external_submodules
+
+        super().__init__(
+            docstring_parser=Parser(parser),
+            docstring_options=get_parser_defaults(parser),
+            modules_collection=_SharedModulesCollection(self),
+            lines_collection=LinesCollection(),
+        )
+
+        self.n_loads = 0
+        self.n_modules = 0
+        self.n_reloads = 0
+
+        self._files: "dict[str, _FileState]" = {}
+        self._dirs: "dict[str, _DirState]" = {}
+
+        # packages (or modules) that failed to load, mapped to the error
+        self._failed: "dict[str, str]" = {}
+
+        # external packages loaded one module at a time, and the paths of their
+        # packages whose __init__ module has not been loaded
+        self._partial: "set[str]" = set()
+        self._placeholders: "set[str]" = set()
+
+        # packages loaded only to resolve aliases
+        self._external: "set[str]" = set()
+
+    def __getstate__(self):
+        # objects pickled along with their loader (e.g. in the blueprint cache)
+        # can't include its lock
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+
+    # loading ----
+
+    @_locked
+    def load(self, objspec=None, /, **kwargs):
+        root = str(objspec).split(".", 1)[0]
+        is_new = root not in self.modules_collection
+
+        if root in self._failed:
+            raise ModuleNotFoundError(f"Failed to load {root}: {self._failed[root]}")
+
+        if self.lazy:
+            kwargs["submodules"] = False
+
+        try:
+            res = super().load(objspec, **kwargs)
+        except (ImportError, LoadingError) as e:
+            self._failed[root] = f"{type(e).__name__}: {e}"
+            raise
+
+        if is_new and root in self.modules_collection.members:
+            self.n_loads += 1
+            for mod in _iter_modules(self.modules_collection.members[root]):
+                self._track(mod)
+
+        return res
+
+    def _post_load(self, module: dc.Module, obj_path: str):
+        if self.lazy:
+            self._load_alias_targets(module)
+
+        return super()._post_load(module, obj_path)
+
+    def _load_module(self, *args, **kwargs) -> dc.Module:
+        self.n_modules += 1
+        self.modules_collection.clear_memos()
+        return super()._load_module(*args, **kwargs)
+
+    @property
+    def aliases(self) -> AliasTable:
+        """Memoized alias resolution for loaded objects (see AliasTable)."""
+
+        return self.modules_collection.aliases
+
+    @property
+    def inherited(self) -> InheritedMembers:
+        """Memoized inherited members of loaded classes (see InheritedMembers)."""
+
+        return self.modules_collection.inherited
+
+    @property
+    def dynamic_docs(self) -> DynamicDocs:
+        """Memoized dynamic imports, for dynamic docstrings (see DynamicDocs)."""
+
+        return self.modules_collection.dynamic_docs
+
+    @property
+    def parsed_docs(self) -> ParseCache:
+        """Parsed docstring sections for loaded objects (see ParseCache)."""
+
+        return self.modules_collection.parsed_docs
+
+    @_locked
+    def load_path(self, key: "str | Sequence[str]") -> bool:
+        """Load any missing submodules along an object path, in lazy mode.
+
+        Returns whether any modules were loaded. Note that only packages that
+        have already been loaded are searched for submodules.
+        """
+
+        parts = _key_parts(key)
+        if (
+            not self.lazy
+            or parts[0] not in self.modules_collection.members
+            or parts[0] in self._partial
+        ):
+            return False
+
+        loaded = False
+        mod = self.modules_collection.members[parts[0]]
+        for name in parts[1:]:
+            member = mod.members.get(name)
+            if member is None:
+                member = self._load_submodule_lazy(mod, name)
+                if member is None:
+                    break
+
+                loaded = True
+            elif member.is_alias or not member.is_module:
+                break
+
+            mod = member
+
+        return loaded
+
+    @_locked
+    def load_external(self, path: str) -> bool:
+        """Load the package an alias target lives in, returning whether it's loaded.
+
+        Each package is only attempted once, so failures (e.g. a package that
+        isn't installed) are not retried for every alias that points to it.
+        Packages excluded by external_include or external_exclude are never
+        loaded.
+
+        Parameters
+        ----------
+        path:
+            Path to the alias target, e.g. "numpy.ndarray".
+        """
+
+        root = path.split(".", 1)[0]
+
+        if root in self._partial:
+            return self._load_external_module(path)
+        elif root in self.modules_collection.members:
+            return True
+        elif root in self._failed:
+            return False
+
+        if (
+            self.external_include is not None and root not in self.external_include
+        ) or root in self.external_exclude:
+            _log.info(f"Not loading excluded external package {root} (for {path})")
+            self._failed[root] = "excluded from external packages"
+            return False
+
+        self._external.add(root)
+
+        with profile_span("griffe load", module=root):
+            if self.external_submodules:
+                return self._load_external_module(path)
+
+            try:
+                self.load(root, try_relative_path=False)
+            except (ImportError, LoadingError) as e:
+                _log.warning(f"Could not load external package {root}: {e}")
+                return False
+
+        return True
+
+    def _load_external_module(self, path: str) -> bool:
+        parts = path.split(".")
+        root = parts[0]
+
+        if root not in self.modules_collection.members:
+            try:
+                package = self.finder.find_package(root)
+            except ModuleNotFoundError as e:
+                _log.warning(f"Could not load external package {root}: {e}")
+                self._failed[root] = f"{type(e).__name__}: {e}"
+                return False
+
+            if (
+                not isinstance(package, Package)
+                or package.path.name != "__init__.py"
+                or package.stubs
+            ):
+                # single module packages, or those that griffe merges with stubs
+                try:
+                    self.load(root, try_relative_path=False)
+                except (ImportError, LoadingError) as e:
+                    _log.warning(f"Could not load external package {root}: {e}")
+                    return False
+
+                return True
+
+            # stand in for the package, without parsing its __init__ module
+            self.modules_collection.set_member(
+                root, self._create_module(root, package.path)
+            )
+            self.modules_collection.clear_memos()
+            self._partial.add(root)
+            self._placeholders.add(root)
+            self.n_loads += 1
+
+        # walk the path, loading only the module that holds the target
+        mod = self.modules_collection.members[root]
+        for name in parts[1:]:
+            sub_path = f"{mod.path}.{name}"
+            member = mod.members.get(name)
+
+            # note that importing a submodule (e.g. from . import x) creates an
+            # alias to it, until the submodule itself is loaded
+            if member is not None and not (
+                member.is_alias and member.target_path == sub_path
+            ):
+                if member.is_alias or not member.is_module:
+                    break
+
+                mod = member
+                continue
+
+            if mod.filepath.name != "__init__.py":
+                break
+
+            p_dir = mod.filepath.parent
+            if (p_dir / name / "__init__.py").is_file():
+                submod = self._create_module(name, p_dir / name / "__init__.py")
+                mod.set_member(name, submod)
+                self.modules_collection.clear_memos()
+                self._placeholders.add(sub_path)
+                mod = submod
+            elif (p_dir / f"{name}.py").is_file():
+                return self._load_external_file(mod, name, p_dir / f"{name}.py")
+            else:
+                break
+
+        # the target is defined (or imported) in a package's __init__ module
+        if mod.path in self._placeholders:
+            return self._load_external_file(mod.parent, mod.name, mod.filepath)
+
+        return False
+
+    def _load_external_file(
+        self, parent: "dc.Module | None", name: str, filepath: Path
+    ):
+        path = f"{parent.path}.{name}" if parent is not None else name
+        if path in self._failed:
+            return False
+
+        _log.info(f"Loading external module {path}")
+
+        old = (
+            self.modules_collection.get_member(path)
+            if path in self._placeholders
+            else None
+        )
+
+        try:
+            new = self._load_module(name, filepath, submodules=False, parent=parent)
+        except LoadingError as e:
+            _log.warning(f"Could not load external module {path}: {e}")
+            self._failed[path] = f"{type(e).__name__}: {e}"
+            return False
+
+        # carry over any submodules loaded into a placeholder for this module
+        if old is not None:
+            self._placeholders.remove(path)
+            for sub_name, member in old.members.items():
+                new.set_member(sub_name, member)
+
+        if parent is not None:
+            parent.set_member(name, new)
+        else:
+            self.modules_collection.set_member(name, new)
+
+        return True
+
+    @_locked
+    def load_submodules(self, mod: dc.Module):
+        """Load the direct submodules of a module, in lazy mode.
+
+        Modules hold their submodules as members, so this is needed before listing
+        a module's members.
+        """
+
+        if not self.lazy:
+            return
+
+        for p_dir in self._package_dirs(mod):
+            for fname in sorted(_module_files(p_dir)):
+                name = Path(fname).stem
+                if name != "__init__" and name not in mod.members:
+                    self._load_submodule_lazy(mod, name)
+
+    @staticmethod
+    def _package_dirs(mod: dc.Module) -> "list[Path]":
+        filepath = mod.filepath
+        if isinstance(filepath, list):
+            return filepath
+        elif filepath is not None and filepath.stem == "__init__":
+            return [filepath.parent]
+
+        return []
+
+    def _load_submodule_lazy(self, mod: dc.Module, name: str) -> "dc.Module | None":
+        # griffe merges a module with its stub file, when both are set as a member
+        candidates = [
+            p
+            for p_dir in self._package_dirs(mod)
+            for p in [p_dir / name / "__init__.py", p_dir / f"{name}.py"]
+            + [p_dir / name / "__init__.pyi", p_dir / f"{name}.pyi"]
+            if p.is_file()
+        ]
+
+        if not candidates:
+            return None
+
+        _log.info(f"Lazily loading module {mod.path}.{name}")
+
+        for filepath in candidates:
+            submod = self._load_module(name, filepath, submodules=False, parent=mod)
+            mod.set_member(name, submod)
+            self._track(submod)
+
+        submod = mod.members[name]
+        self._load_alias_targets(submod)
+        self.expand_exports(submod)
+        self.expand_wildcards(submod, external=False)
+
+        return submod
+
+    def _load_alias_targets(self, mod: dc.Module):
+        # griffe resolves aliases while iterating over members (e.g. to check
+        # whether they are modules), so load the modules they point to up front,
+        # rather than adding members to a module mid-iteration.
+        for member in list(mod.members.values()):
+            if member.is_alias:
+                self.load_path(member.target_path)
+
+    def _track(self, mod: dc.Module):
+        filepath = mod.filepath
+        if not isinstance(filepath, Path):
+            # namespace packages have a list of directories, but no file
+            return
+
+        root = mod.path.split(".", 1)[0]
+        fname = str(filepath.resolve())
+        self._files[fname] = _FileState(mod.path, _mtime(fname), _file_hash(fname))
+
+        # track which modules a package's folder holds, to catch added files
+        if filepath.stem == "__init__":
+            p_dir = str(Path(fname).parent)
+            self._dirs[p_dir] = _DirState(root, _mtime(p_dir), _module_files(p_dir))
+
+    def _untrack(self, root_name: str):
+        self._files = {
+            k: v
+            for k, v in self._files.items()
+            if v.module.split(".", 1)[0] != root_name
+        }
+        self._dirs = {k: v for k, v in self._dirs.items() if v.root != root_name}
+
+    # snapshots ----
+
+    def save_snapshot(self, path: "str | Path", packages: "list[str] | None" = None):
+        """Save loaded packages to a JSON file, so they can be restored without parsing.
+
+        Parameters
+        ----------
+        path:
+            Path of the snapshot file.
+        packages:
+            Names of the packages to save. By default, every package that was
+            not only loaded to resolve aliases.
+        """
+
+        if packages is None:
+            packages = [
+                name
+                for name in self.modules_collection.members
+                if name not in self._external and name not in self._partial
+            ]
+
+        snapshot = {
+            "versions": _snapshot_versions(),
+            "packages": {
+                name: self.modules_collection.members[name] for name in packages
+            },
+            "files": {
+                fname: {
+                    "module": state.module,
+                    "mtime": state.mtime,
+                    "hash": state.hash,
+                }
+                for fname, state in self._files.items()
+                if state.module.split(".", 1)[0] in packages
+            },
+            "dirs": {
+                p_dir: {
+                    "root": state.root,
+                    "mtime": state.mtime,
+                    "files": sorted(state.files),
+                }
+                for p_dir, state in self._dirs.items()
+                if state.root in packages
+            },
+        }
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(json.dumps(snapshot, cls=JSONEncoder))
+
+        _log.info(f"Saved snapshot of {packages} to {path}")
+
+    @_locked
+    def load_snapshot(self, path: "str | Path", validate: bool = True) -> "list[str]":
+        """Restore packages from a snapshot file, returning the names of those restored.
+
+        Parameters
+        ----------
+        path:
+            Path of the snapshot file.
+        validate:
+            Whether to check that the source files of each package are unchanged
+            since the snapshot was saved. Packages with changed files are skipped,
+            so they are parsed from source when needed. If False, every package is
+            restored, and their source files are not tracked for refresh.
+        """
+
+        snapshot = json.loads(Path(path).read_text(), object_hook=json_decoder)
+
+        if snapshot.get("versions") != _snapshot_versions():
+            log = _log.info if validate else _log.warning
+            log(f"Ignoring snapshot {path} created by different package versions.")
+            return []
+
+        files = {
+            fname: _FileState(**state) for fname, state in snapshot["files"].items()
+        }
+        dirs = {
+            p_dir: _DirState(state["root"], state["mtime"], set(state["files"]))
+            for p_dir, state in snapshot["dirs"].items()
+        }
+
+        restored = []
+        for name, mod in snapshot["packages"].items():
+            if name in self.modules_collection.members:
+                continue
+
+            pkg_files = {
+                k: v for k, v in files.items() if v.module.split(".", 1)[0] == name
+            }
+            pkg_dirs = {k: v for k, v in dirs.items() if v.root == name}
+            if validate and not _snapshot_valid(pkg_files, pkg_dirs):
+                _log.info(
+                    f"Not restoring {name} from snapshot, since its source changed."
+                )
+                continue
+
+            mod._modules_collection = self.modules_collection
+            mod._lines_collection = self.lines_collection
+            for obj in _iter_objects(mod):
+                if obj.docstring is not None:
+                    obj.docstring.parser = self.docstring_parser
+                    obj.docstring.parser_options = self.docstring_options
+
+                _attach_parents(obj)
+
+            self.modules_collection.set_member(name, mod)
+            self.modules_collection.clear_memos()
+            self.dynamic_docs.invalidate(name)
+            if validate:
+                self._files.update(pkg_files)
+                self._dirs.update(pkg_dirs)
+
+            restored.append(name)
+
+        _log.info(f"Restored {restored} from snapshot {path}")
+
+        return restored
+
+    # refreshing ----
+
+    def changed_files(self, candidates: "list[str] | None" = None) -> "list[str]":
+        """Return tracked source files whose content changed since they were loaded.
+
+        Parameters
+        ----------
+        candidates:
+            Files known to have been edited. These are compared by content hash,
+            even if their modification time appears unchanged.
+        """
+
+        candidates = {str(Path(fname).resolve()) for fname in candidates or []}
+
+        changed = []
+        for fname, state in self._files.items():
+            mtime = _mtime(fname)
+            if mtime == state.mtime and fname not in candidates:
+                continue
+
+            state.mtime = mtime
+            new_hash = _file_hash(fname)
+            if new_hash != state.hash:
+                state.hash = new_hash
+                changed.append(fname)
+
+        return changed
+
+    def _changed_packages(self) -> "set[str]":
+        changed = set()
+        for p_dir, state in self._dirs.items():
+            mtime = _mtime(p_dir)
+            if mtime == state.mtime:
+                continue
+
+            # editors often save by renaming temporary files, which changes the
+            # folder's mtime, so check whether module files were added or removed
+            state.mtime = mtime
+            if _module_files(p_dir) != state.files:
+                changed.add(state.root)
+
+        return changed
+
+    @_locked
+    def refresh(self, candidates: "list[str] | None" = None) -> "list[str]":
+        """Reload modules whose source files changed, returning their paths.
+
+        Modules are reloaded individually where possible. If a package gains or
+        loses a module file, or a changed module can't be reloaded on its own
+        (e.g. it has a stub file), its whole package is dropped, and loaded again
+        on next use.
+
+        Parameters
+        ----------
+        candidates:
+            Files known to have been edited (see changed_files).
+        """
+
+        # packages that failed to load (e.g. due to a syntax error) may be fixed
+        self.clear_failures()
+
+        to_drop = self._changed_packages()
+        to_reload = []
+        for fname in self.changed_files(candidates):
+            module = self._files[fname].module
+            root_name = module.split(".", 1)[0]
+            if root_name in to_drop:
+                continue
+            elif self._has_stubs(fname) or not self._reload_module(module):
+                to_drop.add(root_name)
+            else:
+                to_reload.append(module)
+
+        for root_name in to_drop:
+            self.drop(root_name)
+
+        if to_reload:
+            # re-expand exports and wildcard imports, which may span modules
+            for root_name in {mod.split(".", 1)[0] for mod in to_reload} - to_drop:
+                root = self.modules_collection[root_name]
+                self.expand_exports(root)
+                self.expand_wildcards(root, external=False)
+
+        return sorted(to_reload) + sorted(to_drop)
+
+    @_locked
+    def update_search_paths(self) -> "list[str]":
+        """Search for packages in the current sys.path (e.g. after it changed).
+
+        Loaded packages that are now found somewhere else (or not at all) are
+        dropped, so they are loaded from their new location on next use. Returns
+        the names of dropped packages.
+        """
+
+        self.finder = type(self.finder)()
+
+        moved = []
+        for name, mod in list(self.modules_collection.members.items()):
+            if not isinstance(mod.filepath, Path):
+                continue
+
+            try:
+                package = self.finder.find_package(name)
+            except ModuleNotFoundError:
+                package = None
+
+            if package is None or not isinstance(package.path, Path):
+                moved.append(name)
+            elif package.path.resolve() != mod.filepath.resolve():
+                moved.append(name)
+
+        for name in moved:
+            self.drop(name)
+
+        return moved
+
+    def clear_failures(self):
+        """Forget packages that failed to load, so they are attempted again."""
+
+        self._failed = {}
+
+    @_locked
+    def drop(self, root_name: str):
+        """Remove a package from the loader, so it is loaded from scratch next time."""
+
+        _log.info(f"Dropping package {root_name} from loader")
+
+        self.modules_collection.members.pop(root_name, None)
+        self._untrack(root_name)
+        self._failed.pop(root_name, None)
+        self.modules_collection.clear_memos()
+        self.dynamic_docs.invalidate(root_name)
+
+        self._partial.discard(root_name)
+        self._external.discard(root_name)
+        self._placeholders = {
+            path for path in self._placeholders if path.split(".", 1)[0] != root_name
+        }
+
+    @staticmethod
+    def _has_stubs(fname: str) -> bool:
+        # griffe merges stub files with their modules, so a module with stubs
+        # can't be reloaded on its own.
+        p_file = Path(fname)
+        return p_file.suffix != ".py" or p_file.with_suffix(".pyi").exists()
+
+    def _reload_module(self, path: str) -> bool:
+        try:
+            old = self.modules_collection.get_member(path)
+        except KeyError:
+            return False
+
+        if old.is_alias or not old.is_module:
+            return False
+
+        _log.info(f"Reloading module {path}")
+
+        # aliases elsewhere that resolved to objects in the old module would
+        # keep pointing to them, so unresolve them.
+        for obj in _iter_objects(old):
+            for alias in obj.aliases.values():
+                alias._target = None
+
+        parent = old.parent
+        new = self._load_module(old.name, old.filepath, submodules=False, parent=parent)
+
+        # packages hold their submodules as members, so carry them over
+        for name, member in old.members.items():
+            if not member.is_alias and member.is_module and name not in new.members:
+                new.set_member(name, member)
+
+        if parent is not None:
+            parent.set_member(old.name, new)
+
+        self.dynamic_docs.invalidate(path)
+        self.n_reloads += 1
+        return True
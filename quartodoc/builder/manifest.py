@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sys
+
+from pathlib import Path
+
+_log = logging.getLogger(__name__)
+
+
+MANIFEST_VERSION = 3
+
+
+def content_hash(content: "str | bytes") -> str:
+    if isinstance(content, str):
+        content = content.encode()
+
+    return hashlib.sha256(content).hexdigest()
+
+
+def _matches_stat(record: dict, stat: os.stat_result) -> bool:
+    return record["size"] == stat.st_size and record["mtime"] == stat.st_mtime_ns
+
+
+class Manifest:
+    """Record of the content hash of every file written by a build.
+
+    The manifest lets a build detect unchanged outputs without reading them back
+    from disk, so that files are only rewritten when their content changes. Each
+    hash is stored with the file's size and modification time, and is only
+    trusted while these match the file on disk. Otherwise (e.g. if a build
+    wrote the file, but crashed before saving the manifest), the file is read
+    back and compared. It also tracks which files were written by previous
+    builds, but not by the current one (e.g. pages for objects that were
+    removed).
+
+    Builders may also store a record for each top-level entry of the layout
+    (e.g. its index summary and inventory items), so that later builds can
+    reuse them without re-analyzing the entry.
+
+    Paths are stored relative to root (for written files), or to the sys.path
+    folder they are imported from (for source files), so a manifest can be
+    shared between machines.
+
+    Parameters
+    ----------
+    path:
+        Location of the manifest file. If None, the manifest is not saved, and
+        every file is compared with its new content directly.
+    root:
+        Folder that written files are recorded relative to. Defaults to the
+        current working directory.
+
+    Attributes
+    ----------
+    changed:
+        Files written during the current build, because their content changed.
+    loaded:
+        Whether a manifest saved by a previous build was loaded.
+    """
+
+    def __init__(self, path: "str | Path | None", root: "str | Path | None" = None):
+        self.path = Path(path) if path is not None else None
+        self.root = Path.cwd() if root is None else Path(root).absolute()
+
+        self.changed: "list[str]" = []
+        self.loaded = False
+
+        self._old: "dict[str, dict]" = {}
+        self._old_stale: "list[str]" = []
+        self._old_entries: "dict[str, dict]" = {}
+        self._new: "dict[str, dict]" = {}
+        self._new_entries: "dict[str, dict]" = {}
+        self._source_hashes: "dict[str, str | None]" = {}
+        self._search_dirs: "list[Path] | None" = None
+
+        self._load()
+
+    def _key(self, fname: "str | Path") -> str:
+        p_file = Path(fname)
+        if p_file.is_absolute():
+            try:
+                p_file = p_file.relative_to(self.root)
+            except ValueError:
+                pass
+
+        return p_file.as_posix()
+
+    def _file(self, key: str) -> Path:
+        return self.root / key
+
+    def _load(self):
+        if self.path is None or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            _log.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+            return
+
+        if data.get("version") != MANIFEST_VERSION:
+            return
+
+        self._old = data.get("files", {})
+        self._old_stale = data.get("stale", [])
+        self._old_entries = data.get("entries", {})
+        self.loaded = True
+
+    # writing files ----
+
+    def is_unchanged(self, fname: "str | Path", content: "str | bytes") -> bool:
+        """Return whether a file on disk already has the given content."""
+
+        return self._check(fname, content)[0]
+
+    def _check(self, fname, content) -> "tuple[bool, os.stat_result | None]":
+        try:
+            stat = os.stat(fname)
+        except OSError:
+            return False, None
+
+        record = self._old.get(self._key(fname))
+        if record is not None and _matches_stat(record, stat):
+            return record["hash"] == content_hash(content), stat
+
+        # the file was not written by a build we know about, or changed since,
+        # so compare directly.
+        raw = content.encode() if isinstance(content, str) else content
+        if stat.st_size != len(raw):
+            return False, stat
+
+        return Path(fname).read_bytes() == raw, stat
+
+    def write(self, fname: "str | Path", content: "str | bytes", force=False) -> bool:
+        """Write content to a file, unless it is unchanged since the last build.
+
+        Returns True if the file was written.
+        """
+
+        key = self._key(fname)
+        unchanged, stat = (False, None) if force else self._check(fname, content)
+
+        if not unchanged:
+            p_file = Path(fname)
+            p_file.parent.mkdir(parents=True, exist_ok=True)
+
+            if isinstance(content, str):
+                p_file.write_text(content)
+            else:
+                p_file.write_bytes(content)
+
+            stat = p_file.stat()
+            self.changed.append(key)
+
+        self._new[key] = {
+            "hash": content_hash(content),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+        }
+
+        return not unchanged
+
+    # entry records ----
+
+    def get_entry(self, key: str) -> "dict | None":
+        """Return the record for a layout entry, from this build or a previous one."""
+
+        return self._new_entries.get(key, self._old_entries.get(key))
+
+    def set_entry(self, key: str, record: dict):
+        """Store a record for a layout entry. It must be JSON serializable."""
+
+        self._new_entries[key] = record
+
+    def source_key(self, fname: "str | Path") -> str:
+        """Return the path of a source file, relative to the sys.path folder it is in.
+
+        Files outside every sys.path folder keep their absolute path.
+        """
+
+        p_file = Path(fname)
+        keys = []
+        for p_dir in self._get_search_dirs():
+            try:
+                keys.append(p_file.relative_to(p_dir))
+            except ValueError:
+                pass
+
+        if not keys:
+            return p_file.as_posix()
+
+        return min(keys, key=lambda key: len(key.parts)).as_posix()
+
+    def source_file(self, key: str) -> "str | None":
+        """Return the absolute path of a source file from its key (see source_key)."""
+
+        p_file = Path(key)
+        if p_file.is_absolute():
+            return str(p_file)
+
+        for p_dir in self._get_search_dirs():
+            if (p_dir / p_file).exists():
+                return str(p_dir / p_file)
+
+        return None
+
+    def source_hash(self, key: str) -> "str | None":
+        """Return the hash of a source file (or None if it does not exist)."""
+
+        if key not in self._source_hashes:
+            fname = self.source_file(key)
+            try:
+                self._source_hashes[key] = content_hash(Path(fname).read_bytes())
+            except (OSError, TypeError):
+                self._source_hashes[key] = None
+
+        return self._source_hashes[key]
+
+    def _get_search_dirs(self) -> "list[Path]":
+        if self._search_dirs is None:
+            dirs = [Path(p or ".").resolve() for p in sys.path]
+            self._search_dirs = list(dict.fromkeys(dirs))
+
+        return self._search_dirs
+
+    # reporting ----
+
+    @property
+    def written(self) -> "list[str]":
+        """All files produced by the current build (whether changed or not)."""
+
+        return list(self._new)
+
+    def stale(self) -> "list[str]":
+        """Files from previous builds, which the current build did not produce.
+
+        Only files that still exist on disk are included. Note that this is only
+        meaningful after a full build, since partial builds (e.g. using a filter)
+        do not produce every file.
+        """
+
+        candidates = [*self._old, *self._old_stale]
+        return sorted(
+            {k for k in candidates if k not in self._new and self._file(k).exists()}
+        )
+
+    # persisting ----
+
+    def save(self, prune: bool = True):
+        """Write the manifest to disk (if it has a path).
+
+        Parameters
+        ----------
+        prune:
+            Whether the current build produced every file. If True, files that
+            were not produced are recorded as stale, and records for entries
+            that were not set are dropped. Otherwise, records for them are kept
+            as-is.
+        """
+
+        if self.path is None:
+            return
+
+        if prune:
+            files = dict(self._new)
+            stale = self.stale()
+            entries = dict(self._new_entries)
+        else:
+            files = {**self._old, **self._new}
+            stale = [k for k in self._old_stale if k not in self._new]
+            entries = {**self._old_entries, **self._new_entries}
+
+        data = {
+            "version": MANIFEST_VERSION,
+            "files": files,
+            "stale": stale,
+            "entries": entries,
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(data, indent=2, sort_keys=True))
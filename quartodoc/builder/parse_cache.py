@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+import io
+import logging
+import pickle
+import weakref
+
+from pathlib import Path
+
+from .._griffe_compat import dataclasses as dc
+from .. import ast as qast
+
+_log = logging.getLogger(__name__)
+
+
+# patched sections (see quartodoc.ast.transform) for each docstring
+_PATCHED: "weakref.WeakKeyDictionary[dc.Docstring, list]" = weakref.WeakKeyDictionary()
+
+
+class ParseCache:
+    """Parsed docstring sections, shared by everything using the same loader.
+
+    Griffe parses a docstring the first time its sections are used, but
+    reloading a module (or restoring it from a snapshot) creates new docstrings,
+    which are parsed again. This cache records the parsed and patched sections
+    of each docstring, so unchanged docstrings are only parsed once, and can
+    optionally be saved to disk for later builds.
+
+    Entries are keyed by docstring text, parser, and parser options. Since
+    parsers fill in details like parameter annotations from the documented
+    object, the key also includes its path and signature. Entries store sections
+    with references to griffe objects replaced by their paths, so restored
+    sections point to the objects currently loaded.
+
+    Attributes
+    ----------
+    hits:
+        Number of docstrings whose sections came from the cache.
+    misses:
+        Number of docstrings that were parsed.
+    """
+
+    file_name = "docstrings.pickle"
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "dict[tuple, bytes]" = {}
+        self._used: "dict[tuple, bytes]" = {}
+
+    def __reduce__(self):
+        # pickled objects (e.g. in the blueprint cache) carry their modules
+        # collection along, but the cache is saved separately.
+        return (ParseCache, ())
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+    def fill(self, docstring: dc.Docstring, key: "tuple | None" = None):
+        """Set the parsed and patched sections of a docstring, parsing it if needed.
+
+        Parameters
+        ----------
+        docstring:
+            The docstring to fill.
+        key:
+            The docstring's cache key, if it was already computed (see cache_key).
+        """
+
+        if key is None:
+            key = cache_key(docstring)
+
+        data = self._entries.get(key)
+
+        if data is not None:
+            try:
+                parsed, patched = _loads(data, docstring.parent)
+            except (KeyError, ValueError, AttributeError, pickle.UnpicklingError):
+                # e.g. an object the sections refer to is no longer loaded
+                pass
+            else:
+                self.hits += 1
+                self._used[key] = data
+
+                # griffe caches parsed sections on the docstring
+                docstring.__dict__["parsed"] = parsed
+                _PATCHED[docstring] = patched
+                return
+
+        self.misses += 1
+
+        parsed = docstring.parsed
+        patched = _PATCHED[docstring] = qast.transform(parsed)
+
+        try:
+            data = _dumps((parsed, patched))
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            _log.debug(f"Not caching sections for {_path(docstring)}: {e}")
+            return
+
+        self._entries[key] = self._used[key] = data
+
+    def parse(self, docstrings: "list[dc.Docstring]") -> "dict[tuple, bytes]":
+        """Fill docstrings, and return their entries (e.g. to send to another process)."""
+
+        entries = {}
+        for docstring in docstrings:
+            key = cache_key(docstring)
+            self.fill(docstring, key)
+
+            if key in self._entries:
+                entries[key] = self._entries[key]
+
+        return entries
+
+    def update(self, entries: "dict[tuple, bytes]"):
+        """Add entries returned by parse."""
+
+        self._entries.update(entries)
+
+    # persisting ----
+
+    def load(self, cache_dir: "str | Path"):
+        """Add entries saved to a cache directory by a previous build."""
+
+        from .cache import _package_versions
+
+        p_cache = Path(cache_dir) / self.file_name
+        if not p_cache.exists():
+            return
+
+        try:
+            with p_cache.open("rb") as f:
+                versions, entries = pickle.load(f)
+        except Exception as e:
+            _log.warning(f"Ignoring unreadable docstring cache {p_cache}: {e}")
+            return
+
+        if versions != _package_versions():
+            _log.info("Ignoring docstring cache created by different package versions.")
+            return
+
+        self._entries = {**entries, **self._entries}
+
+    def save(self, cache_dir: "str | Path"):
+        """Save entries used since the cache was created to a cache directory.
+
+        Entries that were not used are dropped, so stale docstrings do not
+        accumulate in the cache.
+        """
+
+        from .cache import _package_versions
+
+        p_cache = Path(cache_dir) / self.file_name
+        p_cache.parent.mkdir(parents=True, exist_ok=True)
+
+        with p_cache.open("wb") as f:
+            pickle.dump(
+                (_package_versions(), self._used), f, protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+        _log.info(
+            f"Saved docstring cache to {p_cache} ({self.hits} hits, {self.misses} misses)"
+        )
+
+
+# Keys ========================================================================
+
+
+def _path(docstring: dc.Docstring) -> "str | None":
+    return getattr(docstring.parent, "path", None)
+
+
+def _str(x) -> "str | None":
+    return None if x is None else str(x)
+
+
+def _signature(obj: "dc.Object | dc.Alias | None") -> tuple:
+    """Return the parts of an object that parsers use to fill in docstrings."""
+
+    if obj is None:
+        return ()
+
+    parts = []
+    if isinstance(obj, (dc.Function, dc.Class)):
+        try:
+            params = obj.parameters
+        except (AttributeError, ValueError):
+            params = []
+
+        parts.append(
+            tuple(
+                (p.name, str(p.kind), _str(p.annotation), _str(p.default))
+                for p in params
+            )
+        )
+        parts.append(
+            tuple(
+                (p.name, _str(p.annotation), _str(p.default))
+                for p in getattr(obj, "type_parameters", [])
+            )
+        )
+
+    if isinstance(obj, dc.Function):
+        parts.append(_str(obj.returns))
+    elif isinstance(obj, dc.Attribute):
+        parts.append(_str(obj.annotation))
+    elif isinstance(obj, (dc.Class, dc.Module)):
+        # used by attributes sections
+        parts.append(
+            tuple(
+                (name, _str(member.annotation))
+                for name, member in obj.members.items()
+                if not member.is_alias and member.is_attribute
+            )
+        )
+
+    return tuple(parts)
+
+
+def cache_key(docstring: dc.Docstring) -> tuple:
+    """Return the key a docstring's sections are stored under in a ParseCache."""
+
+    parser = docstring.parser
+    options = docstring.parser_options or {}
+
+    return (
+        docstring.value,
+        getattr(parser, "value", parser),
+        tuple(sorted((k, repr(v)) for k, v in options.items())),
+        _path(docstring),
+        _signature(docstring.parent),
+    )
+
+
+# Pickling ====================================================================
+# Sections refer to griffe objects (e.g. the scope used to resolve names in an
+# annotation). These are stored as paths, and looked up again when loaded.
+
+
+class _SectionPickler(pickle.Pickler):
+    def persistent_id(self, obj):
+        if isinstance(obj, (dc.Object, dc.Alias)):
+            return obj.path
+
+        return None
+
+
+class _SectionUnpickler(pickle.Unpickler):
+    def __init__(self, f, parent: "dc.Object | dc.Alias"):
+        super().__init__(f)
+        self._parent = parent
+        self._objects = {}
+
+    def persistent_load(self, pid):
+        if self._parent is None:
+            raise KeyError(pid)
+
+        if pid == self._parent.path:
+            return self._parent
+
+        # sections often refer to the same scope many times (e.g. in annotations)
+        if pid not in self._objects:
+            self._objects[pid] = self._parent.modules_collection[pid]
+
+        return self._objects[pid]
+
+
+def _dumps(x) -> bytes:
+    f = io.BytesIO()
+    _SectionPickler(f, protocol=pickle.HIGHEST_PROTOCOL).dump(x)
+    return f.getvalue()
+
+
+def _loads(data: bytes, parent: "dc.Object | dc.Alias | None"):
+    return _SectionUnpickler(io.BytesIO(data), parent).load()
+
+
+# Public API ==================================================================
+
+
+def parse_cache(docstring: dc.Docstring) -> "ParseCache | None":
+    """Return the parse cache for the loader a docstring came from, if it has one."""
+
+    try:
+        collection = docstring.parent.modules_collection
+    except (AttributeError, ValueError):
+        return None
+
+    return getattr(collection, "parsed_docs", None)
+
+
+def parsed_sections(docstring: dc.Docstring) -> list:
+    """Return the parsed sections of a docstring, using a parse cache if possible."""
+
+    if "parsed" not in docstring.__dict__:
+        cache = parse_cache(docstring)
+        if cache is not None:
+            cache.fill(docstring)
+
+    return docstring.parsed
+
+
+def patched_sections(docstring: dc.Docstring) -> list:
+    """Return the parsed sections of a docstring, patched by quartodoc.ast.transform."""
+
+    res = _PATCHED.get(docstring)
+    if res is None:
+        # filling from a parse cache also sets the patched sections
+        parsed = parsed_sections(docstring)
+
+        res = _PATCHED.get(docstring)
+        if res is None:
+            res = _PATCHED[docstring] = qast.transform(parsed)
+
+    return res
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from ..parsers import get_parser_defaults
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .loader import SharedLoader
+
+_log = logging.getLogger(__name__)
+
+
+class LoaderPool:
+    """Shared loaders, reused by get_object and friends when no loader is passed.
+
+    Without a pool, each call to functions like get_object creates a new loader,
+    and analyzes the whole package again. The pool keeps a shared loader for
+    each docstring parser (and its options), so a package is only analyzed
+    the first time it's used in a process. Dynamic lookups replace docstrings
+    on loaded objects, so they use separate loaders from static ones.
+
+    Checking source files for changes means a stat call per loaded file, so
+    pooled loaders are only refreshed when asked: blueprint refreshes its
+    loader once per call, while get_object returns objects as they were last
+    analyzed. Use refresh to reload edited modules in every pooled loader, or
+    invalidate to drop packages entirely.
+
+    Parameters
+    ----------
+    max_size:
+        Maximum number of loaders kept. When full, the least recently used
+        loader is dropped.
+
+    Attributes
+    ----------
+    enabled:
+        Whether the pool is used. When False, each call creates a new loader
+        (see also the disabled method).
+
+    Examples
+    --------
+
+    >>> from quartodoc import get_object
+    >>> from quartodoc.builder.pool import loader_pool
+    >>> f = get_object("quartodoc:get_object")
+    >>> loader_pool.invalidate("quartodoc")
+    """
+
+    def __init__(self, max_size: int = 4):
+        self.max_size = max_size
+        self.enabled = True
+
+        self._loaders: "OrderedDict[tuple, SharedLoader]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._sys_path = list(sys.path)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def get(
+        self, parser: str = "numpy", dynamic: bool = False, refresh: bool = False
+    ) -> "SharedLoader | None":
+        """Return the pooled loader for a parser, or None if the pool is disabled.
+
+        Parameters
+        ----------
+        parser:
+            Docstring parser used by the loader.
+        dynamic:
+            Whether the loader is used for dynamic lookups.
+        refresh:
+            Whether to reload modules whose source files changed since the
+            loader last analyzed them (see SharedLoader.refresh).
+        """
+
+        from .loader import SharedLoader
+
+        if not self.enabled:
+            return None
+
+        options = get_parser_defaults(parser)
+        key = (parser, tuple(sorted((k, repr(v)) for k, v in options.items())), dynamic)
+
+        with self._lock:
+            # loaders search the sys.path from when they were created
+            if sys.path != self._sys_path:
+                self._sys_path = list(sys.path)
+                for loader in self._loaders.values():
+                    loader.update_search_paths()
+
+            if key not in self._loaders:
+                loader = self._loaders[key] = SharedLoader(parser=parser)
+
+                while len(self._loaders) > self.max_size:
+                    old_key, _ = self._loaders.popitem(last=False)
+                    _log.info(f"Dropping pooled loader for parser {old_key[0]}")
+
+                return loader
+
+            self._loaders.move_to_end(key)
+            loader = self._loaders[key]
+
+        if refresh:
+            loader.refresh()
+        else:
+            # packages may have been installed or fixed since the last call, so
+            # failures are only skipped within a call.
+            loader.clear_failures()
+
+        return loader
+
+    def refresh(self) -> "list[str]":
+        """Reload modules whose source files changed, in every pooled loader.
+
+        Returns the names of reloaded (or dropped) modules.
+        """
+
+        with self._lock:
+            loaders = list(self._loaders.values())
+
+        changed = set()
+        for loader in loaders:
+            changed.update(loader.refresh())
+
+        return sorted(changed)
+
+    def invalidate(self, package: "str | None" = None):
+        """Drop a package from every pooled loader, or drop all loaders.
+
+        Parameters
+        ----------
+        package:
+            Name of a top-level package, e.g. "quartodoc". If None, all pooled
+            loaders are dropped.
+        """
+
+        with self._lock:
+            if package is None:
+                self._loaders.clear()
+                return
+
+            for loader in self._loaders.values():
+                loader.drop(package)
+
+    @contextmanager
+    def disabled(self):
+        """Temporarily create a new loader for each call, rather than using the pool."""
+
+        enabled = self.enabled
+        self.enabled = False
+        try:
+            yield
+        finally:
+            self.enabled = enabled
+
+
+loader_pool = LoaderPool()
+"""The process-wide pool used by get_object, get_function, and blueprint."""
@@ -0,0 +1,218 @@
+"""Parse the docstrings a layout documents ahead of blueprinting.
+
+Parsing docstrings is the most CPU heavy part of blueprinting, and happens
+one docstring at a time as objects are visited. Prefetching finds the objects
+a layout documents up front, and parses their docstrings across a pool of
+worker processes. Workers send back the parsed sections as parse cache entries
+(see ParseCache), which are then set on the docstrings in the build process.
+Since these are the same entries a parse cache saves to disk, the results
+are identical to parsing docstrings lazily.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+
+from .._griffe_compat import dataclasses as dc
+from .._griffe_compat import AliasResolutionError, CyclicAliasError
+from ..layout import MISSING, Auto
+from .aliases import final_target
+from .parse_cache import cache_key
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..layout import Layout
+    from .loader import SharedLoader
+
+_log = logging.getLogger(__name__)
+
+
+# the loader docstrings are parsed from, in the current worker process
+_PREFETCH_LOADER: "SharedLoader | None" = None
+
+
+def layout_paths(el: "Layout", dynamic: "bool | str | None" = False) -> "list[str]":
+    """Return the paths get_object uses for each statically loaded Auto in a layout.
+
+    Parameters
+    ----------
+    el:
+        The layout (or a part of it) to search.
+    dynamic:
+        Whether Autos are dynamically loaded by default. Dynamic Autos are
+        skipped, since their docstrings are replaced when they are fetched.
+    """
+
+    from .blueprint import _object_path
+
+    paths = []
+
+    def visit(node, package, dynamic):
+        node_package = getattr(node, "package", MISSING())
+        if not isinstance(node_package, MISSING):
+            package = node_package
+
+        options = getattr(node, "options", None)
+        if options is not None and options.dynamic is not None:
+            dynamic = options.dynamic
+
+        if isinstance(node, Auto):
+            node_dynamic = node.dynamic if node.dynamic is not None else dynamic
+            if not node_dynamic:
+                paths.append(_object_path(package, node.name))
+
+            return
+
+        for child in [*getattr(node, "sections", []), *getattr(node, "contents", [])]:
+            if not isinstance(child, str):
+                visit(child, package, dynamic)
+
+    visit(el, None, dynamic)
+
+    if not el.sections and isinstance(el.package, str):
+        # contents are generated from the package during blueprinting
+        paths.append(el.package)
+
+    return paths
+
+
+def documented_objects(obj: dc.Object | dc.Alias) -> "list[dc.Object]":
+    """Return an object, and the members it may document, with aliases resolved.
+
+    This errs on the side of including members (e.g. private ones), since
+    they're only used to decide which docstrings to parse ahead of time.
+    Submodules are not included, since they aren't documented as members.
+    """
+
+    res = []
+    seen = set()
+
+    def visit(obj, top: bool):
+        if isinstance(obj, dc.Alias):
+            try:
+                obj = final_target(obj)
+            except (AliasResolutionError, CyclicAliasError):
+                return
+
+        if id(obj) in seen or (obj.is_module and not top):
+            return
+
+        seen.add(id(obj))
+        res.append(obj)
+
+        for member in obj.members.values():
+            # aliases are only followed one level, since they usually point
+            # to objects documented elsewhere
+            if top or not member.is_alias:
+                visit(member, False)
+
+    visit(obj, True)
+    return res
+
+
+def prefetch_docstrings(
+    loader: "SharedLoader",
+    paths: "list[str]",
+    n_workers: int,
+) -> int:
+    """Parse the docstrings of objects (and their members) across worker processes.
+
+    Returns the number of docstrings parsed. Docstrings that are already parsed,
+    or in the loader's parse cache, are skipped.
+
+    Parameters
+    ----------
+    loader:
+        The loader objects are fetched from. Parsed sections are added to its
+        parse cache, and set on its docstrings.
+    paths:
+        Paths of objects to fetch with get_object (see layout_paths).
+    n_workers:
+        Maximum number of worker processes.
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from ..autosummary import _render_mp_context, get_object
+
+    cache = loader.parsed_docs
+
+    pending: "dict[str, tuple[dc.Docstring, tuple]]" = {}
+    for path in paths:
+        try:
+            obj = get_object(path, loader=loader)
+        except Exception as e:
+            # errors are raised when the object is blueprinted
+            _log.debug(f"Not prefetching docstrings for {path}: {e}")
+            continue
+
+        for member in documented_objects(obj):
+            docstring = member.docstring
+            if docstring is None or "parsed" in docstring.__dict__:
+                continue
+
+            key = cache_key(docstring)
+            if key not in cache:
+                pending[member.path] = (docstring, key)
+
+    if not pending:
+        return 0
+
+    n_workers = min(n_workers, len(pending))
+    chunks = _chunks(list(pending), n_workers * 4)
+
+    _log.info(f"Parsing {len(pending)} docstrings using {n_workers} processes")
+
+    # forked workers inherit the loaded packages, while spawned ones load them
+    ctx = _render_mp_context()
+    shared = loader if ctx.get_start_method() == "fork" else None
+    with ProcessPoolExecutor(
+        n_workers,
+        mp_context=ctx,
+        initializer=_init_prefetch_worker,
+        initargs=(shared, loader.docstring_parser.value, list(sys.path)),
+    ) as pool:
+        for entries in pool.map(_parse_paths, chunks):
+            cache.update(entries)
+
+    for docstring, key in pending.values():
+        cache.fill(docstring, key)
+
+    return len(pending)
+
+
+def _chunks(x: list, n: int) -> "list[list]":
+    size = -(-len(x) // n)
+    return [x[ii : ii + size] for ii in range(0, len(x), size)]  # noqa: E203
+
+
+def _init_prefetch_worker(
+    loader: "SharedLoader | None", parser: str, sys_path: "list[str]"
+):
+    global _PREFETCH_LOADER
+
+    from .loader import SharedLoader
+
+    sys.path[:] = sys_path
+    _PREFETCH_LOADER = loader if loader is not None else SharedLoader(parser=parser)
+
+
+def _parse_paths(paths: "list[str]") -> "dict[tuple, bytes]":
+    from ..autosummary import get_object
+
+    loader = _PREFETCH_LOADER
+
+    docstrings = []
+    for path in paths:
+        try:
+            obj = get_object(path, loader=loader)
+        except Exception as e:
+            _log.debug(f"Not parsing docstring for {path}: {e}")
+            continue
+
+        if obj.docstring is not None:
+            docstrings.append(obj.docstring)
+
+    return loader.parsed_docs.parse(docstrings)
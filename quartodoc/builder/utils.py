@@ -1,18 +1,128 @@
 from __future__ import annotations
 
 from contextvars import ContextVar
-from plum import dispatch
-from typing import Union
+from plum import dispatch, Function, Signature
+from typing import Callable, Union
 
 from quartodoc._pydantic_compat import BaseModel
 from ._node import Node
 
 
-# Transformer -----------------------------------------------------------------
+# Context ---------------------------------------------------------------------
 
 ctx_node: ContextVar[Node] = ContextVar("node")
 
 
+# Dispatch plans --------------------------------------------------------------
+# How a transformer visits elements of a given type, based on the enter and exit
+# methods they dispatch to. Plans are cached per transformer class and element
+# type, so the traversal only calls plum once for each.
+
+_SKIP = 0  # can't contain children, and no enter or exit method applies
+_MODEL = 1  # the generic pydantic model enter: visit each field
+_SEQUENCE = 2  # the generic list or tuple enter: visit each item
+_CALL = 3  # any other enter method: call it
+
+_PLANS: "dict[tuple[type, type], tuple[int, Callable, Callable]]" = {}
+_GENERIC: "dict[str, Callable]" = {}
+
+
+def _resolve(cls: type, name: str, el_type: type) -> Callable:
+    """Return the function a transformer's dispatch method calls for an element type."""
+
+    f = getattr(cls, name)
+
+    # a subclass without a method for a type resolves to the dispatch function
+    # of its parent class, so keep resolving until reaching a plain function
+    while isinstance(f, Function):
+        f, _ = f.resolve_method(Signature(cls, el_type))
+
+    return f
+
+
+def _plan(cls: type, el_type: type) -> "tuple[int, Callable, Callable]":
+    try:
+        return _PLANS[cls, el_type]
+    except KeyError:
+        pass
+
+    if not _GENERIC:
+        base = PydanticTransformer
+        _GENERIC["enter"] = _resolve(base, "enter", object)
+        _GENERIC["exit"] = _resolve(base, "exit", object)
+        _GENERIC["model"] = _resolve(base, "enter", BaseModel)
+        _GENERIC["sequence"] = _resolve(base, "enter", list)
+
+    enter = _resolve(cls, "enter", el_type)
+    exit = _resolve(cls, "exit", el_type)
+
+    if enter is _GENERIC["model"]:
+        kind = _MODEL
+    elif enter is _GENERIC["sequence"]:
+        kind = _SEQUENCE
+    elif enter is _GENERIC["enter"] and exit is _GENERIC["exit"]:
+        kind = _SKIP
+    else:
+        kind = _CALL
+
+    plan = _PLANS[cls, el_type] = (kind, enter, exit)
+    return plan
+
+
+class _Frame:
+    """A model or sequence whose children are being visited."""
+
+    __slots__ = ("node", "exit", "keys", "children", "results", "state")
+
+    def __init__(self, node: Node, exit: Callable, keys, children, state):
+        self.node = node
+        self.exit = exit
+        self.keys = keys
+        self.children = children
+        self.results = []
+        self.state = state
+
+    def rebuild(self):
+        el = self.node.value
+
+        if self.keys is None:
+            return _rebuild_sequence(el, self.children, self.results)
+
+        changed = {
+            key: result
+            for key, child, result in zip(self.keys, self.children, self.results)
+            if result is not child
+        }
+
+        return _rebuild_model(el, changed)
+
+
+def _rebuild_model(el: BaseModel, changed: dict) -> BaseModel:
+    """Return a model with some fields changed, sharing the others.
+
+    Fields come from transformers, so the new model is not validated.
+    """
+
+    if not changed:
+        return el
+
+    return el.copy(update=changed)
+
+
+def _rebuild_sequence(el: "list | tuple", children, results) -> "list | tuple":
+    for child, result in zip(children, results):
+        if result is not child:
+            return el.__class__(results)
+
+    return el
+
+
+_PENDING = object()
+
+
+# Transformer -----------------------------------------------------------------
+
+
 class WorkaroundKeyError(Exception):
     """Represents a KeyError.
 
@@ -23,29 +133,159 @@ class WorkaroundKeyError(Exception):
 
 
 class PydanticTransformer:
+    """Transform a tree of pydantic models, lists, and tuples.
+
+    Subclasses define enter and exit methods for the elements they transform,
+    using plum's dispatch. Elements are visited depth first: enter is called
+    before an element's children are visited, and exit after. Use ctx_node.get()
+    in these methods to get the Node of the element being visited (and its
+    parents).
+
+    Visiting is done iteratively, so deeply nested trees do not hit python's
+    recursion limit. Elements that can't contain children, and that have no
+    enter or exit methods besides the generic ones, are not visited at all.
+    To track state while inside an element (e.g. options set on a section),
+    define push_state and pop_state, rather than overriding visit. Subclasses
+    that override visit have it called for every other element, recursively.
+
+    Elements whose children are unchanged are returned as is. Otherwise, models
+    are copied with the changed fields (without validating them), and lists
+    and tuples are rebuilt.
+    """
+
     LOG = False
 
     def _log(self, step: str, el):
         if self.LOG:
             print(f"{step}: {type(el)} {el}")
 
+    def push_state(self, el):
+        """Called before entering an element, to update state used by its children.
+
+        Returns the state to restore after the element's exit, which is passed
+        to pop_state. If None is returned, pop_state is not called.
+        """
+
+        return None
+
+    def pop_state(self, state):
+        """Restore the state returned by push_state, after an element's exit."""
+
     @dispatch
     def visit(self, el):
         self._log("PARENT VISITING", el)
 
-        old_node = ctx_node.get(None)
-        if old_node is None:
-            old_node = Node()
+        if type(self).visit is not PydanticTransformer.visit:
+            return self._visit_one(el)
+
+        return self._walk(el)
+
+    def _uses_state(self) -> bool:
+        return type(self).push_state is not PydanticTransformer.push_state
+
+    def _visit_one(self, el):
+        """Visit an element, leaving its children to the enter method."""
+
+        kind, enter, exit = _plan(type(self), type(el))
+        if kind == _SKIP:
+            return el
 
-        new_node = Node(level=old_node.level + 1, value=el, parent=old_node)
+        parent = ctx_node.get(None)
+        if parent is None:
+            parent = Node()
 
-        token = ctx_node.set(new_node)
+        state = self.push_state(el)
+        token = ctx_node.set(Node(parent.level + 1, el, parent))
 
         try:
-            result = self.enter(el)
-            return self.exit(result)
+            return exit(self, enter(self, el))
         finally:
             ctx_node.reset(token)
+            if state is not None:
+                self.pop_state(state)
+
+    def _walk(self, el):
+        """Visit an element and its children, using a stack of frames."""
+
+        cls = type(self)
+        push_state = self.push_state if self._uses_state() else None
+
+        root = ctx_node.get(None)
+        if root is None:
+            root = Node()
+
+        token = ctx_node.set(root)
+
+        frames: "list[_Frame]" = []
+        value = el
+
+        try:
+            while True:
+                # start visiting value ----
+                parent = frames[-1].node if frames else root
+                kind, enter, exit = _plan(cls, type(value))
+
+                if kind == _SKIP:
+                    result = value
+                else:
+                    state = push_state(value) if push_state is not None else None
+                    node = Node(parent.level + 1, value, parent)
+                    ctx_node.set(node)
+
+                    if kind == _MODEL or kind == _SEQUENCE:
+                        self._log("GENERIC ENTER", value)
+
+                        if kind == _MODEL:
+                            fields = list(value)
+                            keys = [k for k, _ in fields]
+                            children = [v for _, v in fields]
+                        else:
+                            keys, children = None, value
+
+                        frames.append(_Frame(node, exit, keys, children, state))
+                        result = _PENDING
+                    else:
+                        try:
+                            result = exit(self, enter(self, value))
+                        finally:
+                            if state is not None:
+                                self.pop_state(state)
+
+                        ctx_node.set(parent)
+
+                # hand results to frames, exiting those with no children left ----
+                while frames:
+                    frame = frames[-1]
+                    if result is not _PENDING:
+                        frame.results.append(result)
+
+                    n_done = len(frame.results)
+                    if n_done < len(frame.children):
+                        value = frame.children[n_done]
+                        break
+
+                    ctx_node.set(frame.node)
+                    result = frame.exit(self, frame.rebuild())
+                    ctx_node.set(frame.node.parent)
+
+                    frames.pop()
+                    if frame.state is not None:
+                        self.pop_state(frame.state)
+                else:
+                    return result
+        finally:
+            ctx_node.reset(token)
+
+            # restore the state of elements left unfinished by an error
+            for frame in reversed(frames):
+                if frame.state is not None:
+                    self.pop_state(frame.state)
+
+    def _visit_child(self, el):
+        if _plan(type(self), type(el))[0] == _SKIP:
+            return el
+
+        return self.visit(el)
 
     @dispatch
     def enter(self, el):
@@ -60,38 +300,22 @@ class PydanticTransformer:
     @dispatch
     def enter(self, el: BaseModel):
         self._log("GENERIC ENTER", el)
-        new_kwargs = {}
 
-        has_change = False
+        changed = {}
         for field, value in el:
-            result = self.visit(value)
+            result = self._visit_child(value)
             if result is not value:
-                has_change = True
-                new_kwargs[field] = result
-            else:
-                new_kwargs[field] = value
+                changed[field] = result
 
-        if has_change:
-            return el.__class__(**new_kwargs)
-
-        return el
+        return _rebuild_model(el, changed)
 
     @dispatch
     def enter(self, el: Union[list, tuple]):
         self._log("GENERIC ENTER", el)
-        final = []
-
-        # has_change = False
-        for child in el:
-            result = self.visit(child)
-            if result is not child:
-                # has_change = True
-                final.append(result)
-            else:
-                final.append(child)
-
-        # for now just return a copy always
-        return el.__class__(final)
+
+        results = [self._visit_child(child) for child in el]
+
+        return _rebuild_sequence(el, el, results)
 
 
 # Implementations -------------------------------------------------------------
@@ -0,0 +1,130 @@
+"""Worker processes that import modules for dynamic lookups.
+
+Dynamic lookups import the documented package. Running these imports in worker
+processes keeps heavy packages (and their native libraries) out of the build
+process, which only receives docstrings and canonical paths back.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+
+from concurrent.futures import Future, ProcessPoolExecutor
+
+_log = logging.getLogger(__name__)
+
+
+class ImportWorkers:
+    """A pool of long-lived worker processes, for importing modules.
+
+    Each top-level package is assigned to one worker, so it is only imported
+    once, and different packages can be imported in parallel. Restarting a
+    package's worker lets it import edited source files from scratch.
+
+    Parameters
+    ----------
+    n_workers:
+        Maximum number of worker processes. When there are more packages than
+        workers, packages share workers.
+
+    Attributes
+    ----------
+    n_starts:
+        Number of worker processes started.
+    """
+
+    def __init__(self, n_workers: int = 1):
+        if n_workers < 1:
+            raise ValueError("n_workers must be at least 1.")
+
+        self.n_workers = n_workers
+        self.n_starts = 0
+
+        self._pools: "dict[int, ProcessPoolExecutor]" = {}
+        self._roots: "dict[str, int]" = {}
+
+    def __reduce__(self):
+        # objects pickled along with a loader get a fresh pool
+        return (ImportWorkers, (self.n_workers,))
+
+    def _index(self, module_name: str) -> int:
+        root = module_name.split(".", 1)[0]
+        if root not in self._roots:
+            self._roots[root] = len(self._roots) % self.n_workers
+
+        return self._roots[root]
+
+    def _pool(self, module_name: str) -> ProcessPoolExecutor:
+        import multiprocessing
+
+        ii = self._index(module_name)
+        if ii not in self._pools:
+            _log.info(f"Starting import worker {ii} for {module_name}")
+
+            # spawning, rather than forking, gives a fresh interpreter, which
+            # hasn't imported anything the build process has.
+            self._pools[ii] = ProcessPoolExecutor(
+                1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(list(sys.path),),
+            )
+            self.n_starts += 1
+
+        return self._pools[ii]
+
+    def _submit(self, module_name: str, f, *args) -> Future:
+        return self._pool(module_name).submit(f, *args)
+
+    def warm(self, module_names: "list[str]"):
+        """Start importing modules, without waiting for the imports to finish.
+
+        Errors are raised by the first lookup that needs the module.
+        """
+
+        for name in module_names:
+            self._submit(name, _import_module, name)
+
+    def collect_docs(self, module_name: str, qualnames: "list[str]") -> dict:
+        """Return the __doc__ of objects in a module (see collect_docs)."""
+
+        from .dynamic import collect_docs
+
+        return self._submit(module_name, collect_docs, module_name, qualnames).result()
+
+    def lookup(self, path: str) -> "tuple[str, str | None]":
+        """Return the canonical path and __doc__ of an object (see dynamic_lookup)."""
+
+        from ..autosummary import _dynamic_lookup
+
+        module_name = path.split(":", 1)[0]
+        return self._submit(module_name, _dynamic_lookup, path).result()
+
+    def restart(self, module_name: str):
+        """Stop the worker for a module's package, so it is restarted when next used."""
+
+        # note that this also restarts any packages sharing the worker
+        pool = self._pools.pop(self._index(module_name), None)
+        if pool is not None:
+            _log.info(f"Restarting import worker for {module_name}")
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        """Stop all workers."""
+
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        self._pools = {}
+
+
+def _init_worker(sys_path: "list[str]"):
+    # e.g. the builder may have added a source_dir to the path
+    sys.path[:] = sys_path
+
+
+def _import_module(module_name: str):
+    import importlib
+
+    importlib.import_module(module_name)
@@ -0,0 +1,298 @@
+"""A long-lived build process, which keeps quartodoc's state warm between builds.
+
+The daemon listens on a local socket for requests. Each request is a single line
+of JSON, with an "action" field, and gets a single line of JSON in response.
+
+Actions:
+
+* build: build the docs. The first build is a full build, while later ones
+  only rebuild pages that depend on source files edited since the last one.
+  Accepts an optional "filter" field (see Builder.build).
+* render: return the rendered markdown for a single object. Requires a "name"
+  field, e.g. "quartodoc:get_object" or "get_object" (relative to the package).
+* status: return information about the daemon.
+* shutdown: stop the daemon.
+
+Responses have the form {"ok": true, "result": ...}, or {"ok": false, "error": ...}.
+
+Examples
+--------
+
+Start the daemon from your docs folder:
+
+```bash
+quartodoc serve-build
+```
+
+Then send it requests:
+
+>>> from quartodoc.daemon import send_request
+>>> send_request({"action": "render", "name": "get_object"})
+"# get_object { #quartodoc.get_object }..."
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+
+from pathlib import Path
+
+from . import layout
+from .autosummary import Builder
+
+_log = logging.getLogger(__name__)
+
+
+DEFAULT_SOCKET = ".quartodoc.sock"
+
+
+def _mtime(fname: str) -> "float | None":
+    try:
+        return os.stat(fname).st_mtime
+    except OSError:
+        return None
+
+
+class BuildDaemon:
+    """Handle build and render requests, keeping a builder and loader warm.
+
+    Source files that went into a build or a rendered object are tracked, and
+    checked for edits at the start of each request. Edits invalidate rendered
+    objects, and cause the next build to rebuild only the pages that depend on
+    the edited files. Editing the config file recreates the builder.
+
+    Parameters
+    ----------
+    config:
+        Path to the quarto config file (e.g. _quarto.yml).
+    """
+
+    def __init__(self, config: "str | Path" = "_quarto.yml"):
+        self.config = Path(config).absolute()
+
+        self.builder: "Builder | None" = None
+        self.n_builds = 0
+
+        self._config_mtime: "float | None" = None
+        self._mtimes: "dict[str, float | None]" = {}
+        self._pending: "set[str]" = set()
+        self._built = False
+
+        self._trans = None
+        self._rendered: "dict[str, str]" = {}
+
+        self._load_builder()
+
+    def _load_builder(self):
+        _log.info(f"Loading config from {self.config}")
+
+        self.builder = Builder.from_quarto_config(str(self.config))
+        self._config_mtime = _mtime(self.config)
+        self._mtimes = {}
+        self._pending = set()
+        self._built = False
+        self._invalidate()
+
+    def _invalidate(self):
+        self._trans = None
+        self._rendered = {}
+
+    # tracking source files ----
+
+    def _track(self, files):
+        for fname in files:
+            if fname not in self._mtimes:
+                self._mtimes[fname] = _mtime(fname)
+
+    def refresh(self):
+        """Check tracked files for edits, and invalidate any warm state."""
+
+        if _mtime(self.config) != self._config_mtime:
+            return self._load_builder()
+
+        changed = []
+        for fname, old in self._mtimes.items():
+            new = _mtime(fname)
+            if new != old:
+                self._mtimes[fname] = new
+                changed.append(fname)
+
+        if changed:
+            _log.info(f"Source files changed: {changed}")
+            self._pending.update(changed)
+            self._invalidate()
+
+    # actions ----
+
+    def build(self, filter: str = "*") -> dict:
+        """Build the docs, only rebuilding pages affected by edits if possible."""
+
+        if not self._built:
+            self.builder.build(filter=filter)
+            self._built = True
+        elif self._pending:
+            self.builder.build_incremental(sorted(self._pending), filter=filter)
+        else:
+            _log.info("No source files changed since the last build.")
+            return {"changed": []}
+
+        self._pending = set()
+        self.n_builds += 1
+
+        # once a build has happened, track every file it depends on
+        for entry in (self.builder._entries or {}).values():
+            self._track(entry.files)
+
+        return {"changed": list(self.builder.manifest.changed)}
+
+    def render(self, name: str) -> str:
+        """Return the rendered markdown for a single object."""
+
+        from .builder.blueprint import unwrap_entry
+        from .builder.cache import doc_dependencies
+
+        if name in self._rendered:
+            return self._rendered[name]
+
+        if self._trans is None:
+            # transformers share the builder's loader, which only re-parses
+            # modules that changed since they were loaded.
+            self.builder._refresh_loader()
+            self._trans = self.builder._create_transformer()
+
+        package = None if ":" in name else self.builder.package
+        el = layout.Layout(
+            sections=[layout.Section(contents=[layout.Auto(name=name)])],
+            package=package,
+            options=self.builder.layout.options,
+        )
+
+        page = unwrap_entry(self._trans.visit(el))
+        rendered = self.builder.renderer.render(page)
+
+        self._track(doc_dependencies(page))
+        self._rendered[name] = rendered
+
+        return rendered
+
+    def status(self) -> dict:
+        return {
+            "config": str(self.config),
+            "package": self.builder.package,
+            "builds": self.n_builds,
+            "tracked_files": len(self._mtimes),
+            "rendered": sorted(self._rendered),
+        }
+
+    def handle(self, request: dict):
+        """Handle a single request, returning its result."""
+
+        action = request.get("action")
+
+        self.refresh()
+
+        if action == "build":
+            return self.build(request.get("filter", "*"))
+        elif action == "render":
+            if "name" not in request:
+                raise ValueError("render requests require a name field.")
+            return self.render(request["name"])
+        elif action == "status":
+            return self.status()
+
+        raise ValueError(f"Unsupported action: {action}")
+
+    # serving ----
+
+    def serve(self, socket_path: str = DEFAULT_SOCKET, port: "int | None" = None):
+        """Handle requests until a shutdown request is received.
+
+        Parameters
+        ----------
+        socket_path:
+            Path of a unix socket to listen on.
+        port:
+            If specified, listen on this port on localhost, instead of a unix socket.
+        """
+
+        server = _create_server(socket_path, port)
+        server.build_daemon = self
+        server.stopped = False
+
+        try:
+            while not server.stopped:
+                server.handle_request()
+        finally:
+            server.server_close()
+            if port is None:
+                Path(socket_path).unlink(missing_ok=True)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+
+        try:
+            request = json.loads(line)
+            if request.get("action") == "shutdown":
+                self.server.stopped = True
+                result = None
+            else:
+                result = self.server.build_daemon.handle(request)
+
+            response = {"ok": True, "result": result}
+        except Exception as e:
+            _log.exception("Request failed")
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+def _create_server(socket_path: str, port: "int | None") -> socketserver.BaseServer:
+    if port is not None:
+        return socketserver.TCPServer(("127.0.0.1", port), _RequestHandler)
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise NotImplementedError(
+            "Unix sockets are not supported on this platform. Specify a port instead."
+        )
+
+    # remove a socket left behind by a daemon that did not shut down cleanly
+    Path(socket_path).unlink(missing_ok=True)
+    return socketserver.UnixStreamServer(socket_path, _RequestHandler)
+
+
+def send_request(
+    request: dict, socket_path: str = DEFAULT_SOCKET, port: "int | None" = None
+):
+    """Send a request to a running daemon, and return its result.
+
+    Parameters
+    ----------
+    request:
+        A request, such as {"action": "build"}. See the module docs for actions.
+    socket_path:
+        Path of the unix socket the daemon is listening on.
+    port:
+        If specified, connect to the daemon on this port on localhost instead.
+    """
+
+    if port is not None:
+        conn = socket.create_connection(("127.0.0.1", port))
+    else:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conn.connect(socket_path)
+
+    with conn, conn.makefile("rwb") as f:
+        f.write(json.dumps(request).encode() + b"\n")
+        f.flush()
+        response = json.loads(f.readline())
+
+    if not response["ok"]:
+        raise RuntimeError(response["error"])
+
+    return response["result"]
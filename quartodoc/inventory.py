@@ -165,6 +165,11 @@ def _create_inventory_item(
     )
 
 
+@dispatch
+def _create_inventory_item(item: soi.DataObjStr, *args, **kwargs) -> soi.DataObjStr:
+    return item
+
+
 def _maybe_call(s: "str | Callable", obj):
     if callable(s):
         return s(obj)
@@ -19,6 +19,17 @@ class _Base(BaseModel):
     class Config:
         extra = Extra.forbid
 
+    @classmethod
+    def _construct(cls, **values):
+        """Create an element from trusted values, without validating them.
+
+        This is used for elements that quartodoc creates while building
+        (e.g. Docs and Pages), whose values are already the right types.
+        Elements specified by users in the config are always validated.
+        """
+
+        return cls.construct(**values)
+
 
 class _Structural(_Base):
     """A structural element, like an index Section or Page of docs."""
@@ -236,6 +247,13 @@ class AutoOptions(_Base):
         super().__init__(**kwargs)
         self._fields_specified = tuple(kwargs)
 
+    @classmethod
+    def _construct(cls, **values):
+        el = super()._construct(**values)
+        el._fields_specified = tuple(values)
+
+        return el
+
 
 class Auto(AutoOptions):
     """Configure a python object to document (e.g. module, class, function, attribute).
@@ -372,14 +390,15 @@ class Doc(_Docable):
             "signature_name": signature_name,
         }
 
+        # griffe objects and members are created by quartodoc, so are not validated
         if kind == "function":
-            return DocFunction(**kwargs)
+            return DocFunction._construct(**kwargs)
         elif kind == "attribute":
-            return DocAttribute(**kwargs)
+            return DocAttribute._construct(**kwargs)
         elif kind == "class":
-            return DocClass(members=members, flat=flat, **kwargs)
+            return DocClass._construct(members=list(members), flat=flat, **kwargs)
         elif kind == "module":
-            return DocModule(members=members, flat=flat, **kwargs)
+            return DocModule._construct(members=list(members), flat=flat, **kwargs)
 
         raise TypeError(f"Cannot handle auto for object kind: {obj.kind}")
 
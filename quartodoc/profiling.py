@@ -0,0 +1,292 @@
+"""Timing profiles for quartodoc builds.
+
+Profiles record the wall and CPU time of each build phase, as well as each
+object blueprinted and each page rendered. They can be saved in the Chrome
+trace event format, and viewed with tools like chrome://tracing or Perfetto.
+
+Examples
+--------
+
+>>> from quartodoc import Builder
+>>> from quartodoc.profiling import Profiler, enable_profiling
+>>> builder = Builder.from_quarto_config("_quarto.yml")
+>>> profiler = Profiler()
+>>> with enable_profiling(profiler):
+...     builder.build()
+>>> profiler.save("profile.json")
+>>> print(profiler.summary())
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from tabulate import tabulate
+
+
+ctx_profiler: ContextVar["Profiler | None"] = ContextVar("profiler", default=None)
+
+PHASE = "phase"
+"""Category for events timing a step of the build (e.g. blueprint)."""
+
+OBJECT_CATEGORIES = ("blueprint", "render")
+"""Categories for events timing an individual object or page."""
+
+
+class Profiler:
+    """Collect timing events for a build.
+
+    Parameters
+    ----------
+    t0:
+        Reference time (from time.perf_counter) that event timestamps are
+        relative to. Defaults to when the profiler is created.
+
+    Attributes
+    ----------
+    events:
+        Events in the Chrome trace event format.
+    """
+
+    def __init__(self, t0: "float | None" = None):
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.events: "list[dict]" = []
+
+    @contextmanager
+    def span(self, name: str, cat: str = PHASE, **args):
+        """Time a block of code, recording wall and CPU time."""
+
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": cat,
+                    "ph": "X",
+                    "ts": (wall_start - self.t0) * 1e6,
+                    "dur": wall * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {"cpu_ms": cpu * 1e3, **args},
+                }
+            )
+
+    def extend(self, events: "list[dict]"):
+        """Add events recorded by another profiler (e.g. in a worker process)."""
+
+        self.events.extend(events)
+
+    # reporting ----
+
+    def phases(self, nested: bool = True) -> "dict[str, float]":
+        """Return the total wall time in seconds of each build phase.
+
+        Parameters
+        ----------
+        nested:
+            Whether to include time spent in phases that ran inside another
+            phase (e.g. griffe load, while blueprinting). If False, the totals
+            add up to the time spent in build phases.
+        """
+
+        return {name: wall for name, (wall, _, _) in self._phase_totals(nested).items()}
+
+    def _phase_totals(self, nested: bool) -> "dict[str, tuple[float, float, int]]":
+        events = self._phase_events()
+        parents = _parents(events, lambda e: e["pid"])
+
+        totals = {}
+        for event, parent in zip(events, parents):
+            if parent is not None and not nested:
+                continue
+
+            wall, cpu, calls = totals.get(event["name"], (0, 0, 0))
+            totals[event["name"]] = (
+                wall + event["dur"] / 1e6,
+                cpu + event["args"]["cpu_ms"] / 1e3,
+                calls + 1,
+            )
+
+        return totals
+
+    def _phase_events(self) -> "list[dict]":
+        return sorted(
+            (e for e in self.events if e["cat"] == PHASE), key=lambda e: e["ts"]
+        )
+
+    def self_times(self) -> "list[float]":
+        """Return the wall time in seconds of each event, minus its child events.
+
+        Child events are those recorded inside another event, in the same thread.
+        """
+
+        parents = _parents(self.events, lambda e: (e["pid"], e["tid"]))
+
+        times = [e["dur"] / 1e6 for e in self.events]
+        for event, parent in zip(self.events, parents):
+            if parent is not None:
+                times[parent] -= event["dur"] / 1e6
+
+        return times
+
+    def slowest(self, n: int = 20) -> "list[dict]":
+        """Return the n object events (blueprinting or rendering) with most self time.
+
+        Time spent in events nested inside an object event (e.g. blueprinting
+        its members) is not counted toward it, so that the objects listed are
+        the slow ones themselves, rather than their parents.
+        """
+
+        return [event for event, _ in self._slowest(n)]
+
+    def _slowest(self, n: int) -> "list[tuple[dict, float]]":
+        pairs = [
+            (event, self_time)
+            for event, self_time in zip(self.events, self.self_times())
+            if event["cat"] in OBJECT_CATEGORIES
+        ]
+
+        return sorted(pairs, key=lambda pair: pair[1], reverse=True)[:n]
+
+    def summary(self, n: int = 20) -> str:
+        """Return a text summary of build phases and the n slowest objects.
+
+        Each phase is listed once, with the time of all its runs combined.
+        Phases that ran inside other phases are marked as nested, and left out
+        of the total.
+        """
+
+        events = self._phase_events()
+        parents = _parents(events, lambda e: e["pid"])
+
+        top_level = self._phase_totals(nested=False)
+        nested = {
+            event["name"]
+            for event, parent in zip(events, parents)
+            if parent is not None and event["name"] not in top_level
+        }
+
+        phase_rows = [
+            (
+                name,
+                "yes" if name in nested else "",
+                calls,
+                f"{wall * 1e3:.1f}",
+                f"{cpu * 1e3:.1f}",
+            )
+            for name, (wall, cpu, calls) in self._phase_totals(nested=True).items()
+        ]
+        phase_rows.append(
+            (
+                "total",
+                "",
+                "",
+                f"{sum(wall for wall, _, _ in top_level.values()) * 1e3:.1f}",
+                f"{sum(cpu for _, cpu, _ in top_level.values()) * 1e3:.1f}",
+            )
+        )
+
+        object_rows = [
+            (
+                e["cat"],
+                e["name"],
+                f"{self_time * 1e3:.1f}",
+                f"{e['dur'] / 1e3:.1f}",
+                f"{e['args']['cpu_ms']:.1f}",
+            )
+            for e, self_time in self._slowest(n)
+        ]
+
+        phases = tabulate(
+            phase_rows,
+            headers=["Phase", "Nested", "Calls", "Wall (ms)", "CPU (ms)"],
+        )
+        objects = tabulate(
+            object_rows,
+            headers=["Step", "Object", "Self (ms)", "Wall (ms)", "CPU (ms)"],
+        )
+
+        return f"{phases}\n\nSlowest {len(object_rows)} objects:\n\n{objects}"
+
+    def to_trace(self) -> dict:
+        """Return events as a Chrome trace object."""
+
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def save(self, path: "str | Path"):
+        """Save a Chrome trace JSON file."""
+
+        Path(path).write_text(json.dumps(self.to_trace()))
+
+
+# events are timed in microseconds, as floats
+_EPS = 1e-3
+
+
+def _parents(events: "list[dict]", group) -> "list[int | None]":
+    """Return the index of the innermost event containing each event, if any.
+
+    Only events with the same group key (e.g. process and thread) can contain
+    each other.
+    """
+
+    parents = [None] * len(events)
+    order = sorted(
+        range(len(events)),
+        key=lambda ii: (group(events[ii]), events[ii]["ts"], -events[ii]["dur"]),
+    )
+
+    stack = []
+    for ii in order:
+        event = events[ii]
+        key, end = group(event), event["ts"] + event["dur"]
+
+        # timestamps are floats, so allow for rounding at the edges
+        while stack:
+            top = events[stack[-1]]
+            if group(top) == key and end <= top["ts"] + top["dur"] + _EPS:
+                break
+            stack.pop()
+
+        if stack:
+            parents[ii] = stack[-1]
+
+        stack.append(ii)
+
+    return parents
+
+
+@contextmanager
+def enable_profiling(profiler: Profiler):
+    """Record timing events to profiler for code run inside this context."""
+
+    token = ctx_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        ctx_profiler.reset(token)
+
+
+@contextmanager
+def profile_span(name: str, cat: str = PHASE, **args):
+    """Time a block of code, if profiling is enabled."""
+
+    profiler = ctx_profiler.get()
+    if profiler is None:
+        yield
+        return
+
+    with profiler.span(name, cat, **args):
+        yield
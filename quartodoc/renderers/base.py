@@ -1,6 +1,7 @@
 import re
 import typing
 
+from dataclasses import dataclass
 from plum import dispatch
 
 if typing.TYPE_CHECKING:
@@ -49,6 +50,26 @@ def convert_rst_link_to_md(rst):
 # render -----------------------------------------------------------------------
 
 
+@dataclass
+class RenderedPage:
+    """Lightweight record of a page that has already been rendered and written.
+
+    Streaming builds replace each page in the blueprint with this record, so
+    that the index and sidebar can be generated without keeping every page's
+    documented objects in memory.
+
+    Attributes
+    ----------
+    path:
+        Path of the page (or None, if the entry is not a page).
+    summary:
+        The result of the renderer's summarize method for the page.
+    """
+
+    path: "str | None"
+    summary: typing.Any
+
+
 class Renderer:
     style: str
     _registry: "dict[str, Renderer]" = {}
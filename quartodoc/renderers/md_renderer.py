@@ -12,17 +12,22 @@ from tabulate import tabulate
 from plum import dispatch
 from typing import Literal, Union, Optional
 from quartodoc import layout
+from quartodoc.builder.aliases import final_target
+from quartodoc.builder.parse_cache import parsed_sections, patched_sections
 from quartodoc.pandoc.blocks import DefinitionList
 from quartodoc.pandoc.inlines import Span, Strong, Attr, Code, Inlines
+from quartodoc.profiling import profile_span
 
-from .base import Renderer, escape, sanitize, convert_rst_link_to_md
+from .base import Renderer, RenderedPage, escape, sanitize, convert_rst_link_to_md
 
 
 def _has_attr_section(el: dc.Docstring | None):
     if el is None:
         return False
 
-    return any([isinstance(x, ds.DocstringSectionAttributes) for x in el.parsed])
+    return any(
+        [isinstance(x, ds.DocstringSectionAttributes) for x in parsed_sections(el)]
+    )
 
 
 def _sanitize_title(title: str):
@@ -362,7 +367,7 @@ class MdRenderer(Renderer):
 
     @dispatch
     def signature(self, el: dc.Alias, source: Optional[dc.Alias] = None):
-        return self.signature(el.final_target, el)
+        return self.signature(final_target(el), el)
 
     @dispatch
     def signature(
@@ -421,6 +426,10 @@ class MdRenderer(Renderer):
 
     @dispatch
     def render(self, el: layout.Page):
+        with profile_span(el.path, cat="render"):
+            return self._render_page(el)
+
+    def _render_page(self, el: layout.Page):
         if el.summary:
             sum_ = el.summary
             header = [f"{'#' * self.crnt_header_level} {sum_.name}\n\n{sum_.desc}"]
@@ -469,7 +478,7 @@ class MdRenderer(Renderer):
         # parsed = map(qast.transform, [x.docstring.parsed for x in objs if x.docstring])
 
         # TODO: this is copied from the render method for dc.Object
-        for section in qast.transform(first_doc.obj.docstring.parsed):
+        for section in patched_sections(first_doc.obj.docstring):
             title = section.title or section.kind.value
             body = self.render(section)
 
@@ -602,9 +611,7 @@ class MdRenderer(Renderer):
     @dispatch
     def render(self, el: dc.Docstring):
         str_body = []
-        patched_sections = qast.transform(el.parsed)
-
-        for section in patched_sections:
+        for section in patched_sections(el):
             title = section.title or section.kind.value
             body: str = self.render(section)
 
@@ -915,6 +922,10 @@ class MdRenderer(Renderer):
                     rows.append(result)
             return "\n".join(rows)
 
+    @dispatch
+    def summarize(self, el: RenderedPage):
+        return el.summary
+
     @dispatch
     def summarize(self, el: layout.MemberPage):
         # TODO: model should validate these only have a single entry
@@ -954,7 +965,7 @@ class MdRenderer(Renderer):
         if doc is None:
             docstring_parts = []
         else:
-            docstring_parts = doc.parsed
+            docstring_parts = parsed_sections(doc)
 
         if len(docstring_parts) and isinstance(
             docstring_parts[0], ds.DocstringSectionText
@@ -0,0 +1,134 @@
+import os
+import sys
+
+import pytest
+
+from quartodoc import Builder
+from quartodoc import layout as lo
+from quartodoc.builder.loader import SharedLoader
+
+# test package, created by pkg_path ----
+
+N_MODULES = 6
+
+INIT_SOURCE = "from .mod_0 import f_0\n"
+
+MOD_SOURCE = '''
+def f_{ii}():
+    """Function {ii}."""
+'''
+
+DYNAMIC_SOURCE = '''
+class A:
+    """Static class."""
+
+    def m_0(self):
+        """Static 0."""
+
+    def m_1(self):
+        """Static 1."""
+
+
+A.__doc__ = "Dynamic class."
+A.m_0.__doc__ = "Dynamic 0."
+A.m_1.__doc__ = "Dynamic 1."
+'''
+
+PARSE_SOURCE = '''
+def f(x: {annotation}):
+    """A function.
+
+    Parameters
+    ----------
+    x:
+        An argument.
+    """
+'''
+
+
+def edit_file(p_file, content):
+    """Write to a file, making sure its modification time changes."""
+
+    # bump mtime explicitly, in case the edit lands within the fs resolution
+    stat = p_file.stat()
+    p_file.write_text(content)
+    os.utime(p_file, (stat.st_atime, stat.st_mtime + 1))
+
+
+@pytest.fixture
+def make_package(tmp_path, monkeypatch):
+    """Return a function that writes a package to a directory on the sys.path.
+
+    The function takes the package's name, and a dict mapping file names to
+    their contents, and returns the package's directory.
+    """
+
+    names = []
+
+    def make(name: str, files: "dict[str, str]", src: str = "src"):
+        p_pkg = tmp_path / src / name
+        p_pkg.mkdir(parents=True)
+
+        for fname, content in files.items():
+            (p_pkg / fname).write_text(content)
+
+        monkeypatch.syspath_prepend(str(tmp_path / src))
+        names.append(name)
+
+        return p_pkg
+
+    yield make
+
+    # dynamic lookups import packages, so remove them for the next test
+    for name in list(sys.modules):
+        if name.split(".", 1)[0] in names:
+            del sys.modules[name]
+
+
+@pytest.fixture
+def pkg_path(make_package):
+    """A package named loader_pkg, with N_MODULES modules of one function each."""
+
+    files = {f"mod_{ii}.py": MOD_SOURCE.format(ii=ii) for ii in range(N_MODULES)}
+
+    return make_package("loader_pkg", {"__init__.py": INIT_SOURCE, **files})
+
+
+@pytest.fixture
+def make_builder(tmp_path):
+    """Return a function that creates a Builder for loader_pkg.
+
+    Pages are written to tmp_path / "reference", and keyword arguments are
+    passed on to Builder.
+    """
+
+    def make(**kwargs):
+        kwargs = {
+            "sections": [lo.Section(title="abc", contents=[lo.Auto(name="f_0")])],
+            **kwargs,
+        }
+        builder = Builder(
+            package="loader_pkg", dir=str(tmp_path / "reference"), **kwargs
+        )
+        builder.out_inventory = str(tmp_path / "objects.json")
+        builder.out_manifest = str(tmp_path / "manifest.json")
+
+        return builder
+
+    return make
+
+
+@pytest.fixture
+def visits(monkeypatch):
+    """Record the name of every module griffe parses."""
+
+    parsed = []
+    orig = SharedLoader._visit_module
+
+    def spy(self, module_name, *args, **kwargs):
+        parsed.append(module_name)
+        return orig(self, module_name, *args, **kwargs)
+
+    monkeypatch.setattr(SharedLoader, "_visit_module", spy)
+
+    return parsed
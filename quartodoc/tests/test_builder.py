@@ -20,6 +20,7 @@ def builder(tmp_path):
     )
 
     builder = Builder(package="quartodoc", sections=[section], dir=str(tmp_path))
+    builder.out_inventory = str(tmp_path / "objects.json")
 
     yield builder
 
@@ -225,3 +226,327 @@ def test_builder_index_topmatter_fallback(tmp_path):
 
     index = (Path(tmp_path) / "index.qmd").read_text()
     assert "title: Function Reference" in index
+
+
+def test_builder_build_jobs_identical_output(tmp_path):
+    section = lo.Section(
+        title="abc",
+        contents=[
+            lo.Auto(name="get_object"),
+            lo.Auto(name="blueprint"),
+            lo.Auto(
+                name="MdRenderer", members=["render", "summarize"], children="separate"
+            ),
+        ],
+    )
+
+    dirs = {}
+    for jobs in [1, 2]:
+        p_dir = tmp_path / f"jobs_{jobs}"
+        builder = Builder(
+            package="quartodoc", sections=[section], dir=str(p_dir), jobs=jobs
+        )
+        builder.out_inventory = str(tmp_path / f"objects_{jobs}.json")
+        builder.out_manifest = str(tmp_path / f"manifest_{jobs}.json")
+        builder.build()
+
+        dirs[jobs] = {p.name: p.read_bytes() for p in p_dir.glob("*")}
+
+    assert len(dirs[1]) == 6
+    assert dirs[1] == dirs[2]
+
+
+def test_builder_build_stream_identical_output(tmp_path, monkeypatch):
+    from quartodoc.renderers.base import RenderedPage
+
+    section = lo.Section(
+        title="abc",
+        contents=[
+            lo.Auto(name="get_object"),
+            lo.Auto(
+                name="MdRenderer", members=["render", "summarize"], children="separate"
+            ),
+        ],
+    )
+
+    outputs = {}
+    for stream in [False, True]:
+        p_root = tmp_path / f"stream_{stream}"
+        p_root.mkdir()
+        monkeypatch.chdir(p_root)
+
+        builder = Builder(
+            package="quartodoc",
+            sections=[section],
+            sidebar="_sidebar.yml",
+            stream=stream,
+        )
+        builder.build()
+
+        files = [*p_root.glob("reference/*"), p_root / "_sidebar.yml"]
+        outputs[stream] = {p.name: p.read_bytes() for p in files}
+        outputs[stream]["objects.json"] = (p_root / "objects.json").read_bytes()
+
+    assert len(outputs[False]) == 7
+    assert outputs[False] == outputs[True]
+
+    # only lightweight records of each page are kept
+    entries = list(builder._entries.values())
+    assert all(isinstance(entry.page, RenderedPage) for entry in entries)
+    assert all(entry.pages == [] for entry in entries)
+
+
+def test_builder_build_stream_clears_doc_memo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    names = ["get_object", "Builder", "MdRenderer", "blueprint", "collect"]
+    section = lo.Section(title="abc", contents=[lo.Auto(name=x) for x in names])
+    builder = Builder(package="quartodoc", sections=[section], stream=True)
+
+    # record the memo's size as each entry's pages are written
+    transformers, sizes = [], []
+    orig_create_transformer = builder._create_transformer
+    orig_write_doc_pages = builder.write_doc_pages
+
+    def spy_create_transformer(*args, **kwargs):
+        transformers.append(orig_create_transformer(*args, **kwargs))
+        return transformers[-1]
+
+    def spy_write_doc_pages(pages, filter):
+        sizes.append(len(transformers[0].docs))
+        return orig_write_doc_pages(pages, filter)
+
+    monkeypatch.setattr(builder, "_create_transformer", spy_create_transformer)
+    monkeypatch.setattr(builder, "write_doc_pages", spy_write_doc_pages)
+
+    builder.build()
+
+    # each entry only holds its own docs, rather than every earlier entry's
+    docs = transformers[0].docs
+    assert len(sizes) == len(names)
+    assert all(size > 0 for size in sizes)
+    assert max(sizes) < sum(sizes)
+    assert len(docs) == 0
+    assert docs.misses == sum(sizes)
+
+
+def test_builder_build_filter_reuses_entries(builder, monkeypatch):
+    from quartodoc.builder.blueprint import BlueprintTransformer
+
+    builder.out_inventory = str(Path(builder.dir) / "objects.json")
+    builder.out_manifest = str(Path(builder.dir) / "manifest.json")
+    builder.build()
+
+    p_index = Path(builder.dir) / "index.qmd"
+    p_inv = Path(builder.out_inventory)
+    index, inventory = p_index.read_text(), p_inv.read_text()
+
+    # track the objects blueprinted and pages rendered during the filtered build
+    fetched, rendered = [], []
+    orig_get_object_fixed = BlueprintTransformer.get_object_fixed
+    orig_render = builder.renderer.render
+
+    def spy_get_object_fixed(self, path, **kwargs):
+        fetched.append(path)
+        return orig_get_object_fixed(self, path, **kwargs)
+
+    def spy_render(el):
+        if isinstance(el, lo.Page):
+            rendered.append(el.path)
+        return orig_render(el)
+
+    monkeypatch.setattr(BlueprintTransformer, "get_object_fixed", spy_get_object_fixed)
+    monkeypatch.setattr(builder.renderer, "render", spy_render)
+
+    # a new builder, so entries come from the manifest rather than memory
+    builder._entries = None
+    builder.build(filter="get_object")
+
+    assert fetched == ["quartodoc:get_object"]
+    assert rendered == ["get_object"]
+
+    # the index and inventory still include unbuilt pages
+    assert p_index.read_text() == index
+    assert p_inv.read_text() == inventory
+
+
+def test_builder_build_skips_entry_records_without_manifest(builder, monkeypatch):
+    specs = []
+    orig_entry_spec = Builder._entry_spec
+
+    def spy_entry_spec(self, el):
+        specs.append(el)
+        return orig_entry_spec(self, el)
+
+    monkeypatch.setattr(Builder, "_entry_spec", spy_entry_spec)
+
+    builder.build()
+    assert builder.manifest.path is None
+    assert specs == []
+
+    # records are only computed when the manifest is saved for later builds
+    builder.out_manifest = str(Path(builder.dir) / "manifest.json")
+    builder.build()
+    assert len(specs) > 0
+
+
+INCREMENTAL_MOD_A = '''
+def f_a():
+    """A function."""
+'''
+
+INCREMENTAL_MOD_B = '''
+def f_b():
+    """B function."""
+'''
+
+
+def test_builder_build_incremental(tmp_path, monkeypatch, make_package):
+    files = {"__init__.py": "", "mod_a.py": INCREMENTAL_MOD_A}
+    p_pkg = make_package("incr_pkg", {**files, "mod_b.py": INCREMENTAL_MOD_B})
+
+    section = lo.Section(
+        title="abc",
+        contents=[lo.Auto(name="mod_a.f_a"), lo.Auto(name="mod_b.f_b")],
+    )
+    p_dir = tmp_path / "reference"
+    builder = Builder(package="incr_pkg", sections=[section], dir=str(p_dir))
+    builder.out_inventory = str(tmp_path / "objects.json")
+    builder.out_manifest = str(tmp_path / "manifest.json")
+    builder.build()
+
+    # track which pages get rendered during the rebuild ----
+    rendered = []
+    orig_render = builder.renderer.render
+
+    def spy_render(el):
+        if isinstance(el, lo.Page):
+            rendered.append(el.path)
+        return orig_render(el)
+
+    monkeypatch.setattr(builder.renderer, "render", spy_render)
+
+    p_mod_a = p_pkg / "mod_a.py"
+    p_mod_a.write_text(INCREMENTAL_MOD_A.replace("A function.", "New A function."))
+
+    builder.build_incremental([str(p_mod_a)])
+
+    assert rendered == ["mod_a.f_a"]
+    assert "New A function." in (p_dir / "mod_a.f_a.qmd").read_text()
+    assert "New A function." in (p_dir / "index.qmd").read_text()
+    assert [item.name for item in builder.items] == [
+        "incr_pkg.mod_a.f_a",
+        "incr_pkg.mod_b.f_b",
+    ]
+
+    # changes to files no page depends on are skipped ----
+    rendered.clear()
+    builder.build_incremental([str(p_pkg / "__init__.py")])
+
+    assert rendered == []
+
+
+def test_builder_manifest_skips_unchanged(tmp_path):
+    section = lo.Section(
+        title="abc",
+        contents=[lo.Auto(name="get_object"), lo.Auto(name="blueprint")],
+    )
+
+    p_dir = tmp_path / "reference"
+    builder = Builder(package="quartodoc", sections=[section], dir=str(p_dir))
+    builder.out_inventory = str(tmp_path / "objects.json")
+    builder.out_manifest = str(tmp_path / "manifest.json")
+
+    builder.build()
+    assert len(builder.manifest.written) == 4
+
+    # second build writes nothing ----
+    builder.build()
+    assert builder.manifest.stale() == []
+
+    p_manifest = tmp_path / "manifest.json"
+    assert str(p_dir / "get_object.qmd") in p_manifest.read_text()
+
+    from quartodoc.builder.manifest import Manifest
+
+    manifest = Manifest(p_manifest)
+    assert manifest.write(p_dir / "get_object.qmd", "new content")
+    assert not manifest.write(
+        p_dir / "blueprint.qmd", (p_dir / "blueprint.qmd").read_text()
+    )
+    assert manifest.changed == [(p_dir / "get_object.qmd").as_posix()]
+
+
+def test_builder_manifest_saved_in_cache_dir(tmp_path, monkeypatch):
+    import json
+
+    monkeypatch.chdir(tmp_path)
+    section = lo.Section(title="abc", contents=[lo.Auto(name="get_object")])
+
+    # without a cache, nothing is saved ----
+    builder = Builder(package="quartodoc", sections=[section], dir="reference")
+    builder.build()
+
+    assert builder.manifest.path is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["objects.json", "reference"]
+
+    # with a cache, the manifest is saved in it, using relative paths ----
+    builder = Builder(
+        package="quartodoc", sections=[section], dir="reference", cache_dir="cache"
+    )
+    builder.build()
+
+    data = json.loads((tmp_path / "cache" / "manifest.json").read_text())
+    assert "reference/get_object.qmd" in data["files"]
+
+    (entry,) = data["entries"].values()
+    assert "quartodoc/autosummary.py" in entry["files"]
+    assert builder.manifest.source_file("quartodoc/autosummary.py") == str(
+        Path(__file__).parents[1] / "autosummary.py"
+    )
+
+
+def test_manifest_checks_files_changed_since_save(tmp_path):
+    from quartodoc.builder.manifest import Manifest
+
+    p_file = tmp_path / "page.qmd"
+    p_manifest = tmp_path / "manifest.json"
+
+    manifest = Manifest(p_manifest)
+    assert manifest.write(p_file, "old content")
+    manifest.save()
+
+    # a build writes new content, but crashes before saving the manifest
+    crashed = Manifest(p_manifest)
+    assert crashed.write(p_file, "new content!")
+
+    # so the saved hash no longer describes the file on disk
+    manifest = Manifest(p_manifest)
+    assert not manifest.is_unchanged(p_file, "old content")
+    assert manifest.write(p_file, "old content")
+    assert p_file.read_text() == "old content"
+
+    assert manifest.is_unchanged(p_file, "old content")
+    assert not manifest.write(p_file, "old content")
+
+
+def test_builder_manifest_stale_pages(tmp_path):
+    contents = [lo.Auto(name="get_object"), lo.Auto(name="blueprint")]
+
+    p_dir = tmp_path / "reference"
+    builder = Builder(
+        package="quartodoc",
+        sections=[lo.Section(title="abc", contents=contents)],
+        dir=str(p_dir),
+    )
+    builder.out_inventory = str(tmp_path / "objects.json")
+    builder.out_manifest = str(tmp_path / "manifest.json")
+    builder.build()
+
+    # remove an object from the layout ----
+    builder.layout = builder.load_layout(
+        sections=[lo.Section(title="abc", contents=contents[:1])], package="quartodoc"
+    )
+    builder.build()
+
+    assert builder.manifest.stale() == [(p_dir / "blueprint.qmd").as_posix()]
@@ -0,0 +1,45 @@
+from quartodoc import get_object
+from quartodoc import layout as lo
+from quartodoc.builder.aliases import final_target, is_external_alias
+from quartodoc.builder.loader import SharedLoader
+from quartodoc.tests.conftest import MOD_SOURCE, edit_file
+
+
+def test_alias_table_memoizes_final_target(pkg_path):
+    loader = SharedLoader()
+    alias = get_object("loader_pkg:f_0", loader=loader)
+
+    assert final_target(alias) is loader.modules_collection["loader_pkg.mod_0.f_0"]
+    assert final_target(alias) is final_target(alias)
+    assert (loader.aliases.hits, loader.aliases.misses) == (2, 1)
+
+    assert not is_external_alias(alias, "loader_pkg")
+    assert is_external_alias(alias, "other_pkg")
+    assert not is_external_alias(alias, "loader_pkg")
+    assert (loader.aliases.hits, loader.aliases.misses) == (3, 3)
+
+
+def test_alias_table_cleared_by_refresh(pkg_path):
+    loader = SharedLoader()
+    alias = get_object("loader_pkg:f_0", loader=loader)
+    final_target(alias)
+
+    edit_file(pkg_path / "mod_0.py", MOD_SOURCE.format(ii=0).replace("Function", "New"))
+    loader.refresh()
+
+    alias = get_object("loader_pkg:f_0", loader=loader)
+
+    assert final_target(alias).docstring.value == "New 0."
+
+
+def test_builder_alias_table_hits(pkg_path, make_builder):
+    # the same re-exported function, documented in two sections
+    sections = [
+        lo.Section(title="a", contents=[lo.Auto(name="f_0")]),
+        lo.Section(title="b", contents=[lo.Auto(name="f_0", signature_name="full")]),
+    ]
+    builder = make_builder(sections=sections)
+    builder.build()
+
+    assert builder.loader.aliases.misses == 1
+    assert builder.loader.aliases.hits > 0
@@ -1,4 +1,5 @@
 from functools import partial
+from pathlib import Path
 from quartodoc._griffe_compat import AliasResolutionError
 from quartodoc import get_object
 from quartodoc import layout as lo
@@ -317,3 +318,167 @@ def test_blueprint_member_options():
 
     # this currently does not apply to members of members
     assert doc_a_class.members[0].signature_name == "relative"
+
+
+@pytest.mark.parametrize("dynamic", [False, True])
+def test_blueprint_linked_members_not_blueprinted(bp, dynamic, monkeypatch):
+    entered = []
+    enter_auto = BlueprintTransformer._enter_auto
+
+    def spy(self, el, path):
+        entered.append(path)
+        return enter_auto(self, el, path)
+
+    monkeypatch.setattr(BlueprintTransformer, "_enter_auto", spy)
+
+    path = "quartodoc.tests.example:AClass"
+    auto = lo.Auto(name=path, children="linked", dynamic=dynamic)
+    res = bp.visit(auto)
+
+    assert entered == [path]
+    assert all(isinstance(entry, lo.Link) for entry in res.members)
+
+    embedded = bp.visit(lo.Auto(name=path, dynamic=dynamic))
+    assert [(link.name, link.obj.path) for link in res.members] == [
+        (doc.obj.path, doc.obj.path) for doc in embedded.members
+    ]
+
+
+def test_blueprint_linked_members_nested_in_sections(bp):
+    # sections set the package and options for the Autos they contain, which
+    # linked members must use, without leaking into the following section
+    lay = lo.Layout(
+        sections=[
+            lo.Section(
+                title="a",
+                package=TEST_MOD,
+                options=lo.AutoOptions(dynamic=True),
+                contents=[
+                    lo.Auto(
+                        name="AClass",
+                        children="linked",
+                        member_options=lo.AutoOptions(signature_name="short"),
+                    )
+                ],
+            ),
+            lo.Section(title="b", contents=[lo.Auto(name="get_object")]),
+        ],
+        package="quartodoc",
+    )
+
+    res = bp.visit(lay)
+    doc_cls = res.sections[0].contents[0].contents[0]
+    doc_func = res.sections[1].contents[0].contents[0]
+
+    assert [link.name for link in doc_cls.members] == [
+        f"{TEST_MOD}.AClass.a_attr",
+        f"{TEST_MOD}.AClass.a_method",
+    ]
+    assert all(link.obj.path == link.name for link in doc_cls.members)
+    assert doc_func.obj.path == "quartodoc.get_object"
+
+    assert bp.crnt_package is None
+    assert bp.options is None
+
+
+def test_blueprint_memoizes_docs(bp):
+    lay = lo.Layout(
+        sections=[
+            lo.Section(title="a", contents=[lo.Auto(name="AClass")]),
+            lo.Section(title="b", contents=[lo.Auto(name="AClass")]),
+            lo.Section(
+                title="c", contents=[lo.Auto(name="AClass", signature_name="short")]
+            ),
+        ],
+        package=TEST_MOD,
+    )
+
+    res = bp.visit(lay)
+    doc_a, doc_b, doc_c = [sec.contents[0].contents[0] for sec in res.sections]
+
+    # the repeated Auto reuses the doc, but different options do not
+    assert doc_b is doc_a
+    assert doc_c is not doc_a
+    assert doc_c.signature_name == "short"
+
+    # members have the same options, so are reused
+    assert doc_c.members[0] is doc_a.members[0]
+    assert bp.docs.hits == 1 + len(doc_a.members)
+    assert bp.docs.misses == len(bp.docs)
+
+
+def test_blueprint_memo_keys_inherited_members_by_path(bp):
+    lay = lo.Layout(
+        sections=[
+            lo.Section(
+                title="a",
+                contents=[
+                    lo.Auto(name="C"),
+                    lo.Auto(name="Child", include_inherited=True),
+                ],
+            ),
+        ],
+        package="quartodoc.tests.example_class",
+    )
+
+    res = bp.visit(lay)
+    doc_c, doc_child = [auto.contents[0] for auto in res.sections[0].contents]
+    members_c = {doc.name: doc for doc in doc_c.members}
+    members_child = {doc.name: doc for doc in doc_child.members}
+
+    # inherited members are documented under each class, so are not reused
+    meth_c, meth_child = members_c["some_method"], members_child["some_method"]
+    assert meth_child is not meth_c
+    assert meth_child.anchor == "quartodoc.tests.example_class.Child.some_method"
+    assert meth_child.obj.path == meth_child.anchor
+    assert bp.docs.hits == 0
+
+
+# threaded blueprints ----
+
+
+@pytest.mark.parametrize("lazy_load", [False, True])
+def test_builder_blueprint_threads(pkg_path, tmp_path, lazy_load, make_builder):
+    sections = [
+        lo.Section(title="a", contents=[lo.Auto(name="f_0"), lo.Auto(name="mod_1")]),
+        lo.Section(title="b", contents=[lo.Auto(name="mod_2.f_2")]),
+        lo.Section(title="c", contents=[lo.Auto(name="f_0")]),
+    ]
+
+    outputs = []
+    for threads in [1, 4]:
+        builder = make_builder(
+            sections=sections, blueprint_threads=threads, lazy_load=lazy_load
+        )
+        builder.dir = str(tmp_path / f"reference_{threads}")
+        builder.build()
+
+        p_ref = Path(builder.dir)
+        outputs.append({p.name: p.read_text() for p in p_ref.glob("*.qmd")})
+
+    assert len(outputs[0]) == 4
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize("threads", [1, 3])
+def test_builder_blueprint_threads_profiled(pkg_path, threads, make_builder):
+    from quartodoc.profiling import Profiler, enable_profiling
+
+    sections = [
+        lo.Section(title="a", contents=[lo.Auto(name="f_0")]),
+        lo.Section(title="b", contents=[lo.Auto(name="mod_2.f_2")]),
+        lo.Section(title="c", contents=[lo.Auto(name="mod_3.f_3")]),
+    ]
+
+    builder = make_builder(sections=sections, blueprint_threads=threads, lazy_load=True)
+
+    with enable_profiling(Profiler()) as profiler:
+        builder.build()
+
+    names = [e["name"] for e in profiler.events if e["cat"] == "blueprint"]
+    assert sorted(names) == [
+        "loader_pkg:f_0",
+        "loader_pkg:mod_2.f_2",
+        "loader_pkg:mod_3.f_3",
+    ]
+    assert "griffe load" in profiler.phases()
@@ -0,0 +1,89 @@
+import pytest
+
+from quartodoc import layout as lo
+from quartodoc.builder.blueprint import blueprint
+from quartodoc.builder.cache import BlueprintCache
+
+
+MOD_SOURCE = '''
+def a_func():
+    """A function."""
+
+
+class AClass:
+    """A class."""
+
+    def a_method(self):
+        """A method."""
+'''
+
+
+@pytest.fixture
+def mod_path(tmp_path, monkeypatch):
+    p_src = tmp_path / "src"
+    p_src.mkdir()
+
+    p_mod = p_src / "cached_mod.py"
+    p_mod.write_text(MOD_SOURCE)
+
+    monkeypatch.syspath_prepend(str(p_src))
+
+    return p_mod
+
+
+def _layout():
+    return lo.Layout(
+        sections=[
+            lo.Section(
+                title="a section",
+                package="cached_mod",
+                contents=[lo.Auto(name="a_func"), lo.Auto(name="AClass")],
+            )
+        ]
+    )
+
+
+def test_blueprint_cache_reuses_docs(tmp_path, mod_path):
+    p_cache = tmp_path / "cache"
+
+    cache = BlueprintCache(p_cache)
+    res1 = blueprint(_layout(), cache=cache)
+    cache.save()
+
+    assert cache.hits == 0
+    assert (p_cache / BlueprintCache.file_name).exists()
+
+    cache2 = BlueprintCache(p_cache)
+    res2 = blueprint(_layout(), cache=cache2)
+
+    # only the top-level entries need to be fetched
+    assert cache2.hits == 2
+    assert cache2.misses == 0
+    assert str(res1) == str(res2)
+
+
+def test_blueprint_cache_invalidated_by_source_change(tmp_path, mod_path):
+    p_cache = tmp_path / "cache"
+
+    cache = BlueprintCache(p_cache)
+    blueprint(_layout(), cache=cache)
+    cache.save()
+
+    mod_path.write_text(MOD_SOURCE.replace("A function.", "A changed function."))
+
+    cache2 = BlueprintCache(p_cache)
+    res = blueprint(_layout(), cache=cache2)
+    doc = res.sections[0].contents[0].contents[0]
+
+    assert cache2.hits == 0
+    assert doc.obj.docstring.value == "A changed function."
+
+
+def test_blueprint_cache_key_uses_options(tmp_path, mod_path):
+    cache = BlueprintCache(tmp_path / "cache")
+
+    key1 = cache.key("cached_mod:AClass", lo.Auto(name="AClass"), False)
+    key2 = cache.key("cached_mod:AClass", lo.Auto(name="AClass", members=[]), False)
+    key3 = cache.key("cached_mod:AClass", lo.Auto(name="AClass"), True)
+
+    assert len({key1, key2, key3}) == 3
@@ -0,0 +1,50 @@
+from quartodoc import get_object
+from quartodoc.builder.loader import SharedLoader
+from quartodoc.tests.conftest import INIT_SOURCE, MOD_SOURCE, DYNAMIC_SOURCE, edit_file
+
+
+def test_dynamic_docs_collected_once_per_module(pkg_path):
+    (pkg_path / "dyn.py").write_text(DYNAMIC_SOURCE)
+    (pkg_path / "__init__.py").write_text(INIT_SOURCE + "from .dyn import A\n")
+
+    loader = SharedLoader()
+    for name in ["A", "A.m_0", "A.m_1"]:
+        get_object(f"loader_pkg:{name}", dynamic=True, loader=loader)
+
+    cls = loader.modules_collection["loader_pkg.dyn.A"]
+    assert cls.docstring.value == "Dynamic class."
+    assert cls.members["m_0"].docstring.value == "Dynamic 0."
+    assert cls.members["m_1"].docstring.value == "Dynamic 1."
+
+    # each member fetches the class as its parent, which is memoized
+    assert loader.dynamic_docs.n_modules == 1
+    assert loader.dynamic_docs.hits == 2
+
+    res = get_object("loader_pkg:A.m_0", dynamic=True, loader=loader)
+    assert res.docstring.value == "Dynamic 0."
+    assert loader.dynamic_docs.hits == 3
+
+
+def test_dynamic_docs_kept_for_unchanged_modules(pkg_path):
+    (pkg_path / "dyn.py").write_text(DYNAMIC_SOURCE)
+
+    loader = SharedLoader()
+    get_object("loader_pkg.dyn:A", dynamic=True, loader=loader)
+    m_0 = loader.modules_collection["loader_pkg.dyn.A.m_0"]
+    parsed = m_0.docstring
+
+    edit_file(pkg_path / "mod_0.py", MOD_SOURCE.format(ii=0) + "\nx = 1\n")
+    assert loader.refresh() == ["loader_pkg.mod_0"]
+
+    get_object("loader_pkg.dyn:A", dynamic=True, loader=loader)
+
+    assert loader.dynamic_docs.n_modules == 1
+    assert loader.modules_collection["loader_pkg.dyn.A.m_0"].docstring is parsed
+
+    edit_file(pkg_path / "dyn.py", DYNAMIC_SOURCE + "\nx = 1\n")
+    assert loader.refresh() == ["loader_pkg.dyn"]
+
+    res = get_object("loader_pkg.dyn:A", dynamic=True, loader=loader)
+
+    assert loader.dynamic_docs.n_modules == 2
+    assert res.members["m_0"].docstring.value == "Dynamic 0."
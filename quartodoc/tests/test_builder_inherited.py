@@ -0,0 +1,71 @@
+from quartodoc import get_object
+from quartodoc.builder.aliases import final_target
+from quartodoc.builder.loader import SharedLoader
+from quartodoc.tests.conftest import edit_file
+
+
+INHERIT_SOURCE = """
+class A:
+    def f(self): pass
+    def g(self): pass
+
+class B(A):
+    def h(self): pass
+
+class C(A):
+    def f(self): pass
+    def h(self): pass
+
+class D(B, C):
+    pass
+
+class E(D):
+    def g(self): pass
+"""
+
+
+def _members(members):
+    return {
+        name: (final_target(m) if m.is_alias else m).path for name, m in members.items()
+    }
+
+
+def test_inherited_members_match_griffe(pkg_path):
+    from quartodoc.builder.inherited import all_members
+
+    (pkg_path / "mod_0.py").write_text(INHERIT_SOURCE)
+    loader = SharedLoader()
+
+    for name in "ABCDE":
+        cls = get_object(f"loader_pkg.mod_0:{name}", loader=loader)
+        assert _members(all_members(cls)) == _members(cls.all_members)
+        assert list(all_members(cls)) == list(cls.all_members)
+
+    # E's table extends D's, which follows the MRO of its two bases
+    e = loader.modules_collection["loader_pkg.mod_0.E"]
+    assert _members(all_members(e)) == {
+        "f": "loader_pkg.mod_0.C.f",
+        "h": "loader_pkg.mod_0.B.h",
+        "g": "loader_pkg.mod_0.E.g",
+    }
+
+    # looking up an inherited member uses the table
+    hits = loader.inherited.hits
+    f = loader.modules_collection["loader_pkg.mod_0.E.f"]
+    assert f.inherited and f.parent is e
+    assert loader.modules_collection["loader_pkg.mod_0.E.f"] is f
+    assert loader.inherited.hits == hits + 2
+
+
+def test_inherited_members_cleared_by_refresh(pkg_path):
+    (pkg_path / "mod_0.py").write_text(INHERIT_SOURCE)
+    loader = SharedLoader()
+    get_object("loader_pkg.mod_0:E.f", loader=loader)
+
+    edit_file(
+        pkg_path / "mod_0.py", INHERIT_SOURCE.replace("class D(B, C)", "class D(C, B)")
+    )
+    loader.refresh()
+
+    f = get_object("loader_pkg.mod_0:E.h", loader=loader)
+    assert final_target(f).path == "loader_pkg.mod_0.C.h"
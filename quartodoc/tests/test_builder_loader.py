@@ -0,0 +1,363 @@
+from functools import partial
+
+import pytest
+
+from quartodoc import get_object
+from quartodoc import layout as lo
+from quartodoc import Builder
+from quartodoc.builder.blueprint import _resolve_alias
+from quartodoc.builder.loader import SharedLoader
+from quartodoc.tests.conftest import N_MODULES, MOD_SOURCE, edit_file
+
+
+@pytest.mark.parametrize("n_changed", [0, 1, 3])
+def test_shared_loader_reload_scales_with_changes(pkg_path, visits, n_changed):
+    loader = SharedLoader()
+    loader.load("loader_pkg")
+
+    assert len(visits) == N_MODULES + 1
+    visits.clear()
+
+    for ii in range(n_changed):
+        edit_file(pkg_path / f"mod_{ii}.py", MOD_SOURCE.format(ii=ii) + "\nx = 1\n")
+
+    reloaded = loader.refresh()
+
+    assert reloaded == [f"loader_pkg.mod_{ii}" for ii in range(n_changed)]
+    assert len(visits) == n_changed
+    assert loader.n_reloads == n_changed
+    assert loader.n_loads == 1
+
+
+def test_shared_loader_touch_does_not_reload(pkg_path, visits):
+    loader = SharedLoader()
+    loader.load("loader_pkg")
+    visits.clear()
+
+    edit_file(pkg_path / "mod_1.py", (pkg_path / "mod_1.py").read_text())
+
+    assert loader.refresh() == []
+    assert visits == []
+
+
+def test_shared_loader_reload_updates_aliases(pkg_path):
+    loader = SharedLoader()
+
+    f_alias = get_object("loader_pkg:f_0", loader=loader)
+    assert f_alias.docstring.value == "Function 0."
+
+    edit_file(pkg_path / "mod_0.py", MOD_SOURCE.format(ii=0).replace("Function", "New"))
+    loader.refresh()
+
+    # the alias in __init__ now resolves to the reloaded function
+    f_alias = get_object("loader_pkg:f_0", loader=loader)
+    assert f_alias.docstring.value == "New 0."
+
+    # and its parent module knows about its submodules
+    assert "mod_1" in loader.modules_collection["loader_pkg"].members
+
+
+def test_shared_loader_new_module_reloads_package(pkg_path, visits):
+    loader = SharedLoader()
+    loader.load("loader_pkg")
+
+    (pkg_path / "mod_new.py").write_text(MOD_SOURCE.format(ii="new"))
+
+    assert loader.refresh() == ["loader_pkg"]
+
+    f_new = get_object("loader_pkg.mod_new:f_new", loader=loader)
+    assert f_new.docstring.value == "Function new."
+    assert loader.n_loads == 2
+
+
+def test_builder_reuses_loader(pkg_path, tmp_path, visits, make_builder):
+    section = lo.Section(
+        title="abc", contents=[lo.Auto(name="mod_0.f_0"), lo.Auto(name="mod_1.f_1")]
+    )
+    builder = make_builder(sections=[section])
+
+    builder.build()
+    loader = builder.loader
+    visits.clear()
+
+    edit_file(pkg_path / "mod_1.py", MOD_SOURCE.format(ii=1).replace("Function", "New"))
+    builder.build()
+
+    assert builder.loader is loader
+    assert loader.n_loads == 1
+    assert visits == ["mod_1"]
+    assert "New 1." in (tmp_path / "reference" / "mod_1.f_1.qmd").read_text()
+
+
+# lazy loading ----
+
+
+def test_shared_loader_lazy_loads_needed_modules(pkg_path):
+    eager = SharedLoader()
+    get_object("loader_pkg.mod_2:f_2", loader=eager)
+
+    lazy = SharedLoader(lazy=True)
+    f_2 = get_object("loader_pkg.mod_2:f_2", loader=lazy)
+
+    assert f_2.docstring.value == "Function 2."
+    # __init__, mod_2, and mod_0, which __init__ imports from
+    assert eager.n_modules == N_MODULES + 1
+    assert lazy.n_modules == 3
+
+
+def test_shared_loader_lazy_resolves_aliases(pkg_path):
+    loader = SharedLoader(lazy=True)
+
+    # the alias in __init__ points to mod_0, so only it is loaded to resolve it
+    f_0 = get_object("loader_pkg:f_0", loader=loader)
+
+    assert f_0.docstring.value == "Function 0."
+    assert loader.n_modules == 2
+    assert set(loader.modules_collection["loader_pkg"].modules) == {"mod_0"}
+
+
+def test_shared_loader_lazy_module_lists_submodules(pkg_path):
+    loader = SharedLoader(lazy=True)
+
+    mod = get_object("loader_pkg", loader=loader)
+
+    assert set(mod.modules) == {f"mod_{ii}" for ii in range(N_MODULES)}
+    assert loader.n_modules == N_MODULES + 1
+
+
+def test_shared_loader_lazy_missing_object(pkg_path):
+    loader = SharedLoader(lazy=True)
+
+    with pytest.raises(KeyError):
+        get_object("loader_pkg.mod_1:not_here", loader=loader)
+
+    with pytest.raises(KeyError):
+        get_object("loader_pkg.not_here:f", loader=loader)
+
+
+def test_shared_loader_lazy_refresh(pkg_path):
+    loader = SharedLoader(lazy=True)
+    get_object("loader_pkg.mod_1:f_1", loader=loader)
+
+    edit_file(pkg_path / "mod_1.py", MOD_SOURCE.format(ii=1).replace("Function", "New"))
+
+    assert loader.refresh() == ["loader_pkg.mod_1"]
+    assert get_object("loader_pkg.mod_1:f_1", loader=loader).docstring.value == "New 1."
+
+
+def test_builder_lazy_load(pkg_path, tmp_path, make_builder):
+    section = lo.Section(title="abc", contents=[lo.Auto(name="mod_3.f_3")])
+    builder = make_builder(sections=[section], lazy_load=True)
+
+    builder.build()
+
+    assert builder.loader.n_modules == 3
+    assert "Function 3." in (tmp_path / "reference" / "mod_3.f_3.qmd").read_text()
+
+
+# external packages ----
+
+
+@pytest.fixture
+def ext_path(make_package):
+    files = {f"{name}.py": MOD_SOURCE.format(ii=name) for name in ["a", "b", "c"]}
+    p_ext = make_package(
+        "ext_pkg", {"__init__.py": "from .a import f_a\n", **files}, src="ext_src"
+    )
+
+    main_init = (
+        '"""A package."""\n'
+        "from ext_pkg import f_a\n"
+        "from ext_pkg.b import f_b\n"
+        "from not_installed_pkg import f_missing\n"
+    )
+    make_package("main_pkg", {"__init__.py": main_init}, src="ext_src")
+
+    return p_ext
+
+
+def test_load_external_failures_attempted_once(ext_path, monkeypatch):
+    from quartodoc._griffe_compat import GriffeLoader
+
+    attempts = []
+    orig = GriffeLoader.load
+
+    def spy(self, objspec=None, /, **kwargs):
+        attempts.append(objspec)
+        return orig(self, objspec, **kwargs)
+
+    monkeypatch.setattr(GriffeLoader, "load", spy)
+
+    loader = SharedLoader()
+
+    assert not loader.load_external("not_installed_pkg.f_missing")
+    assert not loader.load_external("not_installed_pkg.other.f")
+    assert attempts == ["not_installed_pkg"]
+
+    assert loader.load_external("ext_pkg.b.f_b")
+    assert loader.load_external("ext_pkg.c.f_c")
+    assert attempts == ["not_installed_pkg", "ext_pkg"]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"external_include": ["other_pkg"]}, {"external_exclude": ["ext_pkg"]}]
+)
+def test_load_external_include_exclude(ext_path, kwargs):
+    loader = SharedLoader(**kwargs)
+
+    assert not loader.load_external("ext_pkg.b.f_b")
+    assert "ext_pkg" not in loader.modules_collection
+    assert loader.n_modules == 0
+
+
+def test_load_external_submodules(ext_path):
+    loader = SharedLoader(external_submodules=True)
+
+    assert loader.load_external("ext_pkg.b.f_b")
+    assert loader.n_modules == 1
+    assert loader.modules_collection["ext_pkg.b.f_b"].docstring.value == "Function b."
+
+    # f_a is imported in __init__, so it is loaded, followed by the module that
+    # defines f_a, when resolving the alias
+    main = get_object("main_pkg", loader=loader)
+    f_a = _resolve_alias(
+        main.members["f_a"], partial(get_object, loader=loader), loader
+    )
+
+    assert f_a.docstring.value == "Function a."
+    assert loader.n_modules == 4
+    assert "c" not in loader.modules_collection["ext_pkg"].members
+
+
+def test_blueprint_skips_excluded_external_members(ext_path, tmp_path):
+    builder = Builder(
+        package=None,
+        sections=[
+            lo.Section(contents=[lo.Auto(name="main_pkg", include_imports=True)])
+        ],
+        dir=str(tmp_path / "reference"),
+        external_exclude=["ext_pkg"],
+    )
+
+    bp = builder._create_transformer().visit(builder.layout)
+    doc = bp.sections[0].contents[0].contents[0]
+
+    assert [child.name for child in doc.members] == []
+
+    builder = Builder(
+        package=None,
+        sections=[
+            lo.Section(contents=[lo.Auto(name="main_pkg", include_imports=True)])
+        ],
+        dir=str(tmp_path / "reference"),
+        external_submodules=True,
+    )
+
+    bp = builder._create_transformer().visit(builder.layout)
+    doc = bp.sections[0].contents[0].contents[0]
+
+    assert [child.name for child in doc.members] == ["f_a", "f_b"]
+    assert "c" not in builder.loader.modules_collection["ext_pkg"].members
+
+
+# snapshots ----
+
+
+def test_snapshot_round_trip(pkg_path, tmp_path):
+    loader = SharedLoader()
+    f_0 = get_object("loader_pkg:f_0", loader=loader)
+    loader.save_snapshot(tmp_path / "snapshot.json")
+
+    new_loader = SharedLoader()
+
+    assert new_loader.load_snapshot(tmp_path / "snapshot.json") == ["loader_pkg"]
+
+    new_f_0 = get_object("loader_pkg:f_0", loader=new_loader)
+
+    assert new_loader.n_modules == 0
+    assert new_f_0.target.path == f_0.target.path
+    assert new_f_0.docstring.value == f_0.docstring.value
+    assert new_f_0.docstring.parser == f_0.docstring.parser
+
+
+@pytest.mark.parametrize("content, restored", [("x = 1\n", []), (None, ["loader_pkg"])])
+def test_snapshot_validates_files(pkg_path, tmp_path, content, restored):
+    loader = SharedLoader()
+    loader.load("loader_pkg")
+    loader.save_snapshot(tmp_path / "snapshot.json")
+
+    # note that touching a file without changing it does not invalidate it
+    p_mod = pkg_path / "mod_1.py"
+    edit_file(p_mod, p_mod.read_text() + content if content else p_mod.read_text())
+
+    assert SharedLoader().load_snapshot(tmp_path / "snapshot.json") == restored
+
+
+def test_snapshot_validates_added_files(pkg_path, tmp_path):
+    loader = SharedLoader()
+    loader.load("loader_pkg")
+    loader.save_snapshot(tmp_path / "snapshot.json")
+
+    (pkg_path / "mod_new.py").write_text("")
+
+    assert SharedLoader().load_snapshot(tmp_path / "snapshot.json") == []
+
+
+def test_builder_reuses_snapshot(pkg_path, tmp_path, make_builder):
+    p_cache = tmp_path / "cache"
+
+    make_builder(cache_dir=str(p_cache)).build()
+    assert (p_cache / "api-snapshot.json").exists()
+
+    (tmp_path / "reference" / "f_0.qmd").unlink()
+    builder = make_builder(cache_dir=str(p_cache))
+    builder.build()
+
+    assert builder.loader.n_modules == 0
+    assert "Function 0." in (tmp_path / "reference" / "f_0.qmd").read_text()
+
+
+def test_builder_incremental_saves_snapshot(pkg_path, tmp_path, make_builder):
+    p_cache = tmp_path / "cache"
+    p_mod = pkg_path / "mod_0.py"
+
+    builder = make_builder(cache_dir=str(p_cache))
+    builder.build()
+
+    edit_file(p_mod, MOD_SOURCE.format(ii=0).replace("Function", "New"))
+    builder.build_incremental([str(p_mod)])
+
+    # a cold build restores every package from the snapshot
+    builder = make_builder(cache_dir=str(p_cache))
+    builder.build()
+
+    assert builder.loader.n_modules == 0
+    assert "New 0." in (tmp_path / "reference" / "f_0.qmd").read_text()
+
+
+def test_builder_source_snapshot(pkg_path, tmp_path, make_builder):
+    import shutil
+
+    p_snapshot = tmp_path / "api-snapshot.json"
+    make_builder().write_snapshot(p_snapshot)
+
+    # the package's source is not needed to build from a snapshot
+    shutil.rmtree(pkg_path)
+
+    builder = make_builder(source=str(p_snapshot))
+    builder.build()
+
+    assert builder.loader.n_modules == 0
+    assert "Function 0." in (tmp_path / "reference" / "f_0.qmd").read_text()
+
+
+def test_shared_loader_pickles_without_lock(pkg_path):
+    import pickle
+
+    loader = SharedLoader()
+    loader.load("loader_pkg")
+
+    new = pickle.loads(pickle.dumps(loader))
+
+    assert new.lock is not loader.lock
+    assert "loader_pkg" in new.modules_collection
@@ -0,0 +1,61 @@
+from quartodoc import get_object
+from quartodoc.builder.loader import SharedLoader
+from quartodoc.tests.conftest import PARSE_SOURCE, edit_file
+
+
+def test_parse_cache_reused_after_reload(pkg_path):
+    from quartodoc.builder.parse_cache import parsed_sections, patched_sections
+
+    (pkg_path / "parsed.py").write_text(PARSE_SOURCE.format(annotation="int"))
+
+    loader = SharedLoader()
+    f = get_object("loader_pkg.parsed:f", loader=loader)
+    params = parsed_sections(f.docstring)[1].value
+
+    assert patched_sections(f.docstring)[0] is parsed_sections(f.docstring)[0]
+    assert (loader.parsed_docs.hits, loader.parsed_docs.misses) == (0, 1)
+
+    # reloaded, but the docstring and signature are unchanged
+    edit_file(
+        pkg_path / "parsed.py", PARSE_SOURCE.format(annotation="int") + "\nx = 1\n"
+    )
+    loader.refresh()
+
+    new_f = get_object("loader_pkg.parsed:f", loader=loader)
+    new_params = parsed_sections(new_f.docstring)[1].value
+
+    assert new_f is not f
+    assert (loader.parsed_docs.hits, loader.parsed_docs.misses) == (1, 1)
+    assert new_params[0].description == params[0].description
+    assert new_params[0].annotation.parent is new_f.module
+
+    # parameter annotations come from the signature, so changing it re-parses
+    edit_file(pkg_path / "parsed.py", PARSE_SOURCE.format(annotation="str"))
+    loader.refresh()
+
+    new_f = get_object("loader_pkg.parsed:f", loader=loader)
+    new_params = parsed_sections(new_f.docstring)[1].value
+
+    assert (loader.parsed_docs.hits, loader.parsed_docs.misses) == (1, 2)
+    assert str(new_params[0].annotation) == "str"
+
+
+def test_builder_parse_cache_saved(pkg_path, tmp_path, make_builder):
+    p_cache = tmp_path / "cache"
+    builder = make_builder(cache_dir=str(p_cache))
+    builder.build()
+
+    assert builder.loader.parsed_docs.misses > 0
+    assert (p_cache / "docstrings.pickle").exists()
+
+    # a new builder, whose blueprint cache and snapshot are out of date
+    (p_cache / "api-snapshot.json").unlink()
+    (p_cache / "blueprint.pickle").unlink()
+    (tmp_path / "reference" / "f_0.qmd").unlink()
+
+    builder = make_builder(cache_dir=str(p_cache))
+    builder.build()
+
+    assert builder.loader.parsed_docs.misses == 0
+    assert builder.loader.parsed_docs.hits > 0
+    assert "Function 0." in (tmp_path / "reference" / "f_0.qmd").read_text()
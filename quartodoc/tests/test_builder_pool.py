@@ -0,0 +1,108 @@
+import pytest
+
+from quartodoc import get_object
+from quartodoc import layout as lo
+from quartodoc.builder.loader import SharedLoader
+from quartodoc.tests.conftest import N_MODULES, INIT_SOURCE, MOD_SOURCE, edit_file
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    from quartodoc.builder import pool as pool_module
+
+    pool = pool_module.LoaderPool(max_size=2)
+    monkeypatch.setattr(pool_module, "loader_pool", pool)
+
+    return pool
+
+
+def test_loader_pool_reused_by_get_object(pkg_path, pool, visits):
+    from quartodoc import blueprint, get_function
+
+    get_object("loader_pkg.mod_0:f_0")
+    get_object("loader_pkg.mod_1:f_1")
+    get_function("loader_pkg.mod_2", "f_2")
+    blueprint(lo.Auto(name="mod_3.f_3"), package="loader_pkg")
+
+    assert len(pool) == 1
+    assert pool.get().n_loads == 1
+    assert len(visits) == N_MODULES + 1
+
+
+def test_loader_pool_refreshes_edited_modules(pkg_path, pool, monkeypatch):
+    from quartodoc import blueprint
+
+    refreshes = []
+    orig_refresh = SharedLoader.refresh
+
+    def spy_refresh(self, *args, **kwargs):
+        refreshes.append(self)
+        return orig_refresh(self, *args, **kwargs)
+
+    monkeypatch.setattr(SharedLoader, "refresh", spy_refresh)
+
+    assert get_object("loader_pkg.mod_0:f_0").docstring.value == "Function 0."
+
+    # get_object returns the pooled loader as-is, so edits need a refresh
+    edit_file(pkg_path / "mod_0.py", MOD_SOURCE.format(ii=0).replace("Function", "New"))
+    assert get_object("loader_pkg.mod_0:f_0").docstring.value == "Function 0."
+    assert refreshes == []
+
+    assert pool.refresh() == ["loader_pkg.mod_0"]
+    assert get_object("loader_pkg.mod_0:f_0").docstring.value == "New 0."
+
+    # blueprint checks for edits once per call
+    edit_file(pkg_path / "mod_0.py", MOD_SOURCE.format(ii=0).replace("Function", "Bp"))
+    refreshes.clear()
+    section = lo.Section(contents=["mod_0.f_0", "mod_1.f_1", "mod_2.f_2"])
+    res = blueprint(lo.Layout(sections=[section], package="loader_pkg"))
+
+    assert res.sections[0].contents[0].contents[0].obj.docstring.value == "Bp 0."
+    assert len(refreshes) == 1
+    assert pool.get().n_loads == 1
+
+
+def test_loader_pool_invalidate(pkg_path, pool):
+    loader = pool.get()
+    get_object("loader_pkg.mod_0:f_0")
+
+    pool.invalidate("loader_pkg")
+    assert "loader_pkg" not in loader.modules_collection
+
+    get_object("loader_pkg.mod_0:f_0")
+    assert loader.n_loads == 2
+
+
+def test_loader_pool_drops_moved_packages(tmp_path, pkg_path, pool, monkeypatch):
+    get_object("loader_pkg.mod_0:f_0")
+
+    # a package of the same name, earlier in the sys.path
+    p_other = tmp_path / "other" / "loader_pkg"
+    p_other.mkdir(parents=True)
+    (p_other / "__init__.py").write_text(INIT_SOURCE)
+    (p_other / "mod_0.py").write_text(
+        MOD_SOURCE.format(ii=0).replace("Function", "Other")
+    )
+    monkeypatch.syspath_prepend(str(p_other.parent))
+
+    assert get_object("loader_pkg.mod_0:f_0").docstring.value == "Other 0."
+
+
+def test_loader_pool_keys_and_size(pkg_path, pool):
+    numpy = pool.get("numpy")
+
+    assert pool.get("numpy") is numpy
+    assert pool.get("numpy", dynamic=True) is not numpy
+    assert len(pool) == 2
+
+    # the least recently used loader is dropped
+    pool.get("numpy")
+    pool.get("google")
+    assert len(pool) == 2
+    assert pool.get("numpy") is numpy
+
+    with pool.disabled():
+        assert pool.get("numpy") is None
+        get_object("loader_pkg.mod_0:f_0")
+
+    assert numpy.n_loads == 0
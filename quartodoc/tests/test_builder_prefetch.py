@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from quartodoc import get_object
+from quartodoc import layout as lo
+from quartodoc.builder.loader import SharedLoader
+from quartodoc.tests.conftest import PARSE_SOURCE
+
+
+def test_prefetch_docstrings(pkg_path):
+    from quartodoc.builder.prefetch import layout_paths, prefetch_docstrings
+
+    (pkg_path / "parsed.py").write_text(PARSE_SOURCE.format(annotation="int"))
+    layout = lo.Layout(
+        package="loader_pkg",
+        sections=[
+            lo.Section(
+                contents=[
+                    lo.Auto(name="parsed"),
+                    lo.Auto(name="f_0"),
+                    lo.Auto(name="mod_1.f_1", dynamic=True),
+                ]
+            )
+        ],
+    )
+
+    paths = layout_paths(layout)
+    assert paths == ["loader_pkg:parsed", "loader_pkg:f_0"]
+
+    loader = SharedLoader()
+    assert prefetch_docstrings(loader, paths, n_workers=2) == 2
+
+    f = get_object("loader_pkg.parsed:f", loader=loader)
+    assert "parsed" in f.docstring.__dict__
+    assert str(f.docstring.parsed[1].value[0].annotation) == "int"
+    assert f.docstring.parsed[1].value[0].annotation.parent is f.module
+
+    # all the docstrings are already parsed
+    assert prefetch_docstrings(loader, paths, n_workers=2) == 0
+    assert loader.parsed_docs.misses == 0
+
+
+def test_builder_parse_workers(pkg_path, tmp_path, make_builder):
+    (pkg_path / "parsed.py").write_text(PARSE_SOURCE.format(annotation="int"))
+    sections = [lo.Section(contents=[lo.Auto(name="parsed"), lo.Auto(name="f_0")])]
+
+    outputs = []
+    for parse_workers in [0, 2]:
+        builder = make_builder(sections=sections, parse_workers=parse_workers)
+        builder.dir = str(tmp_path / f"reference_{parse_workers}")
+        builder.build()
+
+        p_ref = Path(builder.dir)
+        outputs.append({p.name: p.read_text() for p in p_ref.glob("*.qmd")})
+
+    assert outputs[0] == outputs[1]
+    assert builder.loader.parsed_docs.misses == 0
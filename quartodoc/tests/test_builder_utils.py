@@ -0,0 +1,136 @@
+import sys
+
+import pytest
+
+from plum import dispatch
+from quartodoc import layout as lo
+from quartodoc.builder._node import Node
+from quartodoc.builder.blueprint import BlueprintTransformer
+from quartodoc.builder.utils import PydanticTransformer, ctx_node, extract_type
+
+
+class _Renamer(PydanticTransformer):
+    """Rename Text elements, recording the values of their parent nodes."""
+
+    def __init__(self):
+        self.parents = []
+
+    @dispatch
+    def exit(self, el: lo.Text):
+        node = ctx_node.get()
+        self.parents.append(type(node.parent.value))
+
+        return lo.Text(contents=el.contents.upper())
+
+
+class _Titles(PydanticTransformer):
+    """Track the titles of the sections above each Text element."""
+
+    def __init__(self):
+        self.titles = []
+        self.seen = []
+
+    def push_state(self, el):
+        if not isinstance(el, lo.Section):
+            return None
+
+        self.titles.append(el.title)
+        return el.title
+
+    def pop_state(self, state):
+        assert self.titles.pop() == state
+
+    @dispatch
+    def exit(self, el: lo.Section):
+        self.seen.append(list(self.titles))
+        return el
+
+    @dispatch
+    def exit(self, el: lo.Text):
+        if el.contents == "fail":
+            raise ValueError()
+
+        return el
+
+
+def _nested_sections(depth: int) -> lo.Section:
+    el = lo.Section(title="leaf", contents=[lo.Text(contents="x")])
+    for ii in range(depth):
+        el = lo.Section(title=f"s{ii}", contents=[el])
+
+    return el
+
+
+def test_transformer_rebuilds_changed_elements():
+    text = lo.Text(contents="a")
+    auto = lo.Auto(name="b")
+    el = lo.Page(path="p", contents=[text, auto])
+
+    trans = _Renamer()
+    res = trans.visit(el)
+
+    assert res is not el
+    assert res.contents == [lo.Text(contents="A"), auto]
+
+    # unchanged elements are shared with the original
+    assert res.contents[1] is el.contents[1]
+    assert trans.parents == [list]
+
+    # unchanged models are returned as is
+    assert PydanticTransformer().visit(text) is text
+    assert PydanticTransformer().visit(el) is el
+
+
+def test_transformer_ctx_node_unset_outside_visit():
+    with pytest.raises(LookupError):
+        ctx_node.get()
+
+    assert ctx_node.get(None) is None
+
+
+def test_transformer_ctx_node_set_outside_visit():
+    outer = Node(value="outer")
+    token = ctx_node.set(outer)
+
+    try:
+        trans = _Renamer()
+        trans.visit(lo.Text(contents="a"))
+    finally:
+        ctx_node.reset(token)
+
+    assert trans.parents == [str]
+
+
+def test_transformer_deep_tree():
+    depth = sys.getrecursionlimit()
+    el = _nested_sections(depth)
+
+    res = _Renamer().visit(el)
+
+    assert extract_type(lo.Text, res) == [lo.Text(contents="X")]
+
+
+def test_transformer_state_restored():
+    trans = _Titles()
+    el = lo.Section(title="a", contents=[lo.Section(title="b"), lo.Text(contents="x")])
+
+    trans.visit(el)
+
+    assert trans.seen == [["a", "b"], ["a"]]
+    assert trans.titles == []
+
+    # state is restored when an element fails
+    with pytest.raises(ValueError):
+        trans.visit(lo.Section(title="a", contents=[lo.Text(contents="fail")]))
+
+    assert trans.titles == []
+
+
+def test_blueprint_transformer_deep_tree():
+    depth = sys.getrecursionlimit()
+    page = lo.Page(path="p", contents=[_nested_sections(depth)])
+    el = lo.Layout(sections=[lo.Section(title="s", contents=[page])])
+
+    res = BlueprintTransformer().visit(el)
+
+    assert extract_type(lo.Text, res) == [lo.Text(contents="x")]
@@ -0,0 +1,62 @@
+import sys
+
+import pytest
+
+from quartodoc import get_object
+from quartodoc.builder.loader import SharedLoader
+from quartodoc.tests.conftest import MOD_SOURCE, DYNAMIC_SOURCE, edit_file
+
+
+@pytest.fixture
+def import_workers():
+    from quartodoc.builder.workers import ImportWorkers
+
+    workers = ImportWorkers(2)
+    yield workers
+    workers.shutdown()
+
+
+def test_dynamic_docs_import_workers(pkg_path, import_workers):
+    (pkg_path / "dyn.py").write_text(DYNAMIC_SOURCE)
+
+    loader = SharedLoader()
+    loader.dynamic_docs.workers = import_workers
+
+    res = get_object("loader_pkg.dyn:A", dynamic=True, loader=loader)
+
+    assert res.docstring.value == "Dynamic class."
+    assert res.members["m_0"].docstring.value == "Dynamic 0."
+    assert "loader_pkg.dyn" not in sys.modules
+    assert import_workers.n_starts == 1
+
+    # edits restart the worker, which imports the new source
+    edit_file(pkg_path / "dyn.py", DYNAMIC_SOURCE.replace("Dynamic 0.", "Edited 0."))
+    assert loader.refresh() == ["loader_pkg.dyn"]
+
+    res = get_object("loader_pkg.dyn:A", dynamic=True, loader=loader)
+
+    assert res.members["m_0"].docstring.value == "Edited 0."
+    assert import_workers.n_starts == 2
+
+
+def test_dynamic_docs_import_workers_valueless(pkg_path, import_workers):
+    (pkg_path / "dyn.py").write_text('x: int\n"""An annotation."""\n')
+
+    loader = SharedLoader()
+    loader.dynamic_docs.workers = import_workers
+
+    res = get_object("loader_pkg.dyn:x", dynamic=True, loader=loader)
+    assert res.docstring.value == "An annotation."
+
+
+def test_builder_import_workers(pkg_path, tmp_path, make_builder):
+    edit_file(
+        pkg_path / "mod_0.py", MOD_SOURCE.format(ii=0) + 'f_0.__doc__ = "Dynamic."\n'
+    )
+
+    builder = make_builder(dynamic=True, import_workers=1)
+    builder.build()
+    builder.loader.dynamic_docs.workers.shutdown()
+
+    assert "Dynamic." in (tmp_path / "reference" / "f_0.qmd").read_text()
+    assert "loader_pkg" not in sys.modules
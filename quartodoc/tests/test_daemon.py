@@ -0,0 +1,101 @@
+import os
+import socket
+import threading
+
+import pytest
+
+from quartodoc.daemon import BuildDaemon, send_request
+from quartodoc.tests.conftest import edit_file
+
+MOD_A = '''
+def f_a():
+    """A function."""
+'''
+
+MOD_B = '''
+def f_b():
+    """B function."""
+'''
+
+CONFIG = """
+quartodoc:
+  package: daemon_pkg
+  sections:
+    - title: abc
+      contents:
+        - mod_a.f_a
+        - mod_b.f_b
+"""
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch, make_package):
+    files = {"__init__.py": "", "mod_a.py": MOD_A, "mod_b.py": MOD_B}
+    make_package("daemon_pkg", files)
+
+    p_docs = tmp_path / "docs"
+    p_docs.mkdir()
+    (p_docs / "_quarto.yml").write_text(CONFIG)
+    monkeypatch.chdir(p_docs)
+
+    return BuildDaemon("_quarto.yml")
+
+
+def test_daemon_render_cached_until_edit(daemon, tmp_path):
+    res = daemon.handle({"action": "render", "name": "mod_a.f_a"})
+    assert "A function." in res
+    assert daemon.status()["rendered"] == ["mod_a.f_a"]
+
+    # cached results are reused, without blueprinting again
+    trans = daemon._trans
+    assert daemon.handle({"action": "render", "name": "mod_a.f_a"}) is res
+    assert daemon._trans is trans
+
+    edit_file(
+        tmp_path / "src/daemon_pkg/mod_a.py", MOD_A.replace("A func", "New A func")
+    )
+
+    res2 = daemon.handle({"action": "render", "name": "daemon_pkg.mod_a:f_a"})
+    assert "New A function." in res2
+
+
+def test_daemon_build_incremental(daemon, tmp_path):
+    res = daemon.handle({"action": "build"})
+    assert "reference/mod_a.f_a.qmd" in res["changed"]
+    assert daemon.handle({"action": "build"}) == {"changed": []}
+
+    edit_file(
+        tmp_path / "src/daemon_pkg/mod_b.py", MOD_B.replace("B func", "New B func")
+    )
+
+    res = daemon.handle({"action": "build"})
+    assert "reference/mod_b.f_b.qmd" in res["changed"]
+    assert "reference/mod_a.f_a.qmd" not in res["changed"]
+    assert "New B function." in (tmp_path / "docs/reference/mod_b.f_b.qmd").read_text()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requires unix sockets")
+def test_daemon_serve_socket(daemon, tmp_path):
+    p_sock = str(tmp_path / "daemon.sock")
+
+    thread = threading.Thread(target=daemon.serve, args=(p_sock,))
+    thread.start()
+
+    try:
+        # wait for the socket to exist
+        for _ in range(100):
+            if os.path.exists(p_sock):
+                break
+            thread.join(0.05)
+
+        res = send_request({"action": "render", "name": "mod_b.f_b"}, p_sock)
+        assert "B function." in res
+
+        with pytest.raises(RuntimeError, match="Unsupported action"):
+            send_request({"action": "nope"}, p_sock)
+    finally:
+        send_request({"action": "shutdown"}, p_sock)
+        thread.join(5)
+
+    assert not thread.is_alive()
+    assert not os.path.exists(p_sock)
@@ -50,3 +50,16 @@ def test_layout_extra_forbidden():
         Section(title="abc", desc="xyz", contents=[], zzzzz=1)
 
     assert "extra fields not permitted" in str(exc_info.value)
+
+
+def test_construct_matches_validated():
+    from quartodoc.layout import Auto
+
+    kwargs = {"name": "a", "include_private": True}
+
+    validated = Auto(**kwargs)
+    constructed = Auto._construct(**kwargs)
+
+    assert constructed == validated
+    assert constructed.__fields_set__ == validated.__fields_set__
+    assert constructed._fields_specified == validated._fields_specified
@@ -0,0 +1,126 @@
+import json
+
+from quartodoc import Builder
+from quartodoc import layout as lo
+from quartodoc.profiling import Profiler, enable_profiling, profile_span
+
+
+def test_profile_span_disabled():
+    profiler = Profiler()
+
+    with profile_span("abc"):
+        pass
+
+    assert profiler.events == []
+
+
+def test_profile_span_nested():
+    with enable_profiling(Profiler()) as profiler:
+        with profile_span("outer"):
+            with profile_span("inner", cat="render"):
+                pass
+
+    inner, outer = profiler.events
+    assert inner["name"] == "inner"
+    assert outer["name"] == "outer"
+    assert outer["ts"] <= inner["ts"]
+    assert outer["dur"] >= inner["dur"]
+    assert profiler.slowest() == [inner]
+
+
+def test_profile_builder_build(tmp_path):
+    section = lo.Section(
+        title="abc",
+        contents=[lo.Auto(name="get_object"), lo.Auto(name="blueprint")],
+    )
+    builder = Builder(
+        package="quartodoc", sections=[section], dir=str(tmp_path / "reference")
+    )
+    builder.out_inventory = str(tmp_path / "objects.json")
+    builder.out_manifest = str(tmp_path / "manifest.json")
+
+    with enable_profiling(Profiler()) as profiler:
+        builder.build()
+
+    phases = profiler.phases()
+    for name in [
+        "griffe load",
+        "blueprint",
+        "collect",
+        "write_index",
+        "write_doc_pages",
+        "inventory",
+    ]:
+        assert name in phases
+
+    names = {(e["cat"], e["name"]) for e in profiler.slowest(100)}
+    assert ("blueprint", "quartodoc:get_object") in names
+    assert ("render", "get_object") in names
+
+    p_trace = tmp_path / "profile.json"
+    profiler.save(p_trace)
+    trace = json.loads(p_trace.read_text())
+    assert len(trace["traceEvents"]) == len(profiler.events)
+
+    assert "quartodoc:get_object" in profiler.summary()
+
+
+def _event(name, ts, dur, cat="phase", tid=1):
+    return {
+        "name": name,
+        "cat": cat,
+        "ph": "X",
+        "ts": ts,
+        "dur": dur,
+        "pid": 1,
+        "tid": tid,
+        "args": {"cpu_ms": dur / 1e3},
+    }
+
+
+def test_profiler_phases_nested():
+    profiler = Profiler()
+    profiler.extend(
+        [
+            _event("griffe load", 10, 20),
+            _event("griffe load", 40, 20),
+            _event("blueprint", 0, 100),
+            _event("griffe load", 100, 40),
+            # phases in other threads are nested if they're inside a phase
+            _event("griffe load", 200, 10, tid=2),
+            _event("collect", 150, 100),
+        ]
+    )
+
+    assert profiler.phases() == {
+        "blueprint": 100 / 1e6,
+        "griffe load": 90 / 1e6,
+        "collect": 100 / 1e6,
+    }
+    assert profiler.phases(nested=False) == {
+        "blueprint": 100 / 1e6,
+        "griffe load": 40 / 1e6,
+        "collect": 100 / 1e6,
+    }
+
+    # one row per phase, plus the total of phases that aren't nested
+    summary = profiler.summary().split("Slowest")[0]
+    rows = [line.split() for line in summary.splitlines()[2:] if line]
+    assert [row[0] for row in rows] == ["blueprint", "griffe", "collect", "total"]
+    assert rows[1][:4] == ["griffe", "load", "4", "0.1"]
+    assert rows[-1][1] == "0.2"
+
+
+def test_profiler_slowest_self_time():
+    profiler = Profiler()
+    profiler.extend(
+        [
+            _event("mod.f", 10, 10, cat="blueprint"),
+            _event("mod.g", 20, 30, cat="blueprint"),
+            _event("mod", 0, 60, cat="blueprint"),
+            _event("other", 100, 25, cat="blueprint"),
+        ]
+    )
+
+    assert [e["name"] for e in profiler.slowest()] == ["mod.g", "other", "mod", "mod.f"]
+    assert profiler.self_times() == [10 / 1e6, 30 / 1e6, 20 / 1e6, 25 / 1e6]